@@ -121,7 +121,7 @@ def get_cache_debug():
         "timestamp": current_time,
         "cache_content": cleaned_cache_content
     }
-    logger.debug(f"Returning cache debug data")
+    logger.debug("Returning cache debug data")
     return response_data
 
 # Endpoint to serve aggregated data directly (as requested by UX)
@@ -156,7 +156,7 @@ def get_app_details(app_id: str):
             # Raise the standard 404 exception
             raise HTTPException(status_code=404, detail=f"Details not found for application: {app_id}")
 
-        logger.debug(f"Returning details for appId: '{app_id}'")
+        logger.debug("Returning details for appId: '%s'", app_id)
         # Add timestamp to the successful response
         return {
             "timestamp": current_time,
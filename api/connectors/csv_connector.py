@@ -1,11 +1,27 @@
 from .base_connector import BaseConnector
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=32)
+def _read_csv_grouped(path: str, mtime_ns: int, size: int) -> Tuple[pd.DataFrame, Dict[Any, np.ndarray]]:
+    """
+    Reads a CSV once per (path, mtime, size) and groups its row positions by app_id.
+
+    The DataFrame is shared between callers and must not be modified; take
+    a subset with DataFrame.take() before changing it.
+    """
+    df = pd.read_csv(path)
+    logger.info(f"CSV Connector: Successfully read {path}")
+    indices = df.groupby('app_id', sort=False).indices if 'app_id' in df.columns else {}
+    return df, indices
+
 class CsvConnector(BaseConnector):
     """Connects to and fetches data from a local CSV file."""
 
@@ -24,15 +40,16 @@ class CsvConnector(BaseConnector):
             logger.error("CSV Connector: Missing 'file_path' parameter.")
             return None
 
-        absolute_file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', file_path)) # Assume relative to api dir
+        # Assume relative to api dir; resolved so every spelling of a file shares one cached parse
+        absolute_file_path = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', file_path))
 
         if not os.path.exists(absolute_file_path):
             logger.error(f"CSV Connector: File not found at {absolute_file_path}")
             return None
 
         try:
-            df = pd.read_csv(absolute_file_path)
-            logger.info(f"CSV Connector: Successfully read {absolute_file_path}")
+            stat = os.stat(absolute_file_path)
+            df, app_rows = _read_csv_grouped(absolute_file_path, stat.st_mtime_ns, stat.st_size)
 
             # --- Logic to find the specific app's latest data --- 
             # This replicates part of the logic from data_aggregator, 
@@ -42,7 +59,8 @@ class CsvConnector(BaseConnector):
                  return None
 
             if app_id_to_find:
-                app_df = df[df['app_id'] == app_id_to_find]
+                positions = app_rows.get(app_id_to_find)
+                app_df = df.take(positions) if positions is not None else df.iloc[:0]
                 if app_df.empty:
                     logger.warning(f"CSV Connector: No data found for app_id '{app_id_to_find}' in {absolute_file_path}")
                     return None
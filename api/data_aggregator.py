@@ -13,6 +13,7 @@ import logging
 import sys # Import sys for stdout
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List # Added List
 from rules_engine import load_rules, run_rules # Ensure rules engine imports are correct
 import psutil # Add this import
@@ -219,6 +220,37 @@ cache_metadata = {
 fallback_cache = {}
 _fallback_lock = threading.Lock()
 
+# Threads load_all_raw_data reads the provider CSVs on. Off (0) by default: turning
+# the parsed frames into row dicts holds the GIL, so with local files the pool is
+# slower than a serial loop. It only pays off when the files sit on slow storage.
+LOAD_WORKERS = 0
+
+
+def load_all_raw_data() -> Dict[str, Dict[str, Any]]:
+    """
+    Loads raw data for every configured provider, on LOAD_WORKERS threads if enabled.
+
+    Returns:
+        {provider_id: {app_id: row}} in PROVIDER_CONFIGS order, leaving out
+        providers whose data could not be loaded.
+    """
+    items = list(PROVIDER_CONFIGS.items())
+    if not items:
+        return {}
+    if LOAD_WORKERS > 1 and len(items) > 1:
+        with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(items)), thread_name_prefix='raw-data') as executor:
+            loaded = list(executor.map(lambda item: load_csv_data(item[0], item[1], API_DIR), items))
+    else:
+        loaded = [load_csv_data(provider_id, config, API_DIR) for provider_id, config in items]
+
+    raw_data: Dict[str, Dict[str, Any]] = {}
+    for (provider_id, _), raw_data_for_provider in zip(items, loaded):
+        if raw_data_for_provider:
+            raw_data[provider_id] = raw_data_for_provider
+        else:
+            logger.warning(f"No raw data loaded for provider: {provider_id}")
+    return raw_data
+
 # --- Core Logic ---
 
 # Old loading functions removed - using simple_data_loader.load_csv_data() instead
@@ -243,18 +275,9 @@ def update_cache():
         cache_metadata['update_count'] += 1
     logger.info("Scheduler executing update_cache function.") # Existing log
 
-    # Initialize cache structure for this run
-    current_raw_data: Dict[str, Dict[str, Any]] = {}
-
-    # Load Raw Data using simple CSV loader
+    # Load Raw Data using simple CSV loader, reading the provider files concurrently
     logger.info("Starting raw data loading...")
-    for provider_id, config in PROVIDER_CONFIGS.items():
-        raw_data_for_provider = load_csv_data(provider_id, config, API_DIR)
-        
-        if raw_data_for_provider:
-            current_raw_data[provider_id] = raw_data_for_provider
-        else:
-            logger.warning(f"No raw data loaded for provider: {provider_id}")
+    current_raw_data: Dict[str, Dict[str, Any]] = load_all_raw_data()
     logger.info(f"Raw data loading finished. Loaded data for {len(current_raw_data)} providers.")
     # logger.debug(f"Raw data content: {current_raw_data}") # Debug log for raw data
     logger.info(f"CACHE_TRACE: current_raw_data (first 500 chars): {str(current_raw_data)[:500]}")
@@ -380,7 +403,7 @@ def get_aggregated_data() -> Dict[str, Any]:
     # Return main cache data
     with _cache_lock:
         if data_cache:
-            logger.debug(f"CACHE_ACCESS: Returning main cache data with keys: {list(data_cache.keys())}")
+            logger.debug("CACHE_ACCESS: Returning main cache data with keys: %s", list(data_cache.keys()))
             return dict(data_cache)
         else:
             # Last resort: try fallback
@@ -401,7 +424,7 @@ def should_refresh_cache() -> bool:
         logger.info(f"CACHE_CHECK: Cache is {cache_age} old (threshold: {age_threshold}), triggering refresh")
         return True
     
-    logger.debug(f"CACHE_CHECK: Cache is {cache_age} old, no refresh needed")
+    logger.debug("CACHE_CHECK: Cache is %s old, no refresh needed", cache_age)
     return False
 
 def get_cache_health() -> Dict[str, Any]:
@@ -420,7 +443,7 @@ def get_application_details(app_id: str) -> Optional[Dict[str, Any]]:
     # Retrieves all available details for a specific application ID
     # from the cached raw data and provider results.
     # Handles URL-decoded app_id which might contain spaces.
-    logger.debug(f"Attempting to retrieve details for appId: '{app_id}'")
+    logger.debug("Attempting to retrieve details for appId: '%s'", app_id)
     details: Dict[str, Any] = {"appId": app_id, "raw_data": {}, "provider_results": {}}
     found = False
 
@@ -431,7 +454,7 @@ def get_application_details(app_id: str) -> Optional[Dict[str, Any]]:
                 if isinstance(provider_data, dict) and app_id in provider_data:
                     details["raw_data"][provider_name] = provider_data[app_id]
                     found = True
-                    logger.debug(f"Found raw data for '{app_id}' in provider '{provider_name}'")
+                    logger.debug("Found raw data for '%s' in provider '%s'", app_id, provider_name)
 
         # Check provider_results from rules engine
         if "provider_results" in data_cache:
@@ -439,7 +462,7 @@ def get_application_details(app_id: str) -> Optional[Dict[str, Any]]:
                 if isinstance(provider_results_data, dict) and app_id in provider_results_data:
                     details["provider_results"][provider_name] = provider_results_data[app_id]
                     found = True
-                    logger.debug(f"Found provider results for '{app_id}' in provider '{provider_name}'")
+                    logger.debug("Found provider results for '%s' in provider '%s'", app_id, provider_name)
 
     if found:
         logger.info(f"Successfully retrieved details for appId: '{app_id}'")
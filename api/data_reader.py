@@ -10,7 +10,7 @@ def get_application_details(app_id: str) -> Optional[Dict[str, Any]]:
     # Retrieves all available details for a specific application ID
     # by fetching the cache data internally.
     # Handles URL-decoded app_id which might contain spaces.
-    logger.debug(f"DataReader: Attempting to retrieve details for appId: '{app_id}'")
+    logger.debug("DataReader: Attempting to retrieve details for appId: '%s'", app_id)
 
     # Fetch cache data inside the function
     cache_data = get_aggregated_data()
@@ -28,7 +28,7 @@ def get_application_details(app_id: str) -> Optional[Dict[str, Any]]:
             if isinstance(provider_data, dict) and app_id in provider_data:
                 details["raw_data"][provider_name] = provider_data[app_id]
                 found_raw = True
-                logger.debug(f"DataReader: Found raw data for '{app_id}' in provider '{provider_name}'")
+                logger.debug("DataReader: Found raw data for '%s' in provider '%s'", app_id, provider_name)
 
 
     # Check rule_results from cache
@@ -40,7 +40,7 @@ def get_application_details(app_id: str) -> Optional[Dict[str, Any]]:
                  found_rules = True
         if found_rules:
             details["rule_results"] = app_rule_results
-            logger.debug(f"DataReader: Found rule results for '{app_id}'")
+            logger.debug("DataReader: Found rule results for '%s'", app_id)
 
 
     if found_raw or found_rules:
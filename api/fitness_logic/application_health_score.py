@@ -5,34 +5,41 @@ Calculates overall health score based on multiple factors across different provi
 This demonstrates how to use the CacheAccessor for cross-provider analysis.
 """
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import logging
+import numpy as np
+from data_aggregator import get_aggregated_data
 from .base import BaseFitnessFunction
 from .cache_accessor import CacheAccessor
 
 logger = logging.getLogger(__name__)
 
+# Score thresholds for np.digitize: 0=critical (<50), 1=needs_attention, 2=good, 3=excellent (>=85)
+_CATEGORY_BINS = np.array([50.0, 70.0, 85.0])
+
+# Score normalizer indexed by the number of available factors: factors * sum of the first `factors` weights
+_NORMALIZERS = tuple(factors * sum([0.3, 0.3, 0.25, 0.15][:factors]) for factors in range(5))
+
 
 class ApplicationHealthScoreFitnessFunction(BaseFitnessFunction):
     """Calculates application health scores based on multiple metrics."""
     
-    @staticmethod
-    def get_metadata() -> Dict[str, str]:
+    METADATA = MappingProxyType({
+        "id": "application_health_score",
+        "name": "Application Health Score",
+        "description": "Overall health score based on quality, operations, and cost efficiency",
+        "rule_id": "cross_provider_health"  # Virtual rule ID since we're accessing raw data
+    })
+    
+    @classmethod
+    def get_metadata(cls) -> Mapping[str, str]:
         """Returns metadata about this fitness function."""
-        return {
-            "id": "application_health_score",
-            "name": "Application Health Score",
-            "description": "Overall health score based on quality, operations, and cost efficiency",
-            "rule_id": "cross_provider_health"  # Virtual rule ID since we're accessing raw data
-        }
+        return cls.METADATA
     
     @staticmethod
     def calculate(rule_results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Calculate health scores across applications."""
-        # Get the full cache data which includes raw_data
-        # In a real implementation, this would be passed in or injected
-        from data_aggregator import get_aggregated_data
-        
         try:
             cache_data = get_aggregated_data()
             accessor = CacheAccessor(cache_data)
@@ -40,11 +47,9 @@ class ApplicationHealthScoreFitnessFunction(BaseFitnessFunction):
             logger.error(f"Failed to get cache data: {e}")
             return None
         
-        # Categories for health scores
-        excellent = []
-        good = []
-        needs_attention = []
-        critical = []
+        # Scored apps and their overall scores, categorized in bulk after the loop
+        scored_ids = []
+        scores = []
         
         # Detailed breakdown for each app
         app_scores = {}
@@ -69,35 +74,39 @@ class ApplicationHealthScoreFitnessFunction(BaseFitnessFunction):
             factors = 0
             score_breakdown = {}
             
+            # Single lookup per metric; None means the metric is absent
+            maintainability = quality.get('MaintainabilityIndex')
+            uptime = ops.get('UptimePercent')
+            vuln_count = security.get('VulnerabilityCount')
+            monthly_cost = cost.get('MonthlyCost')
+            
             # Quality factor (30% weight)
-            if 'MaintainabilityIndex' in quality:
-                quality_score = float(quality['MaintainabilityIndex'])
+            if maintainability is not None:
+                quality_score = float(maintainability)
                 health_score += quality_score * 0.3
                 score_breakdown['quality'] = quality_score
                 factors += 1
             
             # Operations factor (30% weight)
-            if 'UptimePercent' in ops:
-                ops_score = float(ops.get('UptimePercent', 0))
+            if uptime is not None:
+                ops_score = float(uptime)
                 health_score += ops_score * 0.3
                 score_breakdown['operations'] = ops_score
                 factors += 1
             
             # Security factor (25% weight)
-            if 'VulnerabilityCount' in security:
+            if vuln_count is not None:
                 # Inverse relationship - fewer vulnerabilities is better
-                vuln_count = int(security.get('VulnerabilityCount', 0))
-                security_score = max(0, 100 - (vuln_count * 10))  # -10 points per vulnerability
+                security_score = max(0, 100 - (int(vuln_count) * 10))  # -10 points per vulnerability
                 health_score += security_score * 0.25
                 score_breakdown['security'] = security_score
                 factors += 1
             
             # Cost efficiency factor (15% weight)
-            if 'MonthlyCost' in cost:
+            if monthly_cost is not None:
                 # Inverse relationship - lower cost is better
                 # Normalize cost (assume $100k is max expected)
-                monthly_cost = float(cost.get('MonthlyCost', 0))
-                cost_score = max(0, 100 - (monthly_cost / 1000))
+                cost_score = max(0, 100 - (float(monthly_cost) / 1000))
                 health_score += cost_score * 0.15
                 score_breakdown['cost_efficiency'] = cost_score
                 factors += 1
@@ -107,7 +116,7 @@ class ApplicationHealthScoreFitnessFunction(BaseFitnessFunction):
                 continue
             
             # Normalize score based on available factors
-            health_score = health_score / (factors * sum([0.3, 0.3, 0.25, 0.15][:factors]))
+            health_score = health_score / _NORMALIZERS[factors]
             
             # Store detailed score
             app_scores[app_id] = {
@@ -116,33 +125,39 @@ class ApplicationHealthScoreFitnessFunction(BaseFitnessFunction):
                 'factors_available': factors
             }
             
-            # Categorize
-            if health_score >= 85:
-                excellent.append(app_id)
-            elif health_score >= 70:
-                good.append(app_id)
-            elif health_score >= 50:
-                needs_attention.append(app_id)
-            else:
-                critical.append(app_id)
-        
-        # Calculate totals
-        total = len(excellent) + len(good) + len(needs_attention) + len(critical)
-        passing = len(excellent) + len(good)
-        warning = len(needs_attention)
-        failing = len(critical)
+            scored_ids.append(app_id)
+            scores.append(health_score)
         
-        if total == 0:
+        if not scored_ids:
             logger.warning("No applications found with sufficient data for health score calculation")
             return None
         
+        # Categorize all apps at once; NaN scores fail every threshold, so they are critical
+        score_array = np.asarray(scores, dtype=np.float64)
+        categories = np.digitize(score_array, _CATEGORY_BINS)
+        categories[np.isnan(score_array)] = 0
+        critical_count, warning, good_count, excellent_count = (
+            int(count) for count in np.bincount(categories, minlength=4)
+        )
+        
+        # Calculate totals
+        total = len(scored_ids)
+        passing = excellent_count + good_count
+        failing = critical_count
+        
+        # Category lists are only needed for the response payload
+        id_array = np.asarray(scored_ids, dtype=object)
+        excellent, good, needs_attention, critical = (
+            id_array[categories == code].tolist() for code in (3, 2, 1, 0)
+        )
+        
         passing_percentage = round((passing / total * 100), 2)
         
         # Get additional statistics using CacheAccessor
         avg_test_coverage = accessor.aggregate_field('code_quality_v1', 'TestCoverage', 'avg')
         total_monthly_cost = accessor.aggregate_field('cost_optimization_v1', 'MonthlyCost', 'sum')
         
-        metadata = ApplicationHealthScoreFitnessFunction.get_metadata()
+        metadata = ApplicationHealthScoreFitnessFunction.METADATA
         
         return {
             "id": "application_health_score",
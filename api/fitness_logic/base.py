@@ -5,19 +5,22 @@ Abstract base class for all fitness functions to ensure consistent interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 
 
 class BaseFitnessFunction(ABC):
     """Abstract base class for fitness functions."""
     
-    @staticmethod
+    @classmethod
     @abstractmethod
-    def get_metadata() -> Dict[str, str]:
+    def get_metadata(cls) -> Mapping[str, str]:
         """
         Returns metadata about this fitness function.
         
-        Should return a dictionary with:
+        Implementations return a read-only ``METADATA`` class attribute
+        built once at import time rather than a fresh dict per call.
+        
+        Should return a mapping with:
         - id: Unique identifier for the fitness function
         - name: Display name
         - description: Detailed description
@@ -5,11 +5,32 @@ Provides a convenient interface for accessing data from the cache using a simple
 Supports accessing both raw_data and rule_results with easy iteration over applications.
 """
 
-from typing import Dict, Any, Optional, List, Set, Union
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple, Union
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing "field not found" from a stored None
+_MISSING = object()
+
+
+def _is_float(value: Any) -> bool:
+    """Return True if float() accepts the value."""
+    try:
+        float(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+@lru_cache(maxsize=1024)
+def _split_path(field_path: str) -> Tuple[str, ...]:
+    """Split a dot-notation field path, memoized since callers reuse a few constant paths."""
+    return tuple(field_path.split('.'))
+
 
 class CacheAccessor:
     """Helper class for accessing cache data with convenient notation."""
@@ -24,6 +45,17 @@ class CacheAccessor:
         self.cache_data = cache_data
         self.raw_data = cache_data.get('raw_data', {})
         self.rule_results = cache_data.get('rule_results', {})
+        
+        # App IDs are fixed for the lifetime of the accessor, so compute the union once
+        self._all_app_ids: FrozenSet[str] = frozenset().union(
+            *(provider_data.keys() for provider_data in self.raw_data.values() if isinstance(provider_data, dict))
+        )
+        
+        # Resolved get_field_value lookups keyed on (app_id, field_path)
+        self._field_cache: Dict[Tuple[str, str], Any] = {}
+        
+        # Numeric values of a provider's field for aggregate_field, keyed on (provider, field)
+        self._field_arrays: Dict[Tuple[str, str], np.ndarray] = {}
     
     def get_provider_data(self, provider_name: str) -> Dict[str, Any]:
         """
@@ -59,18 +91,14 @@ class CacheAccessor:
                     app_data[provider] = provider_data[app_id]
             return app_data
     
-    def get_all_app_ids(self) -> Set[str]:
+    def get_all_app_ids(self) -> FrozenSet[str]:
         """
         Get all unique application IDs across all providers.
         
         Returns:
-            Set of all application IDs
+            Frozen set of all application IDs (computed once at construction)
         """
-        app_ids = set()
-        for provider_data in self.raw_data.values():
-            if isinstance(provider_data, dict):
-                app_ids.update(provider_data.keys())
-        return app_ids
+        return self._all_app_ids
     
     def get_field_value(self, app_id: str, field_path: str, default: Any = None) -> Any:
         """
@@ -87,30 +115,36 @@ class CacheAccessor:
         Example:
             value = accessor.get_field_value('MyApp', 'code_quality_v1.TestCoverage', 0)
         """
-        parts = field_path.split('.')
+        key = (app_id, field_path)
+        try:
+            value = self._field_cache[key]
+        except KeyError:
+            value = self._field_cache[key] = self._resolve_field(app_id, _split_path(field_path))
+        return default if value is _MISSING else value
+    
+    def _resolve_field(self, app_id: str, parts: Tuple[str, ...]) -> Any:
+        """Walk raw_data for a pre-split field path, returning _MISSING if not found."""
         if len(parts) < 2:
-            return default
+            return _MISSING
             
-        provider = parts[0]
-        field_name = parts[1] if len(parts) > 1 else None
-        
         # Get provider data
-        provider_data = self.raw_data.get(provider, {})
+        provider_data = self.raw_data.get(parts[0], {})
         if not isinstance(provider_data, dict):
-            return default
+            return _MISSING
             
         # Get app data
         app_data = provider_data.get(app_id, {})
         if not isinstance(app_data, dict):
-            return default
+            return _MISSING
             
         # Navigate to the field
         current = app_data
         for part in parts[1:]:
-            if isinstance(current, dict):
-                current = current.get(part, default)
-            else:
-                return default
+            if not isinstance(current, dict):
+                return _MISSING
+            current = current.get(part, _MISSING)
+            if current is _MISSING:
+                return _MISSING
                 
         return current
     
@@ -132,20 +166,17 @@ class CacheAccessor:
         if isinstance(providers, str):
             providers = [providers]
             
-        result = {}
-        app_ids = self.get_all_app_ids()
+        # Resolve each provider once rather than once per app
+        provider_tables = [(provider, self.get_provider_data(provider)) for provider in providers]
         
-        for app_id in app_ids:
-            app_data = {}
-            has_data = False
-            
-            for provider in providers:
-                provider_data = self.get_provider_data(provider)
-                if app_id in provider_data:
-                    app_data[provider] = provider_data[app_id]
-                    has_data = True
-            
-            if has_data:
+        result = {}
+        for app_id in self._all_app_ids:
+            app_data = {
+                provider: provider_data[app_id]
+                for provider, provider_data in provider_tables
+                if app_id in provider_data
+            }
+            if app_data:
                 result[app_id] = app_data
                 
         return result
@@ -192,6 +223,38 @@ class CacheAccessor:
                 
         return counts
     
+    def count_by_bins(self, provider: str, field: str, bins: List[float], labels: List[str]) -> Dict[str, int]:
+        """
+        Count applications by numeric thresholds on a specific field.
+        
+        The vectorized equivalent of count_by_condition for the common
+        `'low' if x < a else 'medium' if x < b else 'high'` pattern: a value
+        falls in labels[i] when bins[i-1] <= value < bins[i].
+        
+        Args:
+            provider: Provider name
+            field: Field name
+            bins: Increasing thresholds
+            labels: Category names, one more than there are thresholds
+            
+        Returns:
+            Dictionary with category counts (categories with no applications are omitted)
+            
+        Example:
+            counts = accessor.count_by_bins(
+                'cost_optimization_v1',
+                'MonthlyCost',
+                bins=[10000, 50000],
+                labels=['low', 'medium', 'high']
+            )
+        """
+        if len(labels) != len(bins) + 1:
+            raise ValueError(f"Expected {len(bins) + 1} labels for {len(bins)} bins, got {len(labels)}")
+        
+        values = self._field_array(provider, field)
+        counts = np.bincount(np.digitize(values, bins), minlength=len(labels))
+        return {label: count for label, count in zip(labels, counts.tolist()) if count}
+    
     def aggregate_field(self, provider: str, field: str, operation: str = 'sum') -> float:
         """
         Aggregate a numeric field across all applications.
@@ -199,32 +262,53 @@ class CacheAccessor:
         Args:
             provider: Provider name
             field: Field name
-            operation: 'sum', 'avg', 'min', 'max'
+            operation: 'sum', 'avg', 'min', 'max', or 'count' (of the numeric values)
             
         Returns:
             Aggregated value
         """
-        values = []
-        provider_data = self.get_provider_data(provider)
-        
-        for app_data in provider_data.values():
-            if isinstance(app_data, dict) and field in app_data:
-                try:
-                    value = float(app_data[field])
-                    values.append(value)
-                except (ValueError, TypeError):
-                    continue
+        values = self._field_array(provider, field)
         
-        if not values:
+        if operation == 'count':
+            return float(values.size)
+        if values.size == 0:
             return 0.0
             
         if operation == 'sum':
-            return sum(values)
+            return float(values.sum())
         elif operation == 'avg':
-            return sum(values) / len(values)
+            return float(values.mean())
         elif operation == 'min':
-            return min(values)
+            return float(values.min())
         elif operation == 'max':
-            return max(values)
+            return float(values.max())
         else:
-            raise ValueError(f"Unknown operation: {operation}")
\ No newline at end of file
+            raise ValueError(f"Unknown operation: {operation}")
+    
+    def _field_array(self, provider: str, field: str) -> np.ndarray:
+        """
+        The field's numeric values across the provider's applications as a float64
+        array, built once per accessor: callers usually aggregate a field several ways.
+        """
+        key = (provider, field)
+        values = self._field_arrays.get(key)
+        if values is not None:
+            return values
+        
+        provider_data = self.get_provider_data(provider)
+        raw = [
+            value for value in (
+                app_data.get(field) for app_data in provider_data.values() if isinstance(app_data, dict)
+            ) if value is not None
+        ]
+        
+        try:
+            values = np.asarray(raw, dtype=np.float64)
+        except (ValueError, TypeError):
+            # Mixed data with non-numeric entries: drop what float() can't parse
+            values = np.asarray([v for v in raw if _is_float(v)], dtype=np.float64)
+        
+        # Shared between calls, so keep callers from changing it in place
+        values.flags.writeable = False
+        self._field_arrays[key] = values
+        return values
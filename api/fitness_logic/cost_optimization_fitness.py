@@ -5,8 +5,11 @@ Analyzes cost optimization across applications using the CacheAccessor.
 This demonstrates a simpler single-provider fitness function.
 """
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import logging
+import numpy as np
+from data_aggregator import get_aggregated_data
 from .base import BaseFitnessFunction
 from .cache_accessor import CacheAccessor
 
@@ -16,22 +19,21 @@ logger = logging.getLogger(__name__)
 class CostOptimizationFitnessFunction(BaseFitnessFunction):
     """Analyzes cost optimization opportunities across applications."""
     
-    @staticmethod
-    def get_metadata() -> Dict[str, str]:
+    METADATA = MappingProxyType({
+        "id": "cost_optimization",
+        "name": "Cost Optimization Opportunities",
+        "description": "Identifies applications with potential cost optimization opportunities",
+        "rule_id": "cost_analysis"
+    })
+    
+    @classmethod
+    def get_metadata(cls) -> Mapping[str, str]:
         """Returns metadata about this fitness function."""
-        return {
-            "id": "cost_optimization",
-            "name": "Cost Optimization Opportunities",
-            "description": "Identifies applications with potential cost optimization opportunities",
-            "rule_id": "cost_analysis"
-        }
+        return cls.METADATA
     
     @staticmethod
     def calculate(rule_results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Calculate cost optimization metrics."""
-        # Get cache data
-        from data_aggregator import get_aggregated_data
-        
         try:
             cache_data = get_aggregated_data()
             accessor = CacheAccessor(cache_data)
@@ -51,42 +53,63 @@ class CostOptimizationFitnessFunction(BaseFitnessFunction):
             logger.warning("No cost optimization data available")
             return None
         
-        # Analyze each application
+        # Gather each application's inputs; efficiency and categories are computed in bulk below
+        app_ids = []
+        monthly_costs = []
+        response_times = []
+        uptimes = []
         for app_id, app_cost_data in cost_data.items():
             if not isinstance(app_cost_data, dict):
                 continue
                 
-            monthly_cost = float(app_cost_data.get('MonthlyCost', 0))
+            app_ids.append(app_id)
+            monthly_costs.append(float(app_cost_data.get('MonthlyCost', 0)))
             
             # Get performance metrics to calculate cost efficiency
-            response_time = accessor.get_field_value(
+            response_times.append(accessor.get_field_value(
                 app_id, 
                 'cost_optimization_v1.AvgResponseTime',
                 1000  # Default to 1000ms if not found
-            )
+            ))
             
             # Get additional context from other providers
-            uptime = accessor.get_field_value(
+            uptimes.append(accessor.get_field_value(
                 app_id,
                 'operational_excellence_v1.UptimePercent',
                 99.0
+            ))
+        
+        costs = np.asarray(monthly_costs, dtype=np.float64)
+        response_time = np.asarray(response_times, dtype=np.float64)
+        uptime = np.asarray(uptimes, dtype=np.float64)
+        
+        # Calculate cost efficiency scores
+        # Lower cost and better performance = higher score; no positive response time scores 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            efficiency = np.where(
+                response_time > 0,
+                (1000 / response_time) * (10000 / (costs + 1)) * (uptime / 100),
+                0.0
             )
-            
-            # Calculate cost efficiency score
-            # Lower cost and better performance = higher score
-            if response_time > 0:
-                cost_efficiency = (1000 / response_time) * (10000 / (monthly_cost + 1)) * (uptime / 100)
-            else:
-                cost_efficiency = 0
-            
-            # Categorize based on absolute cost and efficiency
-            if monthly_cost < 10000 and cost_efficiency > 50:
+        
+        # Categorize based on absolute cost and efficiency: 0=optimized, 1=acceptable, 2=needs review
+        categories = np.select(
+            [(costs < 10000) & (efficiency > 50), (costs < 50000) & (efficiency > 10)],
+            [0, 1],
+            default=2
+        )
+        
+        # Build the per-app entries from plain Python values so the payload stays JSON-friendly
+        for app_id, monthly_cost, cost_efficiency, category in zip(
+            app_ids, monthly_costs, efficiency.tolist(), categories.tolist()
+        ):
+            if category == 0:
                 optimized.append({
                     'app_id': app_id,
                     'monthly_cost': monthly_cost,
                     'cost_efficiency_score': round(cost_efficiency, 2)
                 })
-            elif monthly_cost < 50000 and cost_efficiency > 10:
+            elif category == 1:
                 acceptable.append({
                     'app_id': app_id,
                     'monthly_cost': monthly_cost,
@@ -106,15 +129,11 @@ class CostOptimizationFitnessFunction(BaseFitnessFunction):
         max_monthly_cost = accessor.aggregate_field('cost_optimization_v1', 'MonthlyCost', 'max')
         
         # Count by cost ranges
-        cost_ranges = accessor.count_by_condition(
+        cost_ranges = accessor.count_by_bins(
             'cost_optimization_v1',
             'MonthlyCost',
-            lambda cost: (
-                'low' if cost < 10000 else
-                'medium' if cost < 50000 else
-                'high' if cost < 100000 else
-                'very_high'
-            )
+            bins=[10000, 50000, 100000],
+            labels=['low', 'medium', 'high', 'very_high']
         )
         
         # Calculate totals
@@ -128,7 +147,7 @@ class CostOptimizationFitnessFunction(BaseFitnessFunction):
             
         passing_percentage = round((passing / total * 100), 2)
         
-        metadata = CostOptimizationFitnessFunction.get_metadata()
+        metadata = CostOptimizationFitnessFunction.METADATA
         
         return {
             "id": "cost_optimization",
@@ -5,22 +5,25 @@ This fitness function evaluates applications for governance approval path
 based on security, quality, and operational metrics.
 """
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from .base import BaseFitnessFunction
 
 
 class GovernancePathFitnessFunction(BaseFitnessFunction):
     """Processes governance path decision rule results into fitness metrics."""
     
-    @staticmethod
-    def get_metadata() -> Dict[str, str]:
+    METADATA = MappingProxyType({
+        "id": "governance_path_compliance",
+        "name": "Governance Path Compliance",
+        "description": "Evaluates applications for governance approval path based on security, quality, and operational metrics",
+        "rule_id": "governance_path_decision"
+    })
+    
+    @classmethod
+    def get_metadata(cls) -> Mapping[str, str]:
         """Returns metadata about this fitness function."""
-        return {
-            "id": "governance_path_compliance",
-            "name": "Governance Path Compliance",
-            "description": "Evaluates applications for governance approval path based on security, quality, and operational metrics",
-            "rule_id": "governance_path_decision"
-        }
+        return cls.METADATA
     
     @staticmethod
     def calculate(rule_results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -56,7 +59,7 @@ class GovernancePathFitnessFunction(BaseFitnessFunction):
         total = passing + warning + failing
         passing_percentage = (passing / total * 100) if total > 0 else 0
         
-        metadata = GovernancePathFitnessFunction.get_metadata()
+        metadata = GovernancePathFitnessFunction.METADATA
         
         return {
             "id": "1",  # For GraphQL compatibility
@@ -5,7 +5,7 @@ Central registry for all fitness functions. This allows easy addition
 of new fitness functions and provides a single place to get all available functions.
 """
 
-from typing import List, Type, Dict, Any
+from typing import List, Tuple, Type, Dict, Any
 from .base import BaseFitnessFunction
 from .governance_path import GovernancePathFitnessFunction
 from .technical_debt import TechnicalDebtFitnessFunction
@@ -16,16 +16,19 @@ from .cost_optimization_fitness import CostOptimizationFitnessFunction
 class FitnessFunctionRegistry:
     """Registry for all available fitness functions."""
     
-    # List of all registered fitness function classes
-    _functions: List[Type[BaseFitnessFunction]] = [
+    # Immutable tuple of all registered fitness function classes; rebuilt on register
+    _functions: Tuple[Type[BaseFitnessFunction], ...] = (
         GovernancePathFitnessFunction,
         TechnicalDebtFitnessFunction,
         ApplicationHealthScoreFitnessFunction,
         CostOptimizationFitnessFunction,
-    ]
+    )
+    
+    # GraphQL IDs ("1", "2", ...) matching _functions positions
+    _id_strings: Tuple[str, ...] = tuple(str(i) for i in range(1, len(_functions) + 1))
     
     @classmethod
-    def get_all_functions(cls) -> List[Type[BaseFitnessFunction]]:
+    def get_all_functions(cls) -> Tuple[Type[BaseFitnessFunction], ...]:
         """Get all registered fitness function classes."""
         return cls._functions
     
@@ -33,7 +36,8 @@ class FitnessFunctionRegistry:
     def register_function(cls, function_class: Type[BaseFitnessFunction]) -> None:
         """Register a new fitness function class."""
         if function_class not in cls._functions:
-            cls._functions.append(function_class)
+            cls._functions = cls._functions + (function_class,)
+            cls._id_strings = tuple(str(i) for i in range(1, len(cls._functions) + 1))
     
     @classmethod
     def calculate_all(cls, rule_results: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -48,11 +52,11 @@ class FitnessFunctionRegistry:
         """
         results = []
         
-        for i, function_class in enumerate(cls._functions, 1):
+        for id_str, function_class in zip(cls._id_strings, cls._functions):
             result = function_class.calculate(rule_results)
             if result:
                 # Ensure unique ID for GraphQL
-                result["id"] = str(i)
+                result["id"] = id_str
                 results.append(result)
                 
         return results
\ No newline at end of file
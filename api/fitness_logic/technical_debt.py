@@ -5,22 +5,26 @@ This fitness function prioritizes applications for technical debt reduction
 based on code quality, sustainability, and operational impact.
 """
 
-from typing import Dict, Any, Optional
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from .base import BaseFitnessFunction
 
 
 class TechnicalDebtFitnessFunction(BaseFitnessFunction):
     """Processes technical debt priority rule results into fitness metrics."""
     
-    @staticmethod
-    def get_metadata() -> Dict[str, str]:
+    METADATA = MappingProxyType({
+        "id": "technical_debt_management",
+        "name": "Technical Debt Management",
+        "description": "Prioritizes applications for technical debt reduction based on code quality, sustainability, and operational impact",
+        "rule_id": "tech_debt_priority"
+    })
+    
+    @classmethod
+    def get_metadata(cls) -> Mapping[str, str]:
         """Returns metadata about this fitness function."""
-        return {
-            "id": "technical_debt_management",
-            "name": "Technical Debt Management",
-            "description": "Prioritizes applications for technical debt reduction based on code quality, sustainability, and operational impact",
-            "rule_id": "tech_debt_priority"
-        }
+        return cls.METADATA
     
     @staticmethod
     def calculate(rule_results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -39,26 +43,17 @@ class TechnicalDebtFitnessFunction(BaseFitnessFunction):
             
         tech_debt_data = rule_results['tech_debt_priority']
         
-        # Count applications by priority
-        passing = 0  # Low Priority
-        warning = 0  # Medium Priority
-        failing = 0  # High Priority
-        
-        for app_id, priority in tech_debt_data.items():
-            if isinstance(priority, str):
-                if 'Low Priority' in priority:
-                    passing += 1
-                elif 'Medium Priority' in priority:
-                    warning += 1
-                elif 'High Priority' in priority:
-                    failing += 1
+        # Count applications by priority. Rule results always start with the
+        # priority label, so its first three characters identify the bucket.
+        counts = Counter(priority[:3] for priority in tech_debt_data.values() if isinstance(priority, str))
+        passing, warning, failing = counts.get('Low', 0), counts.get('Med', 0), counts.get('Hig', 0)
         
         total = passing + warning + failing
         passing_percentage = (passing / total * 100) if total > 0 else 0
         
-        metadata = TechnicalDebtFitnessFunction.get_metadata()
+        metadata = TechnicalDebtFitnessFunction.METADATA
         
-        return {
+        result = {
             "id": "2",  # For GraphQL compatibility
             "name": metadata["name"],
             "description": metadata["description"],
@@ -68,5 +63,8 @@ class TechnicalDebtFitnessFunction(BaseFitnessFunction):
             "failing_count": failing,
             "total_count": total,
             "passing_percentage": passing_percentage,
+            # The rule results themselves rather than a copy
             "application_breakdown": tech_debt_data if isinstance(tech_debt_data, dict) else {}
-        }
\ No newline at end of file
+        }
+        
+        return result
\ No newline at end of file
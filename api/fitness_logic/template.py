@@ -4,7 +4,8 @@
 {description}
 """
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from .base import BaseFitnessFunction
 from .cache_accessor import CacheAccessor
 
@@ -12,15 +13,17 @@ from .cache_accessor import CacheAccessor
 class {class_name}(BaseFitnessFunction):
     """{description}"""
     
-    @staticmethod
-    def get_metadata() -> Dict[str, str]:
+    METADATA = MappingProxyType({{
+        "id": "{id}",
+        "name": "{name}",
+        "description": "{description}",
+        "rule_id": "{rule_id}"
+    }})
+    
+    @classmethod
+    def get_metadata(cls) -> Mapping[str, str]:
         """Returns metadata about this fitness function."""
-        return {
-            "id": "{id}",
-            "name": "{name}",
-            "description": "{description}",
-            "rule_id": "{rule_id}"
-        }
+        return cls.METADATA
     
     @staticmethod
     def calculate(rule_results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -40,7 +43,7 @@ class {class_name}(BaseFitnessFunction):
         passing = 0
         warning = 0
         failing = 0
-        application_breakdown = {}
+        application_breakdown = {{}}
         
         # Example: Iterate through a specific data feed
         # Replace 'data_feed_id' with actual feed ID from data dictionary
@@ -67,9 +70,9 @@ class {class_name}(BaseFitnessFunction):
             
         passing_percentage = (passing / total * 100) if total > 0 else 0
         
-        metadata = {class_name}.get_metadata()
+        metadata = {class_name}.METADATA
         
-        return {
+        return {{
             "id": "1",  # For GraphQL compatibility
             "name": metadata["name"],
             "description": metadata["description"],
@@ -80,4 +83,4 @@ class {class_name}(BaseFitnessFunction):
             "total_count": total,
             "passing_percentage": passing_percentage,
             "application_breakdown": application_breakdown
-        }
\ No newline at end of file
+        }}
\ No newline at end of file
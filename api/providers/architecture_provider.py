@@ -1,14 +1,34 @@
-from .base_provider import BaseFitnessProvider, Status
+from .base_provider import BaseFitnessProvider
 from typing import Dict, Any, Optional
 import logging
-import os
-import csv
 
 logger = logging.getLogger(__name__)
 
+# Pattern adherence levels (lower-cased) that raise a warning
+_LOW_ADHERENCE = frozenset({'low'})
+
 class ArchitectureProvider(BaseFitnessProvider):
     """Provides fitness data related to architecture compliance based on CSV data."""
 
+    RULES = (
+        ('architecture_compliance', '<', 75, 'critical', "Architecture compliance is critical: {v}%"),
+        ('architecture_compliance', 'between', (75, 85), 'warning', "Architecture compliance needs improvement: {v}%"),
+        ('modernization_score', '<', 65, 'warning', "Modernization score is low: {v}/100"),
+        ('pattern_adherence', 'lower in', _LOW_ADHERENCE, 'warning', "Low pattern adherence identified"),
+        ('technical_debt', '>', 30, 'warning', "High technical debt score: {v}"),
+    )
+
+    # The mock CSV identifies apps by an 'app_id' column and may hold several timestamped rows per app
+    csv_key_column = 'app_id'
+    csv_latest_row = True
+
+    METRIC_FIELDS = (
+        ('architecture_compliance', 'ArchitectureCompliance', 'float', 0),
+        ('modernization_score', 'ModernizationScore', 'float', 0),
+        ('pattern_adherence', 'PatternAdherence', 'text', 'medium'),
+        ('technical_debt', 'TechnicalDebt', 'float', 0),
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes the provider. Config is currently unused as we read directly from mock.
@@ -22,68 +42,28 @@ class ArchitectureProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "architecture_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns architecture compliance metrics read directly from the mock CSV file."""
         app_id = app_config.get('app_id')
         if not app_id:
             logger.warning(f"[{self.provider_id}] app_id missing in app_config. Cannot fetch specific data.")
             return {"status": "unknown", "details": {"error": "app_id missing."}}
         
-        # Read data directly from the mock CSV file
+        # Look up the app's latest row in the parsed (and cached) mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            # Use CSV connector to fetch data for this app
-            connector = self.get_connector()
-            if not connector:
-                logger.error(f"[{self.provider_id}] Failed to create connector.")
-                return {"status": "unknown", "details": {"error": "Failed to create connector."}}
-            
-            raw_data = connector.fetch_data(app_config)
+            raw_data = self._lookup_latest_row(app_id)
             if not raw_data:
                 logger.warning(f"[{self.provider_id}] No data found for app {app_id}")
                 return {"status": "unknown", "details": {"error": f"No data found for app {app_id}"}}
             
             # Extract important metrics
-            architecture_compliance = float(raw_data.get('ArchitectureCompliance', 0))
-            modernization_score = float(raw_data.get('ModernizationScore', 0))
-            pattern_adherence = raw_data.get('PatternAdherence', 'medium')
-            technical_debt = float(raw_data.get('TechnicalDebt', 0))
+            metrics = self._extract_metrics(raw_data)
             
             # Determine status based on the metrics
-            status: Status = 'healthy'
-            warnings = []
-            
-            if architecture_compliance < 75:
-                status = 'critical'
-                warnings.append(f"Architecture compliance is critical: {architecture_compliance}%")
-            elif architecture_compliance < 85:
-                status = 'warning'
-                warnings.append(f"Architecture compliance needs improvement: {architecture_compliance}%")
-                
-            if modernization_score < 65:
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append(f"Modernization score is low: {modernization_score}/100")
-            
-            if pattern_adherence.lower() == 'low':
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append("Low pattern adherence identified")
-            
-            if technical_debt > 30:
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append(f"High technical debt score: {technical_debt}")
-            
-            details = {
-                "architecture_compliance": architecture_compliance,
-                "modernization_score": modernization_score,
-                "pattern_adherence": pattern_adherence,
-                "technical_debt": technical_debt,
-                "warnings": warnings
-            }
+            status, details = self._evaluate_metrics(metrics)
             
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
+            logger.info("[%s] Processed mock data for app: %s, Status: %s", self.provider_id, app_id, status)
             return {
                 "status": status,
                 "details": details
@@ -1,17 +1,451 @@
 # c:\git\FitnessFunctions\api\providers\base_provider.py
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Literal
+from collections import namedtuple
+from functools import lru_cache, wraps
+from typing import Callable, Dict, Any, List, Literal, Optional, Sequence, Tuple
 import os
+import csv
 import configparser
 import logging
+import operator
+import sqlite3
+import string
+import threading
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 Status = Literal['healthy', 'warning', 'critical', 'unknown']
 
+# The api directory, which holds settings.ini and the relative CSV paths configured in it
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SETTINGS_PATH = os.path.join(_BASE_DIR, 'settings.ini')
+
+# A threshold check: (field, op, threshold, severity, message).
+# severity is 'critical', 'warning' or 'info' (adds the message without affecting status);
+# message is a format string receiving the field value as {v} (or another value by its
+# details key, e.g. {tech_debt_ratio}), or None to only affect status.
+Rule = Tuple[str, str, Any, str, Optional[str]]
+
+# A value computed from a provider's metrics for its rules to check: (details_key, compute, shown).
+# compute receives the metrics (and earlier derived values) by details_key, as scalars or
+# as NumPy arrays, and must work on both; shown values follow the metrics in details.
+DerivedField = Tuple[str, Callable[[Dict[str, Any]], Any], bool]
+
+# Comparison operators usable in rule tables. Each works on scalars and NumPy arrays alike;
+# 'between' takes a (low, high) threshold and matches low <= v < high, and 'lower in'
+# matches text whose lower-cased value is among lower-case options.
+_RULE_OPS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    'in': lambda v, options: np.isin(v, list(options)) if isinstance(v, np.ndarray) else v in options,
+    'between': lambda v, bounds: (bounds[0] <= v) & (v < bounds[1]),
+    'lower in': lambda v, options: (
+        np.fromiter((isinstance(text, str) and text.lower() in options for text in v), dtype=bool, count=len(v))
+        if isinstance(v, np.ndarray) else v.lower() in options),
+}
+
+_SEVERITY_RANK = {'info': 0, 'warning': 1, 'critical': 2}
+_RANKED_STATUSES = ('healthy', 'warning', 'critical')
+_RANKED_STATUS_ARRAY = np.array(_RANKED_STATUSES, dtype=object)
+
+# Strings int()/float() accept in the common case. Anything else takes the per-app
+# path in bulk evaluation, so its conversion errors are reproduced exactly.
+_NUMBER_PATTERNS = {
+    'int': r'\s*[+-]?\d{1,18}\s*',
+    'float': r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*',
+}
+_NUMBER_TYPES = {'int': (int, np.int64), 'float': (float, np.float64)}
+
+# A metric read from a CSV row: (details_key, column, kind, default)
+MetricField = Tuple[str, str, str, Any]
+
+
+@lru_cache(maxsize=None)
+def _metrics_type(fields: Tuple[MetricField, ...]) -> type:
+    """Returns the namedtuple type holding a provider's metrics, one per schema."""
+    return namedtuple('Metrics', [key for key, _, _, _ in fields])
+
+
+@lru_cache(maxsize=None)
+def _message_key(message: str) -> str:
+    """The name a rule message formats its value under: 'v' or another value's details key."""
+    names = {name for _, name, _, _ in string.Formatter().parse(message) if name}
+    return names.pop() if len(names) == 1 else 'v'
+
+
+def _derive(values: Dict[str, Any], derived: Sequence[DerivedField]) -> Dict[str, Any]:
+    """
+    Adds derived values to values, a provider's metrics by details_key. Shown ones
+    are added to values itself; the returned dict, which the rules are evaluated
+    on, holds them all.
+    """
+    checked = values
+    for key, compute, shown in derived:
+        if not shown and checked is values:
+            checked = dict(values)
+        checked[key] = value = compute(checked)
+        if shown:
+            values[key] = value
+    return checked
+
+
+def _format_matches(message: str, values: np.ndarray, name: str = 'v') -> List[str]:
+    """
+    Formats a rule message for each matched value (as {name}), once per distinct value.
+
+    Numeric values are grouped by their bit pattern, so values that compare
+    equal but print differently (0.0 and -0.0) are still formatted apart.
+    Other dtypes are formatted one by one.
+    """
+    if values.dtype.kind not in 'iuf' or len(values) < 2:
+        return [message.format(**{name: value}) for value in values.tolist()]
+    bits = values.view(np.dtype(f'u{values.dtype.itemsize}'))
+    _, first, inverse = np.unique(bits, return_index=True, return_inverse=True)
+    texts = [message.format(**{name: value}) for value in values[first].tolist()]
+    return [texts[i] for i in inverse.tolist()]
+
+
+class _CsvRow(dict):
+    """
+    A parsed CSV row: a DictReader-shaped dict that also keeps its cells by position.
+
+    Rows sharing a file share one header tuple, so metrics can be read by
+    column index (see _positional_reader) instead of by name.
+    """
+    __slots__ = ('cells', 'header')
+
+
+@lru_cache(maxsize=None)
+def _field_converters(fields: Tuple[MetricField, ...]) -> Tuple[Optional[Callable[[Any], Any]], ...]:
+    """Returns int/float for each numeric field of a schema and None for 'text' fields."""
+    return tuple(None if kind == 'text' else _NUMBER_TYPES[kind][0] for _, _, kind, _ in fields)
+
+
+@lru_cache(maxsize=64)
+def _positional_reader(fields: Tuple[MetricField, ...], header: Tuple[str, ...]) -> Callable[[List[str]], tuple]:
+    """
+    Compiles a schema against a CSV header into a function reading its raw cells by column index.
+
+    Column positions are resolved once per (schema, header) rather than
+    looked up by name for every row. A repeated header name resolves to its
+    last column, and cells missing from a short row read as None, as they do
+    through csv.DictReader.
+    """
+    positions = {column: i for i, column in enumerate(header)}
+    plan = [(positions.get(column), default) for _, column, _, default in fields]
+
+    def read(cells: List[str]) -> tuple:
+        width = len(cells)
+        return tuple(
+            default if position is None else cells[position] if position < width else None
+            for position, default in plan
+        )
+    return read
+
+
+def _read_cells(raw_data: Dict[str, Any], fields: Tuple[MetricField, ...]) -> tuple:
+    """
+    Returns the unconverted values of a schema's columns from one CSV row.
+
+    Missing columns take the field default. Rows from the in-memory CSV
+    index are read by column position.
+    """
+    if type(raw_data) is _CsvRow:
+        return _positional_reader(fields, raw_data.header)(raw_data.cells)
+    return tuple(raw_data.get(column, default) for _, column, _, default in fields)
+
+
+def _convert(cells: tuple, fields: Tuple[MetricField, ...]) -> tuple:
+    """
+    Converts raw cell values into a namedtuple keyed by details_key.
+
+    'int' and 'float' fields are converted with int()/float() in field order,
+    so the first bad value raises ValueError as the old inline conversions
+    did; 'text' fields are returned as read.
+    """
+    return _metrics_type(fields)._make([
+        value if convert is None else convert(value)
+        for convert, value in zip(_field_converters(fields), cells)
+    ])
+
+
+def _extract(raw_data: Dict[str, Any], fields: Tuple[MetricField, ...]) -> tuple:
+    """Reads a provider's metrics from one CSV row into a namedtuple keyed by details_key."""
+    return _convert(_read_cells(raw_data, fields), fields)
+
+
+@lru_cache(maxsize=2048)
+def _evaluate_cells(fields: Tuple[MetricField, ...], rules: Tuple[Rule, ...], critical_after: Optional[int],
+                    derived: Tuple[DerivedField, ...], cells: tuple) -> Tuple[Status, tuple, Tuple[str, ...]]:
+    """
+    Converts one row's raw cells and evaluates the rule table on them, memoized.
+
+    The result depends only on the raw cell strings, so apps sharing the same
+    metric values are converted and evaluated once. Keying on the strings
+    rather than the converted numbers keeps results exact: '1' and '1.0', or
+    '0' and '-0', format differently in warnings. Conversion errors are
+    raised, not cached.
+
+    Returns:
+        (status, details, warnings), with details as (key, value) pairs and
+        warnings as a tuple so the cached value cannot be mutated by callers.
+    """
+    details = _convert(cells, fields)._asdict()
+    status, warnings = BaseFitnessProvider.evaluate_rules(_derive(details, derived), rules, critical_after=critical_after)
+    return status, tuple(details.items()), tuple(warnings)
+
+
+@lru_cache(maxsize=1)
+def _load_settings(path: str, mtime_ns: int) -> configparser.ConfigParser:
+    """
+    Parses settings.ini once per modification time.
+
+    Every provider reads its CSV path from the same file on construction, so
+    they share one parsed ConfigParser until the file changes. Callers must
+    treat the returned parser as read-only.
+    """
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config
+
+
+@lru_cache(maxsize=32)
+def _load_csv(path: str, mtime_ns: int, size: int, key_column: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parses a provider CSV once into {key: row}.
+
+    Cached on (path, mtime, size) so every provider instance reading the same
+    file shares one parsed index, and an edited file is re-read automatically.
+    The first row for a key wins, matching the old linear scan.
+
+    Rows are read with csv.reader and the key is taken by column position, so
+    only the first row for each key is turned into a dict. Rows are shaped as
+    csv.DictReader would shape them (short rows padded with None, extra
+    values under the None key) and also keep their cells for positional reads.
+    """
+    index: Dict[str, Dict[str, str]] = {}
+    with open(path, mode='r', encoding='utf-8', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return index
+        width = len(header)
+        header_cells = tuple(header)
+        key_i = {column: i for i, column in enumerate(header)}.get(key_column)
+        for row in reader:
+            if not row:
+                continue  # DictReader skips blank lines
+            key = row[key_i] if key_i is not None and key_i < len(row) else None
+            if key in index:
+                continue
+            record = _CsvRow(zip(header, row))
+            record.cells = row
+            record.header = header_cells
+            if len(row) > width:
+                record[None] = row[width:]
+            elif len(row) < width:
+                for column in header[len(row):]:
+                    record[column] = None
+            index[key] = record
+    logger.debug("Parsed %s rows from %s", len(index), path)
+    return index
+
+
+def load_csv_indexed(path: str, key_column: str = 'ApplicationName') -> Dict[str, Dict[str, str]]:
+    """
+    Returns a provider CSV as {key: row}, parsing it only when the file has changed.
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist.
+    """
+    stat = os.stat(path)
+    return _load_csv(path, stat.st_mtime_ns, stat.st_size, key_column)
+
+
+@lru_cache(maxsize=32)
+def _load_dataframe(path: str, mtime_ns: int, size: int, key_column: str) -> pd.DataFrame:
+    """
+    Parses a provider CSV with pandas' C parser into a DataFrame indexed by key_column.
+
+    Cells are kept as strings so bulk callers can validate them with the same
+    rules as the per-row int()/float() conversions. Duplicate keys keep their
+    first row, matching _load_csv.
+    """
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8')
+    df = df.drop_duplicates(subset=key_column, keep='first').set_index(key_column)
+    logger.debug("Loaded DataFrame with %s rows from %s", len(df), path)
+    return df
+
+
+# SQLite point-lookup indexes, keyed on CSV path: {path: (mtime_ns, size, connection)}
+_sqlite_conns: Dict[str, Tuple[int, int, sqlite3.Connection]] = {}
+_sqlite_lock = threading.RLock()
+
+# Stay under SQLite's default bound-parameter limit for IN (...) queries
+_SQLITE_MAX_PARAMS = 900
+
+
+@lru_cache(maxsize=32)
+def _load_indexed_df(path: str, mtime_ns: int, size: int, key_column: str) -> pd.DataFrame:
+    """
+    Loads a timestamped CSV into a DataFrame of each app's latest row, indexed by key_column.
+
+    Mirrors CsvConnector.fetch_data: the row with the greatest parseable
+    timestamp wins (the first one on ties), and an app falls back to its last
+    row when the file has no timestamp column or none of its timestamps parse.
+    The timestamp column is parsed once for the whole file; only if that
+    fails is each app parsed on its own, as the connector does.
+    """
+    df = pd.read_csv(path)
+    if key_column not in df.columns:
+        logger.error(f"CSV file {path} missing '{key_column}' column.")
+        return pd.DataFrame()
+
+    groups = df.groupby(key_column, sort=False).indices
+    latest = {key: positions[-1] for key, positions in groups.items()}
+    if 'timestamp' in df.columns:
+        try:
+            parsed = pd.to_datetime(df['timestamp'])
+        except Exception:
+            parsed = None
+        if parsed is not None:
+            candidates = pd.DataFrame({'key': df[key_column], 'ts': parsed, 'pos': np.arange(len(df))})
+            candidates = candidates[candidates['ts'].notna() & candidates['key'].notna()]
+            best = candidates.sort_values(['ts', 'pos'], ascending=[False, True], kind='mergesort')
+            best = best.drop_duplicates('key', keep='first')
+            latest.update(zip(best['key'], best['pos'].tolist()))
+        else:
+            for key, positions in groups.items():
+                try:
+                    app_timestamps = pd.to_datetime(df['timestamp'].take(positions))
+                    latest[key] = df.index.get_loc(app_timestamps.idxmax())
+                except Exception:
+                    pass  # Keep the app's last row
+
+    result = df.take(list(latest.values())).set_index(key_column, drop=False)
+    logger.debug("Loaded latest rows for %s apps from %s", len(result), path)
+    return result
+
+
+def _build_sqlite_index(path: str, mtime_ns: int, size: int, key_column: str) -> sqlite3.Connection:
+    """
+    Opens (or rebuilds) the SQLite index stored next to a provider CSV.
+
+    The CSV is loaded into a 'rows' table with a unique index on key_column.
+    A '_source' table records the CSV's mtime and size so a stale index is
+    rebuilt; if the sidecar file cannot be written an in-memory database is
+    used instead. The first row for a key wins, matching _load_csv.
+    """
+    conn = None
+    try:
+        conn = sqlite3.connect(f"{path}.sqlite", check_same_thread=False)
+        source = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='_source'").fetchone()
+        if source and conn.execute("SELECT mtime_ns, size FROM _source").fetchone() == (mtime_ns, size):
+            return conn
+        _fill_sqlite_index(conn, path, mtime_ns, size, key_column)
+    except sqlite3.Error as e:
+        # e.g. a read-only directory, or a stale sidecar that cannot be rewritten
+        logger.warning(f"Cannot use SQLite index file for {path}: {e}, falling back to an in-memory index")
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        _fill_sqlite_index(conn, path, mtime_ns, size, key_column)
+    logger.debug("Built SQLite index for %s", path)
+    return conn
+
+
+def _fill_sqlite_index(conn: sqlite3.Connection, path: str, mtime_ns: int, size: int, key_column: str) -> None:
+    """(Re)creates the 'rows' and '_source' tables of a SQLite index from the CSV at path."""
+    with open(path, mode='r', encoding='utf-8', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        # Values are picked by position; a repeated header name takes its last column, as in DictReader
+        positions = {column: i for i, column in enumerate(header)}
+        columns = list(dict.fromkeys(header + [key_column]))
+        picks = [positions.get(column) for column in columns]
+        quoted = ', '.join('"' + column.replace('"', '""') + '"' for column in columns)
+        quoted_key = '"' + key_column.replace('"', '""') + '"'
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS rows")
+            conn.execute("DROP TABLE IF EXISTS _source")
+            conn.execute(f"CREATE TABLE rows ({quoted})")
+            conn.execute(f"CREATE UNIQUE INDEX idx_app_id ON rows ({quoted_key})")
+            conn.executemany(
+                f"INSERT OR IGNORE INTO rows ({quoted}) VALUES ({', '.join('?' * len(columns))})",
+                ([row[i] if i is not None and i < len(row) else None for i in picks] for row in reader if row),
+            )
+            conn.execute("CREATE TABLE _source (mtime_ns INTEGER, size INTEGER)")
+            conn.execute("INSERT INTO _source VALUES (?, ?)", (mtime_ns, size))
+
+
+def memoize_by_mtime(path_getter: Callable[[Any], str]):
+    """
+    Memoizes a provider method's result per app_id until its data file changes.
+
+    path_getter(self) names the file; the whole cache is dropped when its
+    mtime or size differs from when the cache was filled. 'unknown' results
+    (missing file, bad data) are not cached so they are retried. Hits and
+    misses are counted on the instance for cache_stats().
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+            app_id = app_config.get('app_id')
+            try:
+                stat = os.stat(path_getter(self))
+                stamp = (stat.st_mtime_ns, stat.st_size)
+            except (AttributeError, OSError):
+                stamp = None
+            if self._result_cache is None or stamp != self._result_cache_stamp:
+                self._result_cache = {}
+                self._result_cache_stamp = stamp
+
+            cached = self._result_cache.get(app_id)
+            if cached is not None:
+                self._cache_hits += 1
+                logger.debug("[%s] Cache hit for app: %s", self.provider_id, app_id)
+                return cached
+
+            self._cache_misses += 1
+            result = method(self, app_config)
+            if app_id and result.get('status') != 'unknown':
+                self._result_cache[app_id] = result
+            return result
+        return wrapper
+    return decorator
+
+
 class BaseFitnessProvider(ABC):
     """Abstract base class for all fitness function providers."""
 
+    # Column holding the application identifier in the provider's CSV
+    csv_key_column: str = 'ApplicationName'
+    # Whether the CSV holds timestamped rows and each app is read from its latest one
+    # (_lookup_latest_row) rather than its first (_lookup_row)
+    csv_latest_row: bool = False
+
+    # Per-instance result cache state, created lazily since subclasses set up their own __init__
+    _result_cache: Optional[Dict[str, Dict[str, Any]]] = None
+    _result_cache_stamp: Optional[Tuple[int, int]] = None
+    _cache_hits: int = 0
+    _cache_misses: int = 0
+
+    # Providers describe their metrics as ((details_key, column, kind, default), ...), kind
+    # being 'int', 'float' or 'text', and read them with _extract. Declaring METRIC_FIELDS and
+    # RULES gives a provider a vectorized get_fitness_data_bulk, and _row_to_status (first
+    # rows) or _evaluate_metrics (latest rows) for single apps; details hold these metrics,
+    # the shown DERIVED_FIELDS, then the rule warnings.
+    METRIC_FIELDS: Tuple[MetricField, ...] = ()
+    RULES: Tuple[Rule, ...] = ()
+    DERIVED_FIELDS: Tuple[DerivedField, ...] = ()
+    # More than this many warnings makes an app critical (None to disable)
+    CRITICAL_AFTER: Optional[int] = None
+
     @property
     @abstractmethod
     def provider_id(self) -> str:
@@ -22,23 +456,29 @@ class BaseFitnessProvider(ABC):
         """
         Get the CSV file path for this provider from settings.ini.
 
+        The resolved path is remembered on the instance, so repeated calls
+        do not touch settings.ini again.
+
         Returns:
             The full path to the CSV file.
         """
+        csv_path = getattr(self, '_csv_path', None)
+        if csv_path is not None:
+            return csv_path
+
         # Default path in case settings are missing or invalid
         default_file_path = f"data_mock\\{self.provider_id}.csv"
         file_path = default_file_path # Initialize with default
 
         # Read settings.ini file
-        config = configparser.ConfigParser()
-        settings_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'settings.ini')
+        settings_path = _SETTINGS_PATH
 
         if not os.path.exists(settings_path):
             logger.warning(f"Settings file not found at {settings_path}, using default CSV path: {default_file_path}")
             # Keep the initialized default_file_path
         else:
             try:
-                config.read(settings_path)
+                config = _load_settings(settings_path, os.stat(settings_path).st_mtime_ns)
 
                 # Get provider name without version suffix for settings lookup
                 provider_base_name = self.provider_id.split('_v')[0] if '_v' in self.provider_id else self.provider_id
@@ -54,15 +494,125 @@ class BaseFitnessProvider(ABC):
                 logger.error(f"Error reading settings file: {e}, using default CSV path: {default_file_path}")
                 # Keep the initialized default_file_path in case of error
 
-        # Build the full path to the CSV file
-        base_dir = os.path.dirname(os.path.dirname(__file__))  # Points to api directory
-        return os.path.join(base_dir, file_path)
+        # Build the full path to the CSV file. The parsed-file caches are keyed on
+        # this path, so canonicalize it: providers reaching the same file through
+        # different spellings (separators, '..', symlinks) then share one parse.
+        self._csv_path = os.path.realpath(os.path.join(_BASE_DIR, file_path))
+        return self._csv_path
 
-    @abstractmethod
+    def _load_index(self) -> Dict[str, Dict[str, str]]:
+        """
+        Returns the parsed CSV as {app_id: row}, re-parsing only when the file changes.
+
+        Raises:
+            FileNotFoundError: If the mock CSV file does not exist.
+        """
+        return load_csv_indexed(self.mock_file_path, self.csv_key_column)
+
+    def _uses_sqlite(self) -> bool:
+        """Whether this provider was configured with {'index_backend': 'sqlite'}."""
+        return getattr(self, 'config', None) is not None and self.config.get('index_backend') == 'sqlite'
+
+    def _get_sqlite_conn(self) -> sqlite3.Connection:
+        """
+        Returns the SQLite index for the provider CSV, rebuilding it when the file changes.
+
+        Raises:
+            FileNotFoundError: If the mock CSV file does not exist.
+        """
+        stat = os.stat(self.mock_file_path)
+        cached = _sqlite_conns.get(self.mock_file_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        with _sqlite_lock:
+            cached = _sqlite_conns.get(self.mock_file_path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+            conn = _build_sqlite_index(self.mock_file_path, stat.st_mtime_ns, stat.st_size, self.csv_key_column)
+            _sqlite_conns[self.mock_file_path] = (stat.st_mtime_ns, stat.st_size, conn)
+            if cached is not None:
+                cached[2].close()
+            return conn
+
+    def _lookup_latest_row(self, app_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the latest CSV row for app_id from the cached latest-row DataFrame.
+
+        Returns None if the file or the app is missing, like CsvConnector.fetch_data.
+        """
+        try:
+            stat = os.stat(self.mock_file_path)
+        except FileNotFoundError:
+            logger.error(f"[{self.provider_id}] Mock data file not found: {self.mock_file_path}")
+            return None
+        df = _load_indexed_df(self.mock_file_path, stat.st_mtime_ns, stat.st_size, self.csv_key_column)
+        if app_id not in df.index:
+            return None
+        return df.loc[app_id].to_dict()
+
+    def _lookup_row(self, app_id: str) -> Optional[Dict[str, str]]:
+        """
+        Returns the CSV row for app_id, or None if the app is not in the file.
+
+        Uses the in-memory index by default, or point queries against the
+        SQLite index when the provider is configured with index_backend='sqlite'.
+
+        Raises:
+            FileNotFoundError: If the mock CSV file does not exist.
+        """
+        if not self._uses_sqlite():
+            return self._load_index().get(app_id)
+        return self._lookup_rows([app_id]).get(app_id)
+
+    def _lookup_rows(self, app_ids: Sequence[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Returns {app_id: row} for the requested apps that are present in the CSV.
+
+        With the SQLite backend this runs one WHERE ... IN (...) query per
+        batch of ids instead of a query per app.
+
+        Raises:
+            FileNotFoundError: If the mock CSV file does not exist.
+        """
+        if not self._uses_sqlite():
+            index = self._load_index()
+            return {app_id: index[app_id] for app_id in app_ids if app_id in index}
+
+        quoted_key = '"' + self.csv_key_column.replace('"', '""') + '"'
+        unique_ids = list(dict.fromkeys(app_ids))
+        rows: Dict[str, Dict[str, str]] = {}
+        with _sqlite_lock:
+            # Fetched under the lock so a rebuild cannot close it mid-query
+            conn = self._get_sqlite_conn()
+            for start in range(0, len(unique_ids), _SQLITE_MAX_PARAMS):
+                batch = unique_ids[start:start + _SQLITE_MAX_PARAMS]
+                cursor = conn.execute(
+                    f"SELECT * FROM rows WHERE {quoted_key} IN ({', '.join('?' * len(batch))})", batch)
+                columns = [description[0] for description in cursor.description]
+                for values in cursor:
+                    row = dict(zip(columns, values))
+                    rows[row[self.csv_key_column]] = row
+        return rows
+
+    def load_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the provider CSV as a DataFrame indexed by csv_key_column, for bulk evaluation.
+
+        Raises:
+            FileNotFoundError: If the mock CSV file does not exist.
+        """
+        stat = os.stat(self.mock_file_path)
+        return _load_dataframe(self.mock_file_path, stat.st_mtime_ns, stat.st_size, self.csv_key_column)
+
+    @memoize_by_mtime(lambda self: self.mock_file_path)
     def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Fetches or calculates fitness data for a specific application.
 
+        Results are memoized per app_id and reused until the provider CSV
+        changes or invalidate() is called. Cached results are shared between
+        callers and must not be mutated.
+
         Args:
             app_config: A dictionary containing application-specific configuration
                         needed by the provider (e.g., repo URL, API endpoint, file path).
@@ -74,5 +624,312 @@ class BaseFitnessProvider(ABC):
                 "details": { ... } # A dictionary with specific metrics/details
             }
         """
+        return self._get_fitness_data_uncached(app_config)
+
+    @abstractmethod
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Computes fitness data for a specific application, bypassing the result cache.
+
+        Providers implement this; callers use get_fitness_data.
+        """
         pass
 
+    def invalidate(self, app_id: Optional[str] = None) -> None:
+        """
+        Drops memoized results for one app, or for all apps when app_id is None.
+        """
+        if self._result_cache is None:
+            return
+        if app_id is None:
+            logger.info(f"[{self.provider_id}] Clearing result cache: {self.cache_stats()}")
+            self._result_cache.clear()
+        else:
+            self._result_cache.pop(app_id, None)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Returns result cache hits, misses and hit ratio h / (h + m)."""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_ratio": self._cache_hits / lookups if lookups else 0.0,
+        }
+
+    def get_fitness_data_bulk(self, app_configs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches fitness data for many applications in one call.
+
+        Providers declaring METRIC_FIELDS and RULES are evaluated column-wise over the
+        cached DataFrame (see _get_fitness_data_bulk_vectorized). Otherwise
+        each app is evaluated against the cached CSV index, so the file is
+        parsed at most once per call.
+
+        Args:
+            app_configs: Application configurations, each with an 'app_id'.
+
+        Returns:
+            A dictionary of {app_id: result}, where each result has the same
+            shape as get_fitness_data's return value.
+        """
+        if self.METRIC_FIELDS and self.RULES:
+            return self._get_fitness_data_bulk_vectorized(app_configs)
+        return {app_config.get('app_id'): self.get_fitness_data(app_config) for app_config in app_configs}
+
+    def _extract_metrics(self, raw_data: Dict[str, Any]) -> tuple:
+        """
+        Reads this provider's METRIC_FIELDS from one CSV row into a namedtuple.
+
+        Raises:
+            ValueError: If a numeric field holds a value int()/float() rejects.
+        """
+        return _extract(raw_data, self.METRIC_FIELDS)
+
+    def _row_to_status(self, app_id: str, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Computes status and details from one CSV row using METRIC_FIELDS and RULES.
+
+        Shared by the single and bulk paths of rule-table providers. Rows with
+        identical metric cells share one memoized evaluation (_evaluate_cells).
+        """
+        try:
+            status, items, warnings = _evaluate_cells(
+                self.METRIC_FIELDS, self.RULES, self.CRITICAL_AFTER, self.DERIVED_FIELDS,
+                _read_cells(raw_data, self.METRIC_FIELDS))
+            details: Dict[str, Any] = dict(items)
+            details["warnings"] = list(warnings)
+            logger.info("[%s] Processed mock data for app: %s, Status: %s", self.provider_id, app_id, status)
+            return {
+                "status": status,
+                "details": details
+            }
+        except ValueError as e:
+            logger.error(f"[{self.provider_id}] Error converting data types for app {app_id}: {e}. Data: {raw_data}", exc_info=True)
+            return {"status": "unknown", "details": {"error": f"Error processing data types: {e}"}}
+        except Exception as e:
+            logger.error(f"[{self.provider_id}] Error processing raw data for app {app_id}: {e}. Data: {raw_data}", exc_info=True)
+            return {"status": "unknown", "details": {"error": f"Error processing data: {e}"}}
+
+    def _evaluate_metrics(self, metrics: tuple) -> Tuple[Status, Dict[str, Any]]:
+        """
+        Evaluates RULES on one app's metrics, as read by _extract_metrics, for
+        providers reading latest rows. Returns (status, details).
+        """
+        details: Dict[str, Any] = metrics._asdict()
+        status, details["warnings"] = self.evaluate_rules(
+            _derive(details, self.DERIVED_FIELDS), self.RULES, critical_after=self.CRITICAL_AFTER)
+        return status, details
+
+    def _get_fitness_data_bulk_vectorized(self, app_configs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluates METRIC_FIELDS and RULES for many apps at once, keyed by app_id.
+
+        Columns are converted and the rule table evaluated with NumPy over the
+        cached DataFrame (the latest-row one for csv_latest_row providers)
+        instead of one Python evaluation per app. Rows holding values
+        int()/float() might treat differently go through _row_to_status or
+        get_fitness_data, and so do missing apps, so results match the per-app
+        path exactly. With the SQLite backend rows are fetched with batched IN
+        queries and evaluated one by one.
+        """
+        unique_ids = list(dict.fromkeys(app_config.get('app_id') for app_config in app_configs))
+        if self.csv_latest_row:
+            return self._get_latest_rows_bulk(unique_ids)
+        try:
+            if self._uses_sqlite():
+                rows = self._lookup_rows([app_id for app_id in unique_ids if app_id])
+                return {
+                    app_id: self._row_to_status(app_id, rows[app_id]) if app_id in rows
+                    else self.get_fitness_data({'app_id': app_id})
+                    for app_id in unique_ids
+                }
+            df = self.load_dataframe()
+            index = self._load_index()
+        except FileNotFoundError:
+            df = None
+        except Exception as e:
+            logger.error(f"[{self.provider_id}] Error loading bulk data from {self.mock_file_path}: {e}", exc_info=True)
+            df = None
+        if df is None or not unique_ids:
+            return {app_id: self.get_fitness_data({'app_id': app_id}) for app_id in unique_ids}
+
+        rows = df.reindex(unique_ids)
+        valid = pd.Series(unique_ids).isin(df.index).to_numpy()
+        values: Dict[str, np.ndarray] = {}
+        for key, column, kind, default in self.METRIC_FIELDS:
+            dtype = _NUMBER_TYPES[kind][1]
+            if column not in rows.columns:
+                values[key] = np.full(len(rows), default, dtype=dtype)  # Missing column uses the default
+                continue
+            ok = rows[column].str.fullmatch(_NUMBER_PATTERNS[kind], na=False).to_numpy()
+            valid &= ok
+            # Object-to-number astype converts with int()/float() themselves, so values match exactly
+            values[key] = rows[column].where(ok, '0').to_numpy(dtype=object).astype(dtype)
+
+        def per_app(app_id: str) -> Dict[str, Any]:
+            raw_data = index.get(app_id) if app_id else None
+            if raw_data is None:
+                return self.get_fitness_data({'app_id': app_id})
+            return self._row_to_status(app_id, raw_data)
+        return self._bulk_results(unique_ids, valid, values, per_app)
+
+    def _get_latest_rows_bulk(self, app_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        _get_fitness_data_bulk_vectorized for csv_latest_row providers, over the
+        typed columns of the cached latest-row DataFrame. Rows whose typed values
+        the per-app conversion might treat differently go through get_fitness_data.
+        """
+        loaded = self._latest_rows_for(app_ids) if all(app_ids) else None
+        if loaded is None:
+            return {app_id: self.get_fitness_data({'app_id': app_id}) for app_id in app_ids}
+        rows, valid = loaded
+
+        values: Dict[str, np.ndarray] = {}
+        for key, column, kind, default in self.METRIC_FIELDS:
+            if kind == 'text':
+                values[key], ok = self._bulk_text(rows, column, default)
+            else:
+                values[key], ok = self._bulk_number(rows, column, kind, default)
+            valid = valid & ok
+        return self._bulk_results(app_ids, valid, values, lambda app_id: self.get_fitness_data({'app_id': app_id}))
+
+    def _bulk_results(self, app_ids: List[str], valid: np.ndarray, values: Dict[str, np.ndarray],
+                      per_app: Callable[[str], Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluates RULES over metric columns aligned with app_ids and builds the
+        bulk results; apps not marked valid get per_app(app_id) instead.
+        """
+        statuses, warnings = self.evaluate_rules_bulk(
+            _derive(values, self.DERIVED_FIELDS), self.RULES, critical_after=self.CRITICAL_AFTER)
+
+        columns = [(key, column_values.tolist()) for key, column_values in values.items()]
+        results: Dict[str, Dict[str, Any]] = {}
+        for i, app_id in enumerate(app_ids):
+            if not valid[i]:
+                results[app_id] = per_app(app_id)
+                continue
+            details: Dict[str, Any] = {key: column_values[i] for key, column_values in columns}
+            details["warnings"] = warnings[i]
+            results[app_id] = {
+                "status": statuses[i],
+                "details": details
+            }
+        logger.info(f"[{self.provider_id}] Processed bulk mock data for {len(results)} apps")
+        return results
+
+    def _latest_rows_for(self, app_ids: List[str]) -> Optional[Tuple[pd.DataFrame, np.ndarray]]:
+        """
+        Returns (rows, present) from the cached latest-row DataFrame for a bulk call.
+
+        rows has one row per app_id (all-NaN for apps not in the file) and present
+        marks the apps that were found. Returns None if the file cannot be read.
+        """
+        try:
+            stat = os.stat(self.mock_file_path)
+            df = _load_indexed_df(self.mock_file_path, stat.st_mtime_ns, stat.st_size, self.csv_key_column)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"[{self.provider_id}] Error loading bulk data from {self.mock_file_path}: {e}", exc_info=True)
+            return None
+        return df.reindex(app_ids), pd.Series(app_ids).isin(df.index).to_numpy()
+
+    @staticmethod
+    def _bulk_number(rows: pd.DataFrame, column: str, kind: str, default: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts a typed DataFrame column the way float()/int() convert each value.
+
+        Returns (values, ok), where ok marks rows whose vectorized value matches
+        the scalar conversion. Non-numeric columns and NaN integers are left
+        to the per-app path.
+        """
+        size = len(rows)
+        dtype = _NUMBER_TYPES[kind][1]
+        if column not in rows.columns:
+            return np.full(size, _NUMBER_TYPES[kind][0](default), dtype=dtype), np.ones(size, dtype=bool)
+        series = rows[column]
+        if not pd.api.types.is_numeric_dtype(series):
+            return np.zeros(size, dtype=dtype), np.zeros(size, dtype=bool)
+        if kind == 'int' and pd.api.types.is_integer_dtype(series):
+            return series.to_numpy(dtype=np.int64), np.ones(size, dtype=bool)
+        values = series.to_numpy(dtype=np.float64)
+        if kind == 'float':
+            return values, np.ones(size, dtype=bool)
+        ok = np.isfinite(values) & (np.abs(values) < 2.0 ** 63)
+        return np.trunc(np.where(ok, values, 0)).astype(np.int64), ok
+
+    @staticmethod
+    def _bulk_text(rows: pd.DataFrame, column: str, default: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (values, ok) for a text column, ok marking rows that hold strings."""
+        size = len(rows)
+        if column not in rows.columns:
+            return np.full(size, default, dtype=object), np.ones(size, dtype=bool)
+        values = rows[column].to_numpy(dtype=object)
+        return values, np.fromiter((isinstance(value, str) for value in values), dtype=bool, count=size)
+
+    @staticmethod
+    def evaluate_rules(values: Dict[str, Any], rules: Sequence[Rule],
+                       critical_after: Optional[int] = None) -> Tuple[Status, List[str]]:
+        """
+        Evaluates a rule table against one app's metric values.
+
+        Args:
+            values: The app's metrics, keyed by the field names used in the rules.
+            rules: The provider's rule table, evaluated in order.
+            critical_after: If set, more than this many warning messages makes the app critical.
+
+        Returns:
+            A (status, warnings) tuple, where status is the highest severity matched.
+        """
+        rank = 0
+        warnings: List[str] = []
+        for field, op, threshold, severity, message in rules:
+            value = values[field]
+            if _RULE_OPS[op](value, threshold):
+                rank = max(rank, _SEVERITY_RANK[severity])
+                if message is not None:
+                    name = _message_key(message)
+                    warnings.append(message.format(**{name: value if name == 'v' else values[name]}))
+        if critical_after is not None and len(warnings) > critical_after:
+            rank = 2
+        return _RANKED_STATUSES[rank], warnings
+
+    @staticmethod
+    def evaluate_rules_bulk(columns: Dict[str, np.ndarray], rules: Sequence[Rule],
+                            critical_after: Optional[int] = None) -> Tuple[List[str], List[List[str]]]:
+        """
+        Evaluates a rule table for many apps at once.
+
+        Each rule is applied as one NumPy comparison over its column and
+        folded into preallocated int8 severity and warning-count arrays in
+        place; status strings are looked up from the codes at the end, and
+        messages are only formatted for the rows a rule matched. Results
+        match calling evaluate_rules on each row.
+
+        Args:
+            columns: Equal-length arrays of metric values, keyed by field name.
+            rules: The provider's rule table, evaluated in order.
+            critical_after: If set, more than this many warning messages makes the app critical.
+
+        Returns:
+            A (statuses, warnings) tuple of per-app lists.
+        """
+        size = len(next(iter(columns.values()))) if columns else 0
+        out_status = np.zeros(size, dtype=np.int8)
+        out_warn_count = np.zeros(size, dtype=np.int8)
+        warnings: List[List[str]] = [[] for _ in range(size)]
+        for field, op, threshold, severity, message in rules:
+            column = columns[field]
+            mask = np.asarray(_RULE_OPS[op](column, threshold), dtype=bool)
+            np.maximum(out_status, _SEVERITY_RANK[severity], out=out_status, where=mask)
+            if message is not None:
+                np.add(out_warn_count, 1, out=out_warn_count, where=mask)
+                matched = np.flatnonzero(mask)
+                name = _message_key(message)
+                shown = column if name == 'v' else columns[name]
+                for row, text in zip(matched.tolist(), _format_matches(message, shown[matched], name)):
+                    warnings[row].append(text)
+        if critical_after is not None:
+            out_status[out_warn_count > critical_after] = 2
+
+        return _RANKED_STATUS_ARRAY.take(out_status).tolist(), warnings
@@ -1,14 +1,34 @@
-from .base_provider import BaseFitnessProvider, Status # Relative import
+from .base_provider import BaseFitnessProvider # Relative import
 from typing import Dict, Any, Optional
 import logging
-import os
-import csv
 
 logger = logging.getLogger(__name__)
 
 class CodeQualityProvider(BaseFitnessProvider):
     """Provides fitness data related to code quality based on CSV data."""
 
+    # The code quality CSV identifies apps by an 'app_id' column
+    csv_key_column = 'app_id'
+
+    # Using the columns from the provided CSV: LintScore, TestCoverage, ComplexityScore, MaintainabilityIndex
+    METRIC_FIELDS = (
+        ('lint_score', 'LintScore', 'int', 0),
+        ('test_coverage_percent', 'TestCoverage', 'int', 0),
+        ('complexity_score', 'ComplexityScore', 'int', 0),
+        ('maintainability_index', 'MaintainabilityIndex', 'int', 0),
+    )
+
+    # Higher scores are generally better for LintScore, TestCoverage, MaintainabilityIndex;
+    # lower scores are generally better for ComplexityScore
+    RULES = (
+        ('lint_score', '<', 85, 'warning', "Low Lint Score"),
+        ('test_coverage_percent', '<', 75, 'warning', "Low Test Coverage"),
+        ('complexity_score', '>', 15, 'warning', "High Complexity"),
+        ('maintainability_index', '<', 75, 'warning', "Low Maintainability"),
+    )
+    # More than this many warnings makes an app critical
+    CRITICAL_AFTER = 2
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes the provider. Config is currently unused as we read directly from mock.
@@ -22,7 +42,7 @@ class CodeQualityProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "code_quality_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns code quality data read directly from the mock CSV file."""
         app_id = app_config.get('app_id')
         if not app_id:
@@ -30,13 +50,7 @@ class CodeQualityProvider(BaseFitnessProvider):
             return {"status": "unknown", "details": {"error": "app_id missing."}}        # Read data directly from the mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            with open(self.mock_file_path, mode='r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    # CSV has an 'app_id' column matching app_id
-                    if row.get('app_id') == app_id:
-                        raw_data = row
-                        break # Found the app, stop reading
+            raw_data = self._lookup_row(app_id)
         except FileNotFoundError:
             logger.error(f"[{self.provider_id}] Mock data file not found: {self.mock_file_path}")
             return {"status": "unknown", "details": {"error": f"Mock data file not found: {self.mock_file_path}"}}
@@ -49,46 +63,4 @@ class CodeQualityProvider(BaseFitnessProvider):
             # Return 'not_found' status instead of 'unknown' for clarity
             return {"status": "not_found", "details": {"message": f"No data found for app_id {app_id} in mock file."}}
 
-        # --- Determine Status and Details from raw_data ---
-        # Using the columns from the provided CSV: LintScore, TestCoverage, ComplexityScore, MaintainabilityIndex
-        try:
-            # Convert values, providing defaults if missing or invalid
-            lint_score = int(raw_data.get('LintScore', 0))
-            test_coverage = int(raw_data.get('TestCoverage', 0))
-            complexity_score = int(raw_data.get('ComplexityScore', 0))
-            maintainability_index = int(raw_data.get('MaintainabilityIndex', 0))
-
-            # Example status logic (adjust thresholds as needed)
-            # Higher scores are generally better for LintScore, TestCoverage, MaintainabilityIndex
-            # Lower scores are generally better for ComplexityScore
-            status: Status = 'healthy'
-            warnings = []
-            if lint_score < 85: warnings.append("Low Lint Score")
-            if test_coverage < 75: warnings.append("Low Test Coverage")
-            if complexity_score > 15: warnings.append("High Complexity")
-            if maintainability_index < 75: warnings.append("Low Maintainability")
-
-            if len(warnings) > 2:
-                status = 'critical'
-            elif len(warnings) > 0:
-                status = 'warning'
-
-
-            details = {
-                "lint_score": lint_score,
-                "test_coverage_percent": test_coverage,
-                "complexity_score": complexity_score,
-                "maintainability_index": maintainability_index,
-                "warnings": warnings, # Add warnings for context
-            }
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
-            return {
-                "status": status,
-                "details": details
-            }
-        except ValueError as e:
-             logger.error(f"[{self.provider_id}] Error converting data types for app {app_id}: {e}. Data: {raw_data}", exc_info=True)
-             return {"status": "unknown", "details": {"error": f"Error processing data types: {e}"}}
-        except Exception as e:
-            logger.error(f"[{self.provider_id}] Error processing raw data for app {app_id}: {e}. Data: {raw_data}", exc_info=True)
-            return {"status": "unknown", "details": {"error": f"Error processing data: {e}"}}
+        return self._row_to_status(app_id, raw_data)
\ No newline at end of file
@@ -1,14 +1,17 @@
 from .base_provider import BaseFitnessProvider, Status
 from typing import Dict, Any, Optional
 import logging
-import os
-import csv
 
 logger = logging.getLogger(__name__)
 
 class CostOptimizationProvider(BaseFitnessProvider):
     """Provides fitness data related to cost optimization based on mock CSV data."""
 
+    METRIC_FIELDS = (
+        ('monthly_cost_usd', 'MonthlyCostUSD', 'float', 0.0),
+        ('cost_trend_percent', 'CostTrendPercent', 'float', 0.0),
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes the provider. Config is currently unused.
@@ -22,7 +25,7 @@ class CostOptimizationProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "cost_optimization_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns cost optimization data read directly from the mock CSV file."""
 
         app_id = app_config.get('app_id')
@@ -30,15 +33,10 @@ class CostOptimizationProvider(BaseFitnessProvider):
             logger.warning(f"[{self.provider_id}] app_id missing in app_config.")
             return {"status": "unknown", "details": {"error": "app_id missing."}}
 
-        # Read data directly from the mock CSV file
+        # Look up the app in the parsed (and cached) mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            with open(self.mock_file_path, mode='r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    if row.get('ApplicationName') == app_id:
-                        raw_data = row
-                        break
+            raw_data = self._lookup_row(app_id)
         except FileNotFoundError:
             logger.error(f"[{self.provider_id}] Mock data file not found: {self.mock_file_path}")
             return {"status": "unknown", "details": {"error": f"Mock data file not found: {self.mock_file_path}"}}
@@ -53,26 +51,25 @@ class CostOptimizationProvider(BaseFitnessProvider):
         # --- Determine Status and Details from raw_data ---
         # Assuming columns 'MonthlyCostUSD', 'CostTrendPercent' based on previous logic
         try:
-            cost = float(raw_data.get('MonthlyCostUSD', 0.0))
-            trend = float(raw_data.get('CostTrendPercent', 0.0))
+            metrics = self._extract_metrics(raw_data)
 
             # Example status logic
             status: Status = 'healthy'
             warnings = []
-            if trend > 5:
-                warnings.append(f"Cost trend increasing (>5%): {trend}%")
+            if metrics.cost_trend_percent > 5:
+                warnings.append(f"Cost trend increasing (>5%): {metrics.cost_trend_percent}%")
                 status = 'warning'
-            if trend > 15:
-                 warnings.append(f"Cost trend significantly increasing (>15%): {trend}%")
+            if metrics.cost_trend_percent > 15:
+                 warnings.append(f"Cost trend significantly increasing (>15%): {metrics.cost_trend_percent}%")
                  status = 'critical' # Overwrite status if trend is critical
 
             details = {
-                "monthly_cost_usd": cost,
-                "cost_trend_percent": trend,
+                "monthly_cost_usd": metrics.monthly_cost_usd,
+                "cost_trend_percent": metrics.cost_trend_percent,
                 "warnings": warnings
                 # "raw_timestamp": raw_data.get('timestamp') # Timestamp not in mock CSV
             }
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
+            logger.info("[%s] Processed mock data for app: %s, Status: %s", self.provider_id, app_id, status)
             return {
                 "status": status,
                 "details": details
@@ -1,14 +1,40 @@
-from .base_provider import BaseFitnessProvider, Status
+from .base_provider import BaseFitnessProvider
 from typing import Dict, Any, Optional
 import logging
-import os
-import csv
 
 logger = logging.getLogger(__name__)
 
+
+def _overall_score(metrics: Dict[str, Any]) -> Any:
+    """An overall data quality score: the simple average of the three dimensions."""
+    return (metrics['data_accuracy'] + metrics['data_consistency'] + metrics['data_completeness']) / 3
+
+
 class DataQualityProvider(BaseFitnessProvider):
     """Provides fitness data related to data quality based on CSV data."""
 
+    # Status follows the overall score; per-dimension checks only add warnings
+    RULES = (
+        ('overall_score', '<', 80, 'critical', "Overall data quality score is critical: {v:.1f}%"),
+        ('overall_score', 'between', (80, 90), 'warning', "Overall data quality score needs improvement: {v:.1f}%"),
+        ('data_accuracy', '<', 85, 'info', "Data accuracy below threshold: {v}%"),
+        ('data_consistency', '<', 85, 'info', "Data consistency below threshold: {v}%"),
+        ('data_completeness', '<', 85, 'info', "Data completeness below threshold: {v}%"),
+    )
+
+    # The mock CSV identifies apps by an 'app_id' column and may hold several timestamped rows per app
+    csv_key_column = 'app_id'
+    csv_latest_row = True
+
+    METRIC_FIELDS = (
+        ('data_accuracy', 'DataAccuracy', 'float', 0),
+        ('data_consistency', 'DataConsistency', 'float', 0),
+        ('data_completeness', 'DataCompleteness', 'float', 0),
+    )
+    DERIVED_FIELDS = (
+        ('overall_score', _overall_score, True),
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes the provider. Config is currently unused as we read directly from mock.
@@ -22,62 +48,28 @@ class DataQualityProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "data_quality_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns data quality metrics read directly from the mock CSV file."""
         app_id = app_config.get('app_id')
         if not app_id:
             logger.warning(f"[{self.provider_id}] app_id missing in app_config. Cannot fetch specific data.")
             return {"status": "unknown", "details": {"error": "app_id missing."}}
         
-        # Read data directly from the mock CSV file
+        # Look up the app's latest row in the parsed (and cached) mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            # Use CSV connector to fetch data for this app
-            connector = self.get_connector()
-            if not connector:
-                logger.error(f"[{self.provider_id}] Failed to create connector.")
-                return {"status": "unknown", "details": {"error": "Failed to create connector."}}
-            
-            raw_data = connector.fetch_data(app_config)
+            raw_data = self._lookup_latest_row(app_id)
             if not raw_data:
                 logger.warning(f"[{self.provider_id}] No data found for app {app_id}")
                 return {"status": "unknown", "details": {"error": f"No data found for app {app_id}"}}
             
             # Extract important metrics
-            data_accuracy = float(raw_data.get('DataAccuracy', 0))
-            data_consistency = float(raw_data.get('DataConsistency', 0))
-            data_completeness = float(raw_data.get('DataCompleteness', 0))
-            
-            # Calculate an overall data quality score (simple average)
-            overall_score = (data_accuracy + data_consistency + data_completeness) / 3
-            
-            # Determine status based on the overall score
-            status: Status = 'healthy'
-            warnings = []
+            metrics = self._extract_metrics(raw_data)
             
-            if overall_score < 80:
-                status = 'critical'
-                warnings.append(f"Overall data quality score is critical: {overall_score:.1f}%")
-            elif overall_score < 90:
-                status = 'warning'
-                warnings.append(f"Overall data quality score needs improvement: {overall_score:.1f}%")
-                
-            if data_accuracy < 85:
-                warnings.append(f"Data accuracy below threshold: {data_accuracy}%")
-            if data_consistency < 85:
-                warnings.append(f"Data consistency below threshold: {data_consistency}%")
-            if data_completeness < 85:
-                warnings.append(f"Data completeness below threshold: {data_completeness}%")
-            
-            details = {
-                "data_accuracy": data_accuracy,
-                "data_consistency": data_consistency,
-                "data_completeness": data_completeness,
-                "overall_score": overall_score,
-                "warnings": warnings
-            }
+            # Determine status based on the metrics
+            status, details = self._evaluate_metrics(metrics)
             
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
+            logger.info("[%s] Processed mock data for app: %s, Status: %s", self.provider_id, app_id, status)
             return {
                 "status": status,
                 "details": details
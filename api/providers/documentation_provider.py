@@ -1,14 +1,24 @@
-from .base_provider import BaseFitnessProvider, Status
+from .base_provider import BaseFitnessProvider
 from typing import Dict, Any, Optional
 import logging
-import os
-import csv
 
 logger = logging.getLogger(__name__)
 
 class DocumentationProvider(BaseFitnessProvider):
     """Provides fitness data related to documentation coverage based on mock CSV data."""
 
+    METRIC_FIELDS = (
+        ('coverage_percent', 'CoveragePercent', 'int', 0),
+        ('last_updated_days_ago', 'LastUpdatedDaysAgo', 'int', 999),
+    )
+
+    RULES = (
+        ('coverage_percent', '<', 80, 'warning', "Documentation coverage below threshold (<80%): {v}%"),
+        ('last_updated_days_ago', '>', 30, 'warning', "Documentation not updated recently (>30 days): {v} days ago"),
+        ('coverage_percent', '<', 60, 'critical', None),
+        ('last_updated_days_ago', '>', 90, 'critical', None),
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes the provider. Config is currently unused.
@@ -22,7 +32,7 @@ class DocumentationProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "documentation_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns documentation coverage data read directly from the mock CSV file."""
 
         app_id = app_config.get('app_id')
@@ -30,15 +40,10 @@ class DocumentationProvider(BaseFitnessProvider):
             logger.warning(f"[{self.provider_id}] app_id missing in app_config.")
             return {"status": "unknown", "details": {"error": "app_id missing."}}
 
-        # Read data directly from the mock CSV file
+        # Look up the app in the parsed (and cached) mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            with open(self.mock_file_path, mode='r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    if row.get('ApplicationName') == app_id:
-                        raw_data = row
-                        break
+            raw_data = self._lookup_row(app_id)
         except FileNotFoundError:
             logger.error(f"[{self.provider_id}] Mock data file not found: {self.mock_file_path}")
             return {"status": "unknown", "details": {"error": f"Mock data file not found: {self.mock_file_path}"}}
@@ -50,40 +55,4 @@ class DocumentationProvider(BaseFitnessProvider):
             logger.warning(f"[{self.provider_id}] No data found for app_id: {app_id} in {self.mock_file_path}")
             return {"status": "not_found", "details": {"message": f"No data found for app_id {app_id} in mock file."}}
 
-        # --- Determine Status and Details from raw_data ---
-        # Assuming columns 'CoveragePercent', 'LastUpdatedDaysAgo' based on previous logic
-        try:
-            coverage = int(raw_data.get('CoveragePercent', 0))
-            last_updated = int(raw_data.get('LastUpdatedDaysAgo', 999))
-
-            # Example status logic
-            status: Status = 'healthy'
-            warnings = []
-            if coverage < 80:
-                warnings.append(f"Documentation coverage below threshold (<80%): {coverage}%")
-            if last_updated > 30:
-                 warnings.append(f"Documentation not updated recently (>30 days): {last_updated} days ago")
-
-            if coverage < 60 or last_updated > 90:
-                status = 'critical'
-            elif len(warnings) > 0:
-                status = 'warning'
-
-            details = {
-                "coverage_percent": coverage,
-                "last_updated_days_ago": last_updated,
-                "warnings": warnings
-                # "raw_timestamp": raw_data.get('timestamp') # Timestamp not in mock CSV
-            }
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
-            return {
-                "status": status,
-                "details": details
-                # "raw_data": raw_data # Optionally include raw data
-            }
-        except ValueError as e:
-             logger.error(f"[{self.provider_id}] Error converting data types for app {app_id}: {e}. Data: {raw_data}", exc_info=True)
-             return {"status": "unknown", "details": {"error": f"Error processing data types: {e}"}}
-        except Exception as e:
-            logger.error(f"[{self.provider_id}] Error processing raw data for app {app_id}: {e}. Data: {raw_data}", exc_info=True)
-            return {"status": "unknown", "details": {"error": f"Error processing data: {e}"}}
+        return self._row_to_status(app_id, raw_data)
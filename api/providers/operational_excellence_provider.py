@@ -1,14 +1,28 @@
-from .base_provider import BaseFitnessProvider, Status
+from .base_provider import BaseFitnessProvider
 from typing import Dict, Any, Optional
 import logging
-import os # Added for path joining
-import csv # Added for CSV reading
 
 logger = logging.getLogger(__name__)
 
 class OperationalExcellenceProvider(BaseFitnessProvider):
     """Provides fitness data related to operational excellence based on mock CSV data."""
 
+    # Assuming columns 'UptimePercent', 'AvgResponseTimeMS', 'IncidentsLast30d'
+    METRIC_FIELDS = (
+        ('uptime_percent_last_30d', 'UptimePercent', 'float', 0.0),
+        ('avg_response_time_ms', 'AvgResponseTimeMS', 'int', 9999),
+        ('incidents_last_30d', 'IncidentsLast30d', 'int', 99),
+    )
+
+    RULES = (
+        ('uptime_percent_last_30d', '<', 99.5, 'warning', "Uptime below threshold (<99.5%): {v}%"),
+        ('avg_response_time_ms', '>', 500, 'warning', "Average response time high (>500ms): {v}ms"),
+        ('incidents_last_30d', '>', 1, 'warning', "Multiple incidents in last 30 days: {v}"),
+        ('uptime_percent_last_30d', '<', 99.0, 'critical', None),
+        ('avg_response_time_ms', '>', 1000, 'critical', None),
+        ('incidents_last_30d', '>', 3, 'critical', None),
+    )
+
     def __init__(self, config: Dict[str, Any]): # Added config parameter
         """
         Initializes the provider. Config is currently unused.
@@ -22,22 +36,17 @@ class OperationalExcellenceProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "operational_excellence_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns operational excellence data read directly from the mock CSV file."""
         app_id = app_config.get('app_id')
         if not app_id:
             logger.warning(f"[{self.provider_id}] app_id missing in app_config.")
             return {"status": "unknown", "details": {"error": "app_id missing."}}
 
-        # Read data directly from the mock CSV file
+        # Look up the app in the parsed (and cached) mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            with open(self.mock_file_path, mode='r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    if row.get('ApplicationName') == app_id:
-                        raw_data = row
-                        break
+            raw_data = self._lookup_row(app_id)
         except FileNotFoundError:
             logger.error(f"[{self.provider_id}] Mock data file not found: {self.mock_file_path}")
             return {"status": "unknown", "details": {"error": f"Mock data file not found: {self.mock_file_path}"}}
@@ -49,46 +58,7 @@ class OperationalExcellenceProvider(BaseFitnessProvider):
             logger.warning(f"[{self.provider_id}] No data found for app_id: {app_id} in {self.mock_file_path}")
             return {"status": "not_found", "details": {"message": f"No data found for app_id {app_id} in mock file."}}
 
-        # --- Determine Status and Details from raw_data ---
-        # Assuming columns 'UptimePercent', 'AvgResponseTimeMS', 'IncidentsLast30d'
-        try:
-            uptime = float(raw_data.get('UptimePercent', 0.0))
-            response_time = int(raw_data.get('AvgResponseTimeMS', 9999))
-            incidents = int(raw_data.get('IncidentsLast30d', 99))
-
-            # Example status logic
-            status: Status = 'healthy'
-            warnings = []
-            if uptime < 99.5:
-                warnings.append(f"Uptime below threshold (<99.5%): {uptime}%")
-            if response_time > 500:
-                 warnings.append(f"Average response time high (>500ms): {response_time}ms")
-            if incidents > 1:
-                 warnings.append(f"Multiple incidents in last 30 days: {incidents}")
-
-            if uptime < 99.0 or response_time > 1000 or incidents > 3:
-                status = 'critical'
-            elif len(warnings) > 0:
-                status = 'warning'
-
-            details = {
-                "uptime_percent_last_30d": uptime,
-                "avg_response_time_ms": response_time,
-                "incidents_last_30d": incidents,
-                "warnings": warnings
-                # "last_incident_date": ... # This wasn't in the assumed columns, maybe add later
-            }
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
-            return {
-                "status": status,
-                "details": details
-            }
-        except ValueError as e:
-             logger.error(f"[{self.provider_id}] Error converting data types for app {app_id}: {e}. Data: {raw_data}", exc_info=True)
-             return {"status": "unknown", "details": {"error": f"Error processing data types: {e}"}}
-        except Exception as e:
-            logger.error(f"[{self.provider_id}] Error processing raw data for app {app_id}: {e}. Data: {raw_data}", exc_info=True)
-            return {"status": "unknown", "details": {"error": f"Error processing data: {e}"}}
+        return self._row_to_status(app_id, raw_data)
 
         # --- Remove old mock data generation ---
         # status: Status = random.choice(['healthy', 'warning', 'critical'])
@@ -1,14 +1,30 @@
-from .base_provider import BaseFitnessProvider, Status
+from .base_provider import BaseFitnessProvider
 from typing import Dict, Any, Optional
 import logging
-import os
-import csv
 
 logger = logging.getLogger(__name__)
 
 class ResilienceProvider(BaseFitnessProvider):
     """Provides fitness data related to system resilience based on CSV data."""
 
+    RULES = (
+        ('failover_success_rate', '<', 95, 'critical', "Failover success rate is below critical threshold: {v}%"),
+        ('failover_success_rate', 'between', (95, 98), 'warning', "Failover success rate needs improvement: {v}%"),
+        ('recovery_time_minutes', '>', 60, 'warning', "Recovery time is high: {v} minutes"),
+        ('incident_count', '>', 5, 'warning', "High number of incidents: {v}"),
+    )
+
+    # The mock CSV identifies apps by an 'app_id' column and may hold several timestamped rows per app
+    csv_key_column = 'app_id'
+    csv_latest_row = True
+
+    METRIC_FIELDS = (
+        ('failover_success_rate', 'FailoverSuccessRate', 'float', 0),
+        ('recovery_time_minutes', 'RecoveryTimeMinutes', 'float', 0),
+        ('resiliency_score', 'ResiliencyScore', 'float', 0),
+        ('incident_count', 'IncidentCount', 'int', 0),
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes the provider. Config is currently unused as we read directly from mock.
@@ -22,63 +38,28 @@ class ResilienceProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "resilience_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns resilience metrics read directly from the mock CSV file."""
         app_id = app_config.get('app_id')
         if not app_id:
             logger.warning(f"[{self.provider_id}] app_id missing in app_config. Cannot fetch specific data.")
             return {"status": "unknown", "details": {"error": "app_id missing."}}
         
-        # Read data directly from the mock CSV file
+        # Look up the app's latest row in the parsed (and cached) mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            # Use CSV connector to fetch data for this app
-            connector = self.get_connector()
-            if not connector:
-                logger.error(f"[{self.provider_id}] Failed to create connector.")
-                return {"status": "unknown", "details": {"error": "Failed to create connector."}}
-            
-            raw_data = connector.fetch_data(app_config)
+            raw_data = self._lookup_latest_row(app_id)
             if not raw_data:
                 logger.warning(f"[{self.provider_id}] No data found for app {app_id}")
                 return {"status": "unknown", "details": {"error": f"No data found for app {app_id}"}}
             
             # Extract important metrics
-            failover_success_rate = float(raw_data.get('FailoverSuccessRate', 0))
-            recovery_time_minutes = float(raw_data.get('RecoveryTimeMinutes', 0))
-            resiliency_score = float(raw_data.get('ResiliencyScore', 0))
-            incident_count = int(raw_data.get('IncidentCount', 0))
+            metrics = self._extract_metrics(raw_data)
             
             # Determine status based on the metrics
-            status: Status = 'healthy'
-            warnings = []
-            
-            if failover_success_rate < 95:
-                status = 'critical'
-                warnings.append(f"Failover success rate is below critical threshold: {failover_success_rate}%")
-            elif failover_success_rate < 98:
-                status = 'warning'
-                warnings.append(f"Failover success rate needs improvement: {failover_success_rate}%")
-                
-            if recovery_time_minutes > 60:
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append(f"Recovery time is high: {recovery_time_minutes} minutes")
-            
-            if incident_count > 5:
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append(f"High number of incidents: {incident_count}")
-            
-            details = {
-                "failover_success_rate": failover_success_rate,
-                "recovery_time_minutes": recovery_time_minutes,
-                "resiliency_score": resiliency_score,
-                "incident_count": incident_count,
-                "warnings": warnings
-            }
+            status, details = self._evaluate_metrics(metrics)
             
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
+            logger.info("[%s] Processed mock data for app: %s, Status: %s", self.provider_id, app_id, status)
             return {
                 "status": status,
                 "details": details
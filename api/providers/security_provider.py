@@ -1,14 +1,17 @@
 from .base_provider import BaseFitnessProvider, Status
 from typing import Dict, Any, Optional
 import logging
-import os
-import csv
 
 logger = logging.getLogger(__name__)
 
 class SecurityProvider(BaseFitnessProvider):
     """Provides fitness data related to security based on mock CSV data."""
 
+    METRIC_FIELDS = (
+        ('vulnerability_count_critical', 'CriticalVulnerabilities', 'int', 0),
+        ('sca_issues_high', 'HighSCAIssues', 'int', 0),
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes the provider. Config is currently unused.
@@ -22,7 +25,7 @@ class SecurityProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "security_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns security data read directly from the mock CSV file."""
 
         app_id = app_config.get('app_id')
@@ -30,15 +33,10 @@ class SecurityProvider(BaseFitnessProvider):
             logger.warning(f"[{self.provider_id}] app_id missing in app_config.")
             return {"status": "unknown", "details": {"error": "app_id missing."}}
 
-        # Read data directly from the mock CSV file
+        # Look up the app in the parsed (and cached) mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            with open(self.mock_file_path, mode='r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    if row.get('ApplicationName') == app_id:
-                        raw_data = row
-                        break
+            raw_data = self._lookup_row(app_id)
         except FileNotFoundError:
             logger.error(f"[{self.provider_id}] Mock data file not found: {self.mock_file_path}")
             return {"status": "unknown", "details": {"error": f"Mock data file not found: {self.mock_file_path}"}}
@@ -53,29 +51,28 @@ class SecurityProvider(BaseFitnessProvider):
         # --- Determine Status and Details from raw_data ---
         # Assuming columns 'CriticalVulnerabilities', 'HighSCAIssues' based on previous logic
         try:
-            vuln_critical = int(raw_data.get('CriticalVulnerabilities', 0))
-            sca_high = int(raw_data.get('HighSCAIssues', 0))
+            metrics = self._extract_metrics(raw_data)
 
             # Example status logic
             status: Status = 'healthy'
             warnings = []
-            if vuln_critical > 0:
-                warnings.append(f"Critical vulnerabilities found: {vuln_critical}")
-            if sca_high > 5:
-                 warnings.append(f"High severity SCA issues found (>5): {sca_high}")
+            if metrics.vulnerability_count_critical > 0:
+                warnings.append(f"Critical vulnerabilities found: {metrics.vulnerability_count_critical}")
+            if metrics.sca_issues_high > 5:
+                 warnings.append(f"High severity SCA issues found (>5): {metrics.sca_issues_high}")
 
-            if vuln_critical > 2 or sca_high > 15:
+            if metrics.vulnerability_count_critical > 2 or metrics.sca_issues_high > 15:
                 status = 'critical'
             elif len(warnings) > 0:
                 status = 'warning'
 
             details = {
-                "vulnerability_count_critical": vuln_critical,
-                "sca_issues_high": sca_high,
+                "vulnerability_count_critical": metrics.vulnerability_count_critical,
+                "sca_issues_high": metrics.sca_issues_high,
                 "warnings": warnings
                 # "raw_timestamp": raw_data.get('timestamp') # Timestamp not in mock CSV
             }
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
+            logger.info("[%s] Processed mock data for app: %s, Status: %s", self.provider_id, app_id, status)
             return {
                 "status": status,
                 "details": details
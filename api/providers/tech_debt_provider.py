@@ -1,14 +1,41 @@
-from .base_provider import BaseFitnessProvider, Status
+from .base_provider import BaseFitnessProvider
 from typing import Dict, Any, Optional
 import logging
-import os
-import csv
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+
+def _debt_level(metrics: Dict[str, Any]) -> Any:
+    """2 where the debt ratio or legacy code share is critical, 1 where either needs attention, else 0."""
+    ratio, legacy = metrics['tech_debt_ratio'], metrics['legacy_code_percentage']
+    return np.select([(ratio > 25) | (legacy > 40), (ratio > 15) | (legacy > 25)], [2, 1], 0)
+
+
 class TechDebtProvider(BaseFitnessProvider):
     """Provides fitness data related to technical debt based on CSV data."""
 
+    RULES = (
+        ('debt_level', '==', 2, 'critical', "Critical technical debt ratio: {tech_debt_ratio}%"),
+        ('debt_level', '==', 1, 'warning', "Technical debt needs attention: {tech_debt_ratio}%"),
+        ('refactoring_needed', 'lower in', frozenset({'high'}), 'warning', "High refactoring needs identified"),
+        ('outdated_dependencies', '>', 10, 'warning', "High number of outdated dependencies: {v}"),
+    )
+
+    # The mock CSV identifies apps by an 'app_id' column and may hold several timestamped rows per app
+    csv_key_column = 'app_id'
+    csv_latest_row = True
+
+    METRIC_FIELDS = (
+        ('tech_debt_ratio', 'TechDebtRatio', 'float', 0),
+        ('legacy_code_percentage', 'LegacyCodePercentage', 'float', 0),
+        ('refactoring_needed', 'RefactoringNeeded', 'text', 'low'),
+        ('outdated_dependencies', 'OutdatedDependencies', 'int', 0),
+    )
+    DERIVED_FIELDS = (
+        ('debt_level', _debt_level, False),
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes the provider. Config is currently unused as we read directly from mock.
@@ -22,63 +49,28 @@ class TechDebtProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "tech_debt_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns technical debt metrics read directly from the mock CSV file."""
         app_id = app_config.get('app_id')
         if not app_id:
             logger.warning(f"[{self.provider_id}] app_id missing in app_config. Cannot fetch specific data.")
             return {"status": "unknown", "details": {"error": "app_id missing."}}
         
-        # Read data directly from the mock CSV file
+        # Look up the app's latest row in the parsed (and cached) mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            # Use CSV connector to fetch data for this app
-            connector = self.get_connector()
-            if not connector:
-                logger.error(f"[{self.provider_id}] Failed to create connector.")
-                return {"status": "unknown", "details": {"error": "Failed to create connector."}}
-            
-            raw_data = connector.fetch_data(app_config)
+            raw_data = self._lookup_latest_row(app_id)
             if not raw_data:
                 logger.warning(f"[{self.provider_id}] No data found for app {app_id}")
                 return {"status": "unknown", "details": {"error": f"No data found for app {app_id}"}}
             
             # Extract important metrics
-            tech_debt_ratio = float(raw_data.get('TechDebtRatio', 0))
-            legacy_code_percentage = float(raw_data.get('LegacyCodePercentage', 0))
-            refactoring_needed = raw_data.get('RefactoringNeeded', 'low')
-            outdated_dependencies = int(raw_data.get('OutdatedDependencies', 0))
+            metrics = self._extract_metrics(raw_data)
             
             # Determine status based on the metrics
-            status: Status = 'healthy'
-            warnings = []
-            
-            if tech_debt_ratio > 25 or legacy_code_percentage > 40:
-                status = 'critical'
-                warnings.append(f"Critical technical debt ratio: {tech_debt_ratio}%")
-            elif tech_debt_ratio > 15 or legacy_code_percentage > 25:
-                status = 'warning'
-                warnings.append(f"Technical debt needs attention: {tech_debt_ratio}%")
-                
-            if refactoring_needed.lower() == 'high':
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append("High refactoring needs identified")
-            
-            if outdated_dependencies > 10:
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append(f"High number of outdated dependencies: {outdated_dependencies}")
-            
-            details = {
-                "tech_debt_ratio": tech_debt_ratio,
-                "legacy_code_percentage": legacy_code_percentage,
-                "refactoring_needed": refactoring_needed,
-                "outdated_dependencies": outdated_dependencies,
-                "warnings": warnings
-            }
+            status, details = self._evaluate_metrics(metrics)
             
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
+            logger.info("[%s] Processed mock data for app: %s, Status: %s", self.provider_id, app_id, status)
             return {
                 "status": status,
                 "details": details
@@ -1,14 +1,34 @@
-from .base_provider import BaseFitnessProvider, Status
+from .base_provider import BaseFitnessProvider
 from typing import Dict, Any, Optional
 import logging
-import os
-import csv
 
 logger = logging.getLogger(__name__)
 
+# Contract renewal statuses (lower-cased) that raise a warning
+_LAPSING_CONTRACT_STATUSES = frozenset({'expired', 'expiring'})
+
 class VendorMgmtProvider(BaseFitnessProvider):
     """Provides fitness data related to vendor management based on CSV data."""
 
+    RULES = (
+        ('vendor_compliance_score', '<', 75, 'critical', "Vendor compliance score is critical: {v}%"),
+        ('vendor_compliance_score', 'between', (75, 85), 'warning', "Vendor compliance score needs improvement: {v}%"),
+        ('contract_renewal_status', 'lower in', _LAPSING_CONTRACT_STATUSES, 'warning', "Contract status is {v}"),
+        ('vendor_response_time', '>', 12, 'warning', "Vendor response time is high: {v} hours"),
+        ('support_quality_rating', '<', 70, 'warning', "Support quality rating is low: {v}/100"),
+    )
+
+    # The mock CSV identifies apps by an 'app_id' column and may hold several timestamped rows per app
+    csv_key_column = 'app_id'
+    csv_latest_row = True
+
+    METRIC_FIELDS = (
+        ('vendor_compliance_score', 'VendorComplianceScore', 'float', 0),
+        ('contract_renewal_status', 'ContractRenewalStatus', 'text', 'unknown'),
+        ('vendor_response_time', 'VendorResponseTime', 'float', 0),
+        ('support_quality_rating', 'SupportQualityRating', 'float', 0),
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes the provider. Config is currently unused as we read directly from mock.
@@ -22,68 +42,28 @@ class VendorMgmtProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "vendor_mgmt_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns vendor management metrics read directly from the mock CSV file."""
         app_id = app_config.get('app_id')
         if not app_id:
             logger.warning(f"[{self.provider_id}] app_id missing in app_config. Cannot fetch specific data.")
             return {"status": "unknown", "details": {"error": "app_id missing."}}
         
-        # Read data directly from the mock CSV file
+        # Look up the app's latest row in the parsed (and cached) mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            # Use CSV connector to fetch data for this app
-            connector = self.get_connector()
-            if not connector:
-                logger.error(f"[{self.provider_id}] Failed to create connector.")
-                return {"status": "unknown", "details": {"error": "Failed to create connector."}}
-            
-            raw_data = connector.fetch_data(app_config)
+            raw_data = self._lookup_latest_row(app_id)
             if not raw_data:
                 logger.warning(f"[{self.provider_id}] No data found for app {app_id}")
                 return {"status": "unknown", "details": {"error": f"No data found for app {app_id}"}}
             
             # Extract important metrics
-            vendor_compliance_score = float(raw_data.get('VendorComplianceScore', 0))
-            contract_renewal_status = raw_data.get('ContractRenewalStatus', 'unknown')
-            vendor_response_time = float(raw_data.get('VendorResponseTime', 0))
-            support_quality_rating = float(raw_data.get('SupportQualityRating', 0))
+            metrics = self._extract_metrics(raw_data)
             
             # Determine status based on the metrics
-            status: Status = 'healthy'
-            warnings = []
-            
-            if vendor_compliance_score < 75:
-                status = 'critical'
-                warnings.append(f"Vendor compliance score is critical: {vendor_compliance_score}%")
-            elif vendor_compliance_score < 85:
-                status = 'warning'
-                warnings.append(f"Vendor compliance score needs improvement: {vendor_compliance_score}%")
-                
-            if contract_renewal_status.lower() in ['expired', 'expiring']:
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append(f"Contract status is {contract_renewal_status}")
-            
-            if vendor_response_time > 12:
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append(f"Vendor response time is high: {vendor_response_time} hours")
-            
-            if support_quality_rating < 70:
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append(f"Support quality rating is low: {support_quality_rating}/100")
-            
-            details = {
-                "vendor_compliance_score": vendor_compliance_score,
-                "contract_renewal_status": contract_renewal_status,
-                "vendor_response_time": vendor_response_time,
-                "support_quality_rating": support_quality_rating,
-                "warnings": warnings
-            }
+            status, details = self._evaluate_metrics(metrics)
             
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
+            logger.info("[%s] Processed mock data for app: %s, Status: %s", self.provider_id, app_id, status)
             return {
                 "status": status,
                 "details": details
@@ -1,14 +1,41 @@
-from .base_provider import BaseFitnessProvider, Status
+from .base_provider import BaseFitnessProvider
 from typing import Dict, Any, Optional
 import logging
-import os
-import csv
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+
+def _optimization_level(metrics: Dict[str, Any]) -> Any:
+    """2 where cloud optimization or cost efficiency is critical, 1 where either needs improvement, else 0."""
+    cloud, cost = metrics['cloud_optimization'], metrics['cost_efficiency']
+    return np.select([(cloud < 75) | (cost < 75), (cloud < 85) | (cost < 85)], [2, 1], 0)
+
+
 class WorkloadPlacementProvider(BaseFitnessProvider):
     """Provides fitness data related to workload placement and optimization based on CSV data."""
 
+    RULES = (
+        ('optimization_level', '==', 2, 'critical', "Cloud optimization is critical: {cloud_optimization}%"),
+        ('optimization_level', '==', 1, 'warning', "Cloud optimization needs improvement: {cloud_optimization}%"),
+        ('resource_utilization', '<', 70, 'warning', "Low resource utilization: {v}%"),
+        ('environment_placement', 'lower in', frozenset({'suboptimal'}), 'warning', "Suboptimal environment placement identified"),
+    )
+
+    # The mock CSV identifies apps by an 'app_id' column and may hold several timestamped rows per app
+    csv_key_column = 'app_id'
+    csv_latest_row = True
+
+    METRIC_FIELDS = (
+        ('cloud_optimization', 'CloudOptimization', 'float', 0),
+        ('resource_utilization', 'ResourceUtilization', 'float', 0),
+        ('environment_placement', 'EnvironmentPlacement', 'text', 'unknown'),
+        ('cost_efficiency', 'CostEfficiency', 'float', 0),
+    )
+    DERIVED_FIELDS = (
+        ('optimization_level', _optimization_level, False),
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes the provider. Config is currently unused as we read directly from mock.
@@ -22,63 +49,28 @@ class WorkloadPlacementProvider(BaseFitnessProvider):
     def provider_id(self) -> str:
         return "workload_placement_v1"
 
-    def get_fitness_data(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fitness_data_uncached(self, app_config: Dict[str, Any]) -> Dict[str, Any]:
         """Returns workload placement metrics read directly from the mock CSV file."""
         app_id = app_config.get('app_id')
         if not app_id:
             logger.warning(f"[{self.provider_id}] app_id missing in app_config. Cannot fetch specific data.")
             return {"status": "unknown", "details": {"error": "app_id missing."}}
         
-        # Read data directly from the mock CSV file
+        # Look up the app's latest row in the parsed (and cached) mock CSV file
         raw_data: Optional[Dict[str, Any]] = None
         try:
-            # Use CSV connector to fetch data for this app
-            connector = self.get_connector()
-            if not connector:
-                logger.error(f"[{self.provider_id}] Failed to create connector.")
-                return {"status": "unknown", "details": {"error": "Failed to create connector."}}
-            
-            raw_data = connector.fetch_data(app_config)
+            raw_data = self._lookup_latest_row(app_id)
             if not raw_data:
                 logger.warning(f"[{self.provider_id}] No data found for app {app_id}")
                 return {"status": "unknown", "details": {"error": f"No data found for app {app_id}"}}
             
             # Extract important metrics
-            cloud_optimization = float(raw_data.get('CloudOptimization', 0))
-            resource_utilization = float(raw_data.get('ResourceUtilization', 0))
-            environment_placement = raw_data.get('EnvironmentPlacement', 'unknown')
-            cost_efficiency = float(raw_data.get('CostEfficiency', 0))
+            metrics = self._extract_metrics(raw_data)
             
             # Determine status based on the metrics
-            status: Status = 'healthy'
-            warnings = []
-            
-            if cloud_optimization < 75 or cost_efficiency < 75:
-                status = 'critical'
-                warnings.append(f"Cloud optimization is critical: {cloud_optimization}%")
-            elif cloud_optimization < 85 or cost_efficiency < 85:
-                status = 'warning'
-                warnings.append(f"Cloud optimization needs improvement: {cloud_optimization}%")
-                
-            if resource_utilization < 70:
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append(f"Low resource utilization: {resource_utilization}%")
-            
-            if environment_placement.lower() == 'suboptimal':
-                if status != 'critical':
-                    status = 'warning'
-                warnings.append("Suboptimal environment placement identified")
-            
-            details = {
-                "cloud_optimization": cloud_optimization,
-                "resource_utilization": resource_utilization,
-                "environment_placement": environment_placement,
-                "cost_efficiency": cost_efficiency,
-                "warnings": warnings
-            }
+            status, details = self._evaluate_metrics(metrics)
             
-            logger.info(f"[{self.provider_id}] Processed mock data for app: {app_id}, Status: {status}")
+            logger.info("[%s] Processed mock data for app: %s, Status: %s", self.provider_id, app_id, status)
             return {
                 "status": status,
                 "details": details
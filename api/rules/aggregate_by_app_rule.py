@@ -1,22 +1,36 @@
-from .base_rule import BaseRule
+from .base_rule import BaseRule, Consolidation
 import datetime
 import logging
-from collections import defaultdict
+import time
+from typing import Optional
+
+# (epoch second, ISO timestamp) of the last metadata stamp; applies within the same second reuse it
+_last_timestamp = (None, None)
+
+
+def _processed_timestamp() -> str:
+    """Returns the current local time as a second-resolution ISO string, formatted at most once a second."""
+    global _last_timestamp
+    second = int(time.time())
+    if _last_timestamp[0] != second:
+        _last_timestamp = (second, datetime.datetime.fromtimestamp(second).isoformat(timespec='seconds'))
+    return _last_timestamp[1]
 
 class AggregateByAppRule(BaseRule):
     """Aggregates data by application ID across different providers."""
 
-    def apply(self, raw_data: dict) -> dict:
+    def apply(self, raw_data: dict, consolidation: Optional[Consolidation] = None) -> dict:
         """
         Restructures data from provider -> app -> metrics to app -> provider -> metrics.
 
         Args:
             raw_data: The input data, expected structure: {provider_id: {app_id: metrics}}
+            consolidation: Unused; this rule restructures raw_data itself.
 
         Returns:
             A dictionary structured as: {app_id: {provider_id: metrics}}, plus metadata.
         """
-        aggregated_by_app = defaultdict(dict)
+        aggregated_by_app = {}
         logging.info(f"Applying {self.__class__.__name__}...")
 
         # raw_data structure is assumed to be {provider_id: {app_id: data}}
@@ -25,19 +39,19 @@ class AggregateByAppRule(BaseRule):
                 logging.warning(f"Skipping provider '{provider_id}': data is not a dictionary ({type(app_data)}).")
                 continue # Skip if provider data isn't a dict
 
+            # Store the provider's metrics under each app_id
             for app_id, metrics in app_data.items():
-                # Store the provider's metrics under the app_id
-                aggregated_by_app[app_id][provider_id] = metrics
-                logging.debug(f"Aggregated data for app '{app_id}' from provider '{provider_id}'.")
+                aggregated_by_app.setdefault(app_id, {})[provider_id] = metrics
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"Aggregated data for {len(app_data)} apps from provider '{provider_id}'.")
 
-        # Convert defaultdict back to a regular dict for the final output
-        final_data = dict(aggregated_by_app)
+        final_data = aggregated_by_app
 
         # Add metadata
         final_data['_metadata'] = {
             'rule_applied': self.__class__.__name__,
-            'processed_timestamp': datetime.datetime.now().isoformat(),
-            'original_providers': list(raw_data.keys())
+            'processed_timestamp': _processed_timestamp(),
+            'original_providers': tuple(raw_data)
         }
 
         logging.info(f"{self.__class__.__name__} applied successfully. Aggregated data for {len(final_data) -1} apps.") # -1 for metadata
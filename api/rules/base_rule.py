@@ -1,17 +1,155 @@
+import operator
 from abc import ABC, abstractmethod
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class _Absent:
+    """Marks a column a provider row does not have (as opposed to a None value)."""
+
+
+_ABSENT = _Absent()
+_type_of = np.frompyfunc(type, 1, 1)
+
+
+class AppTable:
+    """
+    Struct-of-arrays view of {provider_id: {app_id: data}} for the column-wise
+    rule paths: app_ids, and one object array per column aligned with them.
+
+    Rows are merged provider by provider like consolidate, so a later
+    provider wins when two report the same column. Cells are kept as the
+    original Python objects (missing ones as None) for the rules' typed casts.
+    """
+    __slots__ = ('app_ids', 'columns')
+
+    def __init__(self, app_ids: List[str], columns: Dict[str, np.ndarray]):
+        self.app_ids = app_ids
+        self.columns = columns
+
+    @classmethod
+    def from_raw_data(cls, raw_data: Dict[str, Dict[str, Any]], app_ids: List[str], columns: Iterable[str]) -> 'AppTable':
+        """Gathers columns out of raw_data, one provider at a time. app_ids must hold every app in raw_data."""
+        wanted = tuple(columns)
+        index = pd.Index(app_ids, dtype=object)
+        table = {column: np.full(len(app_ids), None, dtype=object) for column in wanted}
+        for provider_data in raw_data.values():
+            if not isinstance(provider_data, dict) or not provider_data:
+                continue
+            positions = index.get_indexer(list(provider_data))
+            for column, (cells, present) in cls._provider_columns(provider_data, wanted).items():
+                if present is None:
+                    table[column][positions] = cells
+                else:
+                    table[column][positions[present]] = cells[present]
+        return cls(app_ids, table)
+
+    @staticmethod
+    def _provider_columns(provider_data: Dict[str, Dict[str, Any]], wanted: Tuple[str, ...]) -> Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """
+        Pulls the wanted columns out of one provider's rows.
+
+        Returns {column: (cells, present)} where present is None when every
+        row has the column. Rows loaded from a CSV all share one set of keys,
+        so they are read with a single itemgetter over the first row's keys.
+        """
+        rows = list(provider_data.values())
+        count = len(rows)
+        keys = list(rows[0]) if isinstance(rows[0], dict) else []
+        uniform = False
+        if keys:
+            try:
+                # Same length and all of the first row's keys means the same keys
+                if len(set(map(len, rows))) == 1:
+                    deque(map(operator.itemgetter(*keys), rows), maxlen=0)
+                    uniform = True
+            except (KeyError, TypeError):
+                pass
+        if uniform:
+            return {key: (np.fromiter(map(operator.itemgetter(key), rows), dtype=object, count=count), None)
+                    for key in keys if key in wanted}
+
+        columns = {}
+        for column in wanted:
+            cells = np.fromiter((row.get(column, _ABSENT) for row in rows), dtype=object, count=count)
+            present = _type_of(cells) != _Absent
+            if present.any():
+                columns[column] = (cells, present)
+        return columns
+
+
+def consolidate(raw_data: Dict[str, Dict[str, Any]]) -> Dict[str, Mapping[str, Any]]:
+    """
+    Consolidates data from all providers for every app_id in one pass over
+    raw_data: {app_id: merged data}, a later provider winning on a clash.
+    Each app's data is a read-only view, as it may be shared between rules.
+    """
+    consolidated = {}
+    for provider_data in raw_data.values():
+        if not isinstance(provider_data, dict):
+            continue
+        for app_id, data in provider_data.items():
+            app_data = consolidated.get(app_id)
+            if app_data is None:
+                consolidated[app_id] = dict(data)
+            else:
+                app_data.update(data)
+    return {app_id: MappingProxyType(app_data) for app_id, app_data in consolidated.items()}
+
+
+class Consolidation:
+    """
+    The consolidation of one raw_data snapshot, built the first time a rule
+    asks for it. run_rules makes one per run and passes it to the rules that
+    take one, so they share it for that run only.
+    """
+    __slots__ = ('raw_data', '_apps')
+
+    def __init__(self, raw_data: Dict[str, Dict[str, Any]]):
+        self.raw_data = raw_data
+        self._apps: Optional[Dict[str, Mapping[str, Any]]] = None
+
+    def apps(self) -> Dict[str, Mapping[str, Any]]:
+        """consolidate(raw_data), built on the first call."""
+        if self._apps is None:
+            self._apps = consolidate(self.raw_data)
+        return self._apps
+
 
 class BaseRule(ABC):
     """Abstract base class for all rules."""
 
     @abstractmethod
-    def apply(self, data: dict) -> dict:
+    def apply(self, data: dict, consolidation: Optional[Consolidation] = None) -> dict:
         """
         Applies the rule to the given data.
 
         Args:
             data: The input data dictionary.
+            consolidation: The run's Consolidation of data['raw_data'], if the caller has one.
 
         Returns:
             The processed data dictionary.
         """
         pass
+
+    def _get_all_app_ids(self, raw_data: Dict[str, Dict[str, Any]]) -> set:
+        """
+        Extracts all unique app_ids present in the raw data, in one C-level union
+        of the providers' key views (the rules' results follow this set's order).
+        """
+        return set().union(*[provider_data.keys() for provider_data in raw_data.values() if isinstance(provider_data, dict)])
+
+    def _consolidate(self, raw_data: Dict[str, Dict[str, Any]],
+                     consolidation: Optional[Consolidation] = None) -> Dict[str, Mapping[str, Any]]:
+        """
+        The per-app data of raw_data (see consolidate): consolidation's when it
+        was made for this raw_data (run_rules passes one in), otherwise built here.
+        """
+        if consolidation is not None and consolidation.raw_data is raw_data:
+            return consolidation.apps()
+        return consolidate(raw_data)
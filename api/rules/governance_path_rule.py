@@ -1,14 +1,322 @@
 \
 # filepath: c:\\git\\FitnessFunctions\\api\\rules\\governance_path_rule.py
 import logging
+import operator
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
 
 # Use absolute import for BaseRule
-from rules.base_rule import BaseRule
+from rules.base_rule import AppTable, BaseRule, Consolidation
 
 logger = logging.getLogger(__name__)
 
+# Batches of at least this many apps are evaluated column-wise on an AppTable;
+# below it the table setup costs more than walking the apps one at a time
+VECTORIZE_MIN_APPS = 2000
+
+# Worker processes a batch of at least PARALLEL_MIN_APPS apps is split across.
+# Off (0) by default: each chunk has to be pickled over to its worker, which
+# only pays off for very large batches on machines with cores to spare.
+PARALLEL_WORKERS = 0
+PARALLEL_MIN_APPS = 20000
+
+# apply_iter evaluates large batches this many apps at a time, so only one
+# chunk's table and decisions are held at once
+STREAM_CHUNK_APPS = 10000
+
+# Columns read by the checks, with the type each of them is cast to (read-only)
+_METRIC_TYPES: Mapping[str, type] = MappingProxyType({
+    'VulnerabilityCount': int,
+    'PatchCompliance': float,
+    'AccessReviewStatus': str,
+    'LintScore': int,
+    'TestCoverage': float,
+    'ComplexityScore': int,
+    'UptimePercentage': float,
+    'ChangeFailureRate': float,
+    'MonthlyCostIncreasePercent': float,
+    'CostTrend': str,
+    'DocCoverage': float,
+    'LastUpdated': str,
+    'UnusedResources': int,
+})
+
+# HALT checks in the order _check_halt_conditions runs them:
+# (column, op, threshold, reason). The first one met wins.
+_HALT_RULES = (
+    ('VulnerabilityCount', operator.ge, 10, "VulnerabilityCount ({}) >= 10"),
+    ('PatchCompliance', operator.lt, 95.0, "PatchCompliance ({}%) < 95%"),
+    ('AccessReviewStatus', operator.ne, "completed", "AccessReviewStatus is '{}' (not 'completed')"),
+    ('LintScore', operator.lt, 60, "LintScore ({}) < 60"),
+    ('TestCoverage', operator.lt, 40.0, "TestCoverage ({}%) < 40%"),
+    ('ComplexityScore', operator.gt, 25, "ComplexityScore ({}) > 25"),
+    ('UptimePercentage', operator.lt, 95.0, "UptimePercentage ({}%) < 95%"),
+    ('ChangeFailureRate', operator.gt, 5.0, "ChangeFailureRate ({}%) > 5%"),
+)
+# Checked after the table: a large cost increase only HALTs while the trend is still increasing
+_COST_HALT_REASON = "MonthlyCostIncrease ({}%) > 15% AND CostTrend is 'increasing'"
+
+
+class HaltReason(IntEnum):
+    """Codes for the HALT checks, in the order they run: the _HALT_RULES entries, then the cost check."""
+    VULNERABILITIES_HIGH = 0
+    PATCH_COMPLIANCE_LOW = 1
+    ACCESS_REVIEW_PENDING = 2
+    LINT_SCORE_LOW = 3
+    TEST_COVERAGE_LOW = 4
+    COMPLEXITY_HIGH = 5
+    UPTIME_LOW = 6
+    CHANGE_FAILURE_HIGH = 7
+    COST_INCREASING = 8
+
+
+# (column, reason template) for each HaltReason; a reason is only formatted
+# into its decision label once the code is known
+_HALT_REASON_FORMATS = tuple((column, template) for column, _, _, template in _HALT_RULES) + (
+    ('MonthlyCostIncreasePercent', _COST_HALT_REASON),
+)
+
+# Cost trends that meet the Fast Path
+_GOOD_COST_TRENDS = frozenset({"stable", "decreasing"})
+
+
+def _is_in(values: np.ndarray, allowed: frozenset) -> np.ndarray:
+    """Column-wise membership test: whether each value is one of allowed."""
+    return np.isin(values, list(allowed))
+
+
+# Fast Path criteria in the order _check_fast_path_conditions reports them:
+# (column, op, threshold, reason when the criterion is not met).
+# LastUpdated is checked against a rolling cutoff and has no fixed threshold.
+_FAST_RULES = (
+    ('VulnerabilityCount', operator.le, 3, "VulnerabilityCount ({}) > 3"),
+    ('PatchCompliance', operator.ge, 98.0, "PatchCompliance ({}%) < 98%"),
+    ('LintScore', operator.ge, 75, "LintScore ({}) < 75"),
+    ('TestCoverage', operator.ge, 60.0, "TestCoverage ({}%) < 60%"),
+    ('ComplexityScore', operator.le, 12, "ComplexityScore ({}) > 12"),
+    ('UptimePercentage', operator.ge, 98.0, "UptimePercentage ({}%) < 98%"),
+    ('ChangeFailureRate', operator.le, 2.0, "ChangeFailureRate ({}%) > 2%"),
+    ('DocCoverage', operator.ge, 90.0, "DocCoverage ({}%) < 90%"),
+    ('LastUpdated', None, None, None),
+    ('CostTrend', _is_in, _GOOD_COST_TRENDS, "CostTrend is '{}'"),
+    ('UnusedResources', operator.le, 2, "UnusedResources ({}) > 2"),
+)
+
+# One app's metrics, cast once per app; None where a value is missing or
+# could not be converted, so each check can apply its own default
+AppMetrics = namedtuple('AppMetrics', list(_METRIC_TYPES))
+
+# What the HALT and Fast Path checks assume for a missing metric. HALT defaults
+# avoid a false HALT; Fast Path defaults fail the criterion.
+_HALT_DEFAULTS = AppMetrics(
+    VulnerabilityCount=-1, PatchCompliance=101.0, AccessReviewStatus="error",
+    LintScore=101, TestCoverage=101.0, ComplexityScore=-1,
+    UptimePercentage=101.0, ChangeFailureRate=-1.0,
+    MonthlyCostIncreasePercent=-1.0, CostTrend="stable",
+    DocCoverage=None, LastUpdated=None, UnusedResources=None,
+)
+_FAST_DEFAULTS = AppMetrics(
+    VulnerabilityCount=100, PatchCompliance=0.0, AccessReviewStatus=None,
+    LintScore=0, TestCoverage=0.0, ComplexityScore=100,
+    UptimePercentage=0.0, ChangeFailureRate=100.0,
+    MonthlyCostIncreasePercent=None, CostTrend="increasing",
+    DocCoverage=0.0, LastUpdated=None, UnusedResources=100,
+)
+
+_type_of = np.frompyfunc(type, 1, 1)
+
+# The column-wise path stacks the numeric metrics into one float64 matrix and
+# runs the numeric rules as a table of op codes over it. The tables are shared
+# by every evaluation, so they are read-only.
+_NUMERIC_COLUMNS = tuple(column for column, cast in _METRIC_TYPES.items() if cast is not str)
+_OP_CODES = (operator.ge, operator.lt, operator.gt, operator.le, operator.eq)
+_OP_TABLE_DTYPE = np.dtype([('rule', np.intp), ('col', np.intp), ('op', np.uint8), ('thr', np.float64)])
+
+
+def _op_table(rules) -> np.ndarray:
+    """The numeric rules of a (column, op, threshold, reason) table as (rule, col, op, thr) records."""
+    table = np.array([
+        (index, _NUMERIC_COLUMNS.index(column), _OP_CODES.index(op), threshold)
+        for index, (column, op, threshold, _) in enumerate(rules) if column in _NUMERIC_COLUMNS
+    ], dtype=_OP_TABLE_DTYPE)
+    table.setflags(write=False)
+    return table
+
+
+def _default_row(defaults: AppMetrics) -> np.ndarray:
+    """Defaults for the numeric matrix columns; NaN where the checks have none (the column is not read)."""
+    row = np.array([np.nan if getattr(defaults, column) is None else getattr(defaults, column)
+                    for column in _NUMERIC_COLUMNS], dtype=np.float64)
+    row.setflags(write=False)
+    return row
+
+
+_HALT_OPS, _FAST_OPS = _op_table(_HALT_RULES), _op_table(_FAST_RULES)
+_HALT_DEFAULT_ROW, _FAST_DEFAULT_ROW = _default_row(_HALT_DEFAULTS), _default_row(_FAST_DEFAULTS)
+
+
+def _run_ops(ops: np.ndarray, matrix: np.ndarray, masks: np.ndarray) -> None:
+    """Sets masks[:, rule] to whether each row meets the rule, with one comparison per op code."""
+    for code in np.unique(ops['op']).tolist():
+        selected = ops[ops['op'] == code]
+        masks[:, selected['rule']] = _OP_CODES[code](matrix[:, selected['col']], selected['thr'])
+
+
+def _format_each(template: str, values: np.ndarray) -> np.ndarray:
+    """
+    Formats a reason template for each value, once per distinct value.
+
+    Numbers are grouped by bit pattern so that values which compare equal but
+    print differently (0.0 and -0.0) are still formatted apart.
+    """
+    keys = values.view(f'u{values.dtype.itemsize}') if values.dtype.kind in 'iuf' else values
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    texts = np.array([template.format(value) for value in values[first].tolist()], dtype=object)
+    return texts[inverse]
+
+
+class _RecordBuffer(logging.Handler):
+    """Keeps the log records of a worker process so the parent can replay them."""
+
+    def __init__(self):
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Format now: the arguments may not survive pickling back to the parent
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+def _evaluate_chunk(rule: 'GovernancePathRule', raw_data: Dict[str, Dict[str, Any]], app_ids: List[str],
+                    cutoff: datetime) -> Tuple[Dict[str, str], List[logging.LogRecord]]:
+    """Runs in a worker process: evaluates one chunk of apps and returns the results with its log records."""
+    buffer = _RecordBuffer()
+    propagate = logger.propagate
+    logger.addHandler(buffer)
+    logger.propagate = False
+    try:
+        return rule._evaluate_batch(raw_data, app_ids, cutoff), buffer.records
+    finally:
+        logger.removeHandler(buffer)
+        logger.propagate = propagate
+
+
+def _slice_raw_data(raw_data: Dict[str, Dict[str, Any]], app_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Returns the part of {provider_id: {app_id: data}} that covers app_ids."""
+    return {
+        provider_id: {app_id: provider_data[app_id] for app_id in app_ids if app_id in provider_data}
+        for provider_id, provider_data in raw_data.items() if isinstance(provider_data, dict)
+    }
+
+
+def _with_defaults(metrics: AppMetrics, defaults: AppMetrics) -> AppMetrics:
+    """Fills the metrics that were missing or could not be converted from defaults."""
+    return AppMetrics._make([default if value is None else value for value, default in zip(metrics, defaults)])
+
+
+@lru_cache(maxsize=4096)
+def _parse_last_updated(text: str) -> datetime:
+    """
+    Parses a LastUpdated value, ignoring anything after the first space ('YYYY-MM-DD HH:MM:SS').
+
+    Memoized: apps share few distinct dates, and both the per-app and the
+    column-wise checks parse them.
+    """
+    # Same as text.split(' ')[0] without building the list
+    end = text.find(' ')
+    return datetime.fromisoformat(text if end < 0 else text[:end])
+
+
+def _last_updated_reason(last_updated_str: Optional[str], app_id: str, rule_id: str, cutoff: datetime) -> Optional[str]:
+    """Returns why LastUpdated fails the Fast Path (older than cutoff), or None when it is recent enough."""
+    last_updated_date = None
+    if last_updated_str:
+        try:
+            last_updated_date = _parse_last_updated(last_updated_str)
+        except ValueError:
+             logger.warning(f"[{rule_id}] Could not parse LastUpdated date '{last_updated_str}' for app '{app_id}'")
+    if not last_updated_date:
+        return "LastUpdated date missing or invalid"
+    if not (last_updated_date >= cutoff):
+        return f"LastUpdated ({last_updated_date.date()}) > 12 months ago"
+    return None
+
+
+def _last_updated_recent(last_updated_str: Optional[str], cutoff: datetime) -> bool:
+    """True when LastUpdated parses and is not older than cutoff; logs nothing (see _last_updated_reason)."""
+    if not last_updated_str:
+        return False
+    try:
+        return _parse_last_updated(last_updated_str) >= cutoff
+    except ValueError:
+        return False
+
+
+def _meets(op, value, threshold) -> bool:
+    """Whether one value meets a rule table criterion; _is_in is a plain membership test here."""
+    return value in threshold if op is _is_in else op(value, threshold)
+
+
+# The rule tables with each column replaced by its AppMetrics position
+_HALT_CHECKS = tuple((AppMetrics._fields.index(column), op, threshold, template)
+                     for column, op, threshold, template in _HALT_RULES)
+_FAST_CHECKS = tuple((AppMetrics._fields.index(column), op, threshold, template)
+                     for column, op, threshold, template in _FAST_RULES)
+
+
+def _halt_check(metrics: AppMetrics) -> Optional[str]:
+    """
+    Returns the HALT decision for the first HALT check the metrics meet, or None.
+    Missing metrics are expected to hold _HALT_DEFAULTS.
+    """
+    for index, op, threshold, template in _HALT_CHECKS:
+        value = metrics[index]
+        if _meets(op, value, threshold):
+            return f"HALT ({template.format(value)})"
+    if metrics.MonthlyCostIncreasePercent > 15.0 and metrics.CostTrend == "increasing":
+        return f"HALT ({_COST_HALT_REASON.format(metrics.MonthlyCostIncreasePercent)})"
+    return None
+
+
+def _fast_path_check(metrics: AppMetrics, app_id: str, rule_id: str, cutoff: datetime) -> Tuple[bool, str]:
+    """
+    Checks the Fast Path criteria, stopping at the first one that fails (the
+    LastUpdated parse last, as the dearest). Only when one fails are all of
+    them checked again to collect the Slow Path reasons, in _FAST_RULES order.
+    Missing metrics are expected to hold _FAST_DEFAULTS.
+    """
+    for index, op, threshold, _ in _FAST_CHECKS:
+        if op is not None and not _meets(op, metrics[index], threshold):
+            break
+    else:
+        if _last_updated_recent(metrics.LastUpdated, cutoff):
+            return True, 'All criteria met'
+
+    reasons_failed = []
+    for index, op, threshold, template in _FAST_CHECKS:
+        value = metrics[index]
+        if op is None:
+            # LastUpdated: checked against the rolling cutoff
+            reason = _last_updated_reason(value, app_id, rule_id, cutoff)
+            if reason is not None:
+                reasons_failed.append(reason)
+        elif not _meets(op, value, threshold):
+            reasons_failed.append(template.format(value))
+    return False, '; '.join(reasons_failed)
+
+
 class GovernancePathRule(BaseRule):
     """
     Determines the governance path (Fast Path, Slow Path, HALT) for applications
@@ -16,7 +324,7 @@ class GovernancePathRule(BaseRule):
     """
     rule_id = "governance_path_decision" # Identifier for the results
 
-    def apply(self, current_data: Dict[str, Any]) -> Dict[str, Any]:
+    def apply(self, current_data: Dict[str, Any], consolidation: Optional[Consolidation] = None) -> Dict[str, Any]:
         """
         Applies the governance path logic to the raw data.
 
@@ -25,54 +333,287 @@ class GovernancePathRule(BaseRule):
                           {'raw_data': {provider_id: {app_id: data_dict}}}
                           or potentially just {provider_id: {app_id: data_dict}}
                           if passed directly from data_aggregator.
+            consolidation: The consolidation of the same raw data shared by the
+                           rules of one run_rules call; built here when None.
 
         Returns:
             A dictionary containing the governance path decision for each app_id:
             {app_id: 'Fast Path' | 'Slow Path' | 'HALT'}
         """
+        # The rule itself returns only its specific results
+        return dict(self.apply_iter(current_data, consolidation)) # Return {app_id: decision}
+
+    def apply_iter(self, current_data: Dict[str, Any], consolidation: Optional[Consolidation] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Yields the (app_id, decision) pairs apply returns, as they are decided,
+        for callers that write them out rather than keep them all.
+
+        Small batches are decided one app at a time; large ones
+        STREAM_CHUNK_APPS apps at a time.
+        """
         # Check if 'raw_data' key exists, otherwise assume current_data is the raw data dict
         raw_data = current_data.get('raw_data', current_data)
         if not isinstance(raw_data, dict):
              logger.error(f"[{self.rule_id}] Input data is not a dictionary: {type(raw_data)}")
-             return {"error": "Invalid input data format"}
+             yield "error", "Invalid input data format"
+             return
 
-        results = {}
         app_ids = self._get_all_app_ids(raw_data)
         if not app_ids:
             logger.warning(f"[{self.rule_id}] No application IDs found in the raw data.")
-            return {} # Return empty results if no apps        logger.info(f"[{self.rule_id}] Evaluating governance path for {len(app_ids)} apps")
+            return # No results if no apps        logger.info(f"[{self.rule_id}] Evaluating governance path for {len(app_ids)} apps")
+
+        # Documentation older than this misses the Fast Path; fixed for the whole run
+        cutoff = datetime.now() - timedelta(days=365) # Approx 12 months
+        if PARALLEL_WORKERS > 1 and len(app_ids) >= PARALLEL_MIN_APPS:
+            yield from self._evaluate_parallel(raw_data, list(app_ids), cutoff).items()
+        elif len(app_ids) < VECTORIZE_MIN_APPS:
+            yield from self._iter_single_apps(raw_data, app_ids, cutoff, consolidation)
+        else:
+            app_ids = list(app_ids)
+            for start in range(0, len(app_ids), STREAM_CHUNK_APPS):
+                chunk = app_ids[start:start + STREAM_CHUNK_APPS]
+                chunk_data = raw_data if len(chunk) == len(app_ids) else _slice_raw_data(raw_data, chunk)
+                yield from self._evaluate_batch(chunk_data, chunk, cutoff).items()
 
+        logger.info(f"[{self.rule_id}] Governance path evaluation complete.")
+
+    def _evaluate_batch(self, raw_data: Dict[str, Dict[str, Any]], app_ids, cutoff: datetime) -> Dict[str, str]:
+        """Decides the governance path for app_ids, column-wise if there are enough of them."""
+        if len(app_ids) >= VECTORIZE_MIN_APPS:
+            return self._evaluate_vectorized(raw_data, list(app_ids), cutoff)
+        return dict(self._iter_single_apps(raw_data, app_ids, cutoff))
+
+    def _iter_single_apps(self, raw_data: Dict[str, Dict[str, Any]], app_ids, cutoff: datetime,
+                          consolidation: Optional[Consolidation] = None) -> Iterator[Tuple[str, str]]:
+        """Decides the governance path for app_ids one app at a time, yielding (app_id, decision)."""
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Data for every app from all providers, gathered in one walk over raw_data
+        consolidated = self._consolidate(raw_data, consolidation)
         for app_id in app_ids:
-            # Extract data for the current app from all providers
-            app_data = self._get_data_for_app(raw_data, app_id)
-
-            # Evaluate HALT conditions first
-            halt_reason = self._check_halt_conditions(app_data, app_id)
-            if halt_reason:
-                results[app_id] = f"HALT ({halt_reason})"
-                logger.debug(f"[{self.rule_id}] App '{app_id}' -> HALT ({halt_reason})")
-                continue # Skip Fast Path check if HALTed
-
-            # Evaluate Fast Path conditions
-            fast_path_met, fast_path_details = self._check_fast_path_conditions(app_data, app_id)
-            if fast_path_met:
-                results[app_id] = "Fast Path"
-                logger.debug(f"[{self.rule_id}] App '{app_id}' -> Fast Path")
-            else:
-                results[app_id] = f"Slow Path (Reason: {fast_path_details})" # Default to Slow Path if not HALT or Fast Path
-                logger.debug(f"[{self.rule_id}] App '{app_id}' -> Slow Path (Reason: {fast_path_details})")
+            decision = self._evaluate_single_app(consolidated[app_id], app_id, cutoff)
+            if debug:
+                logger.debug("[%s] App '%s' -> %s", self.rule_id, app_id, decision)
+            yield app_id, decision
 
-        logger.info(f"[{self.rule_id}] Governance path evaluation complete.")
-        # The rule itself returns only its specific results
-        return results # Return {app_id: decision}
+    def _evaluate_parallel(self, raw_data: Dict[str, Dict[str, Any]], app_ids: List[str], cutoff: datetime) -> Dict[str, str]:
+        """
+        Splits app_ids into one chunk per worker process and evaluates the
+        chunks concurrently. Each worker only receives its own apps' data.
+        Log records raised in the workers are replayed here, chunk by chunk.
+        """
+        size = -(-len(app_ids) // PARALLEL_WORKERS)
+        chunks = [app_ids[start:start + size] for start in range(0, len(app_ids), size)]
+        results = {}
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [executor.submit(_evaluate_chunk, self, _slice_raw_data(raw_data, chunk), chunk, cutoff) for chunk in chunks]
+            # Collected in submission order so results keep the order of app_ids
+            for future in futures:
+                chunk_results, records = future.result()
+                for record in records:
+                    logger.handle(record)
+                results.update(chunk_results)
+        return results
+
+    def _evaluate_single_app(self, app_data: Dict[str, Any], app_id: str, cutoff: datetime) -> str:
+        """Decides the governance path for one app from its consolidated data. Callers log the decision."""
+        metrics = self._extract_metrics(app_data)
+
+        # Evaluate HALT conditions first
+        halt_metrics = fast_metrics = metrics
+        if None in metrics:
+            halt_metrics = _with_defaults(metrics, _HALT_DEFAULTS)
+            fast_metrics = _with_defaults(metrics, _FAST_DEFAULTS)
+        halt_decision = self._check_halt_conditions(halt_metrics, app_id)
+        if halt_decision:
+            return halt_decision # Skip Fast Path check if HALTed
+
+        # Evaluate Fast Path conditions
+        fast_path_met, fast_path_details = self._check_fast_path_conditions(fast_metrics, app_id, cutoff)
+        if fast_path_met:
+            return "Fast Path"
+        return f"Slow Path (Reason: {fast_path_details})" # Default to Slow Path if not HALT or Fast Path
+
+    def _cast_column(self, column: str, cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Casts one object column the way _extract_metrics casts a single value.
 
-    def _get_all_app_ids(self, raw_data: Dict[str, Dict[str, Any]]) -> set:
-        """Extracts all unique app_ids present in the raw data."""
-        all_ids = set()
-        for provider_data in raw_data.values():
-            if isinstance(provider_data, dict):
-                all_ids.update(provider_data.keys())
-        return all_ids
+        Returns (values, missing, unsupported). Missing cells take each check's
+        default. Unsupported cells are ones this cast does not reproduce exactly
+        (strings in numeric columns, ints beyond int64...); their apps are
+        evaluated one at a time instead.
+        """
+        expected_type = _METRIC_TYPES[column]
+        if expected_type is not str:
+            # Fully populated numeric columns (the usual case) are recognised by
+            # pandas' compiled type inference and cast in one C pass, without
+            # looking at each cell's type from Python
+            kind = infer_dtype(cells, skipna=False)
+            if kind == 'integer' or (expected_type is float and kind in ('floating', 'mixed-integer-float')):
+                try:
+                    values = cells.astype(np.int64 if expected_type is int else np.float64)
+                except OverflowError:
+                    pass # Beyond int64 / float64: sorted out cell by cell below
+                else:
+                    return values, np.zeros(len(cells), dtype=bool), np.zeros(len(cells), dtype=bool)
+        types = _type_of(cells)
+        missing = types == type(None)
+        if expected_type is str:
+            values = cells.copy()
+            other = ~(missing | (types == str))
+            if other.any():
+                values[other] = np.array([str(cell) for cell in cells[other]], dtype=object)
+            return values, missing, np.zeros(len(cells), dtype=bool)
+
+        is_int = types == int
+        is_float = types == float
+        unsupported = ~(missing | is_int | is_float)
+        if expected_type is float:
+            values = np.zeros(len(cells), dtype=np.float64)
+            values[is_float] = cells[is_float].astype(np.float64)
+            try:
+                values[is_int] = cells[is_int].astype(np.float64)
+            except OverflowError:
+                unsupported |= is_int
+            return values, missing, unsupported
+
+        values = np.zeros(len(cells), dtype=np.int64)
+        try:
+            values[is_int] = cells[is_int].astype(np.int64)
+        except OverflowError:
+            unsupported |= is_int
+        floats = cells[is_float].astype(np.float64)
+        # int() truncates finite floats and rejects NaN (the default is used);
+        # anything too large for int64 is left to _extract_metrics
+        is_nan = np.isnan(floats)
+        in_range = np.abs(floats) < 2.0 ** 63
+        values[is_float] = np.where(in_range, floats, 0).astype(np.int64)
+        nan_rows = np.flatnonzero(is_float)[is_nan]
+        if len(nan_rows):
+            logger.warning("[%s] Could not convert %d '%s' values to int. Using defaults.", self.rule_id, len(nan_rows), column)
+            missing[nan_rows] = True
+        unsupported[np.flatnonzero(is_float)[~is_nan & ~in_range]] = True
+        return values, missing, unsupported
+
+    def _last_updated_reasons(self, cells: np.ndarray, cutoff: datetime) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the Fast Path reason (or None) for each LastUpdated cell.
+
+        Each distinct value is parsed once. Also returns which rows held an
+        unparseable date, for the warning, and which could not be compared
+        with the cutoff (timezone-aware dates), for the per-app path.
+        """
+        codes, uniques = pd.factorize(cells)
+        reasons = []
+        invalid = []
+        uncomparable = []
+        for text in uniques.tolist():
+            last_updated_date = None
+            if text:
+                try:
+                    last_updated_date = _parse_last_updated(text)
+                except ValueError:
+                    pass
+            invalid.append(bool(text) and last_updated_date is None)
+            try:
+                if last_updated_date is None:
+                    reasons.append("LastUpdated date missing or invalid")
+                elif not (last_updated_date >= cutoff):
+                    reasons.append(f"LastUpdated ({last_updated_date.date()}) > 12 months ago")
+                else:
+                    reasons.append(None)
+                uncomparable.append(False)
+            except TypeError:
+                reasons.append(None)
+                uncomparable.append(True)
+        # Missing values factorize to -1, which picks up the trailing entries
+        reasons.append("LastUpdated date missing or invalid")
+        invalid.append(False)
+        uncomparable.append(False)
+        return (np.array(reasons, dtype=object)[codes], np.array(invalid)[codes],
+                np.array(uncomparable)[codes])
+
+    def _evaluate_vectorized(self, raw_data: Dict[str, Dict[str, Any]], app_ids: List[str], cutoff: datetime) -> Dict[str, str]:
+        """
+        Decides the governance path for every app at once.
+
+        Each HALT and Fast Path check is one comparison over a metric column;
+        reason strings are only built for the apps a check actually fails.
+        Apps with cells the column casts do not handle go through
+        _evaluate_single_app.
+        """
+        table = AppTable.from_raw_data(raw_data, app_ids, _METRIC_TYPES)
+        count = len(app_ids)
+        columns = {}
+        # Filled in place as each column is cast (column-major, so each write is contiguous)
+        numeric = np.empty((count, len(_NUMERIC_COLUMNS)), dtype=np.float64, order='F')
+        numeric_missing = np.empty((count, len(_NUMERIC_COLUMNS)), dtype=bool, order='F')
+        per_app = np.zeros(count, dtype=bool)
+        for column in _METRIC_TYPES:
+            values, missing, unsupported = self._cast_column(column, table.columns[column])
+            columns[column] = (values, missing)
+            if column in _NUMERIC_COLUMNS:
+                index = _NUMERIC_COLUMNS.index(column)
+                numeric[:, index] = values
+                numeric_missing[:, index] = missing
+            per_app |= unsupported
+
+        def with_default(column, default):
+            values, missing = columns[column]
+            return np.where(missing, default, values) if missing.any() else values
+
+
+        # One column per HALT rule, plus the cost rule last
+        halt_masks = np.zeros((count, len(_HALT_RULES) + 1), dtype=bool)
+        _run_ops(_HALT_OPS, np.where(numeric_missing, _HALT_DEFAULT_ROW, numeric), halt_masks)
+        for index, (column, op, threshold, _) in enumerate(_HALT_RULES):
+            if column not in _NUMERIC_COLUMNS:
+                halt_masks[:, index] = op(with_default(column, getattr(_HALT_DEFAULTS, column)), threshold)
+        cost_increase = with_default('MonthlyCostIncreasePercent', _HALT_DEFAULTS.MonthlyCostIncreasePercent)
+        halt_masks[:, -1] = (cost_increase > 15.0) & (with_default('CostTrend', _HALT_DEFAULTS.CostTrend) == "increasing")
+        # HaltReason of the first HALT check met, or -1
+        halted = halt_masks.any(axis=1)
+        halt_code = np.where(halted, halt_masks.argmax(axis=1), -1)
+
+        fast_met = np.zeros((count, len(_FAST_RULES)), dtype=bool)
+        _run_ops(_FAST_OPS, np.where(numeric_missing, _FAST_DEFAULT_ROW, numeric), fast_met)
+        slow = ~halted & ~per_app
+        reasons = np.full(count, "", dtype=object)
+        for index, (column, op, threshold, template) in enumerate(_FAST_RULES):
+            if column == 'LastUpdated':
+                date_reasons, invalid, uncomparable = self._last_updated_reasons(columns[column][0], cutoff)
+                # Halted apps never reach the date check in _evaluate_single_app
+                per_app |= uncomparable & ~halted
+                slow &= ~per_app
+                for row in np.flatnonzero(invalid & slow).tolist():
+                    logger.warning(f"[{self.rule_id}] Could not parse LastUpdated date '{columns[column][0][row]}' for app '{app_ids[row]}'")
+                rows = np.flatnonzero(np.not_equal(date_reasons, None) & slow)
+                texts = date_reasons[rows]
+            else:
+                if column not in _NUMERIC_COLUMNS:
+                    fast_met[:, index] = op(with_default(column, getattr(_FAST_DEFAULTS, column)), threshold)
+                rows = np.flatnonzero(~fast_met[:, index] & slow)
+                texts = _format_each(template, with_default(column, getattr(_FAST_DEFAULTS, column))[rows])
+            if len(rows):
+                reasons[rows] = np.where(reasons[rows] == "", texts, reasons[rows] + "; " + texts)
+
+        decisions = np.full(count, "Fast Path", dtype=object)
+        slow_rows = reasons != ""
+        decisions[slow_rows] = "Slow Path (Reason: " + reasons[slow_rows] + ")"
+        halt_rows = np.flatnonzero(halted & ~per_app)
+        for code in HaltReason:
+            rows = halt_rows[halt_code[halt_rows] == code]
+            if len(rows):
+                column, template = _HALT_REASON_FORMATS[code]
+                values = with_default(column, getattr(_HALT_DEFAULTS, column))[rows]
+                decisions[rows] = "HALT (" + _format_each(template, values) + ")"
+        for row in np.flatnonzero(per_app).tolist():
+            app_id = app_ids[row]
+            decisions[row] = self._evaluate_single_app(self._get_data_for_app(raw_data, app_id), app_id, cutoff)
+        if logger.isEnabledFor(logging.DEBUG):
+            for app_id, decision in zip(app_ids, decisions.tolist()):
+                logger.debug("[%s] App '%s' -> %s", self.rule_id, app_id, decision)
+        return dict(zip(app_ids, decisions.tolist()))
 
     def _get_data_for_app(self, raw_data: Dict[str, Dict[str, Any]], app_id: str) -> Dict[str, Any]:
         """Consolidates data from all providers for a specific app_id."""
@@ -83,115 +624,36 @@ class GovernancePathRule(BaseRule):
                  consolidated.update(provider_data[app_id])
         return consolidated
 
-    def _get_value(self, data: Dict[str, Any], key: str, expected_type: type, default: Any = None) -> Any:
-        """Safely retrieves and converts a value from the data dictionary."""
-        value = data.get(key)
-        if value is None:
-            # logger.warning(f"[{self.rule_id}] Missing key '{key}' for app. Using default: {default}")
-            return default
-        try:
-            if expected_type is bool: # Handle boolean strings
-                 if isinstance(value, str):
-                     if value.lower() == 'true': return True
-                     if value.lower() == 'false': return False
-                 # Fallback to standard bool conversion
-                 return bool(value)
-            if expected_type is datetime:
-                # Attempt to parse various date formats if needed, assuming ISO format for now
-                return datetime.fromisoformat(str(value).split(' ')[0]) # Handle 'YYYY-MM-DD HH:MM:SS'
-            return expected_type(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"[{self.rule_id}] Could not convert key '{key}' (value: {value}) to {expected_type.__name__}. Using default: {default}. Error: {e}")
-            return default
-
-    def _check_halt_conditions(self, data: Dict[str, Any], app_id: str) -> Optional[str]:
-        """Checks if any HALT condition is met."""
-        # Security HALT
-        vuln_count = self._get_value(data, 'VulnerabilityCount', int, -1)
-        patch_comp = self._get_value(data, 'PatchCompliance', float, 101.0) # Default high to avoid false halt
-        access_rev = self._get_value(data, 'AccessReviewStatus', str, "error")
-
-        if vuln_count >= 10: return f"VulnerabilityCount ({vuln_count}) >= 10"
-        if patch_comp < 95.0: return f"PatchCompliance ({patch_comp}%) < 95%"
-        if access_rev != "completed": return f"AccessReviewStatus is '{access_rev}' (not 'completed')"
-
-        # Code Quality HALT
-        lint_score = self._get_value(data, 'LintScore', int, 101) # Default high
-        test_cov = self._get_value(data, 'TestCoverage', float, 101.0) # Default high
-        comp_score = self._get_value(data, 'ComplexityScore', int, -1) # Default low
-
-        if lint_score < 60: return f"LintScore ({lint_score}) < 60"
-        if test_cov < 40.0: return f"TestCoverage ({test_cov}%) < 40%"
-        if comp_score > 25: return f"ComplexityScore ({comp_score}) > 25"
-
-        # Operational HALT
-        uptime = self._get_value(data, 'UptimePercentage', float, 101.0) # Default high
-        fail_rate = self._get_value(data, 'ChangeFailureRate', float, -1.0) # Default low
-
-        if uptime < 95.0: return f"UptimePercentage ({uptime}%) < 95%"
-        if fail_rate > 5.0: return f"ChangeFailureRate ({fail_rate}%) > 5%"
-
-        # Cost HALT
-        cost_increase = self._get_value(data, 'MonthlyCostIncreasePercent', float, -1.0) # Default low
-        cost_trend = self._get_value(data, 'CostTrend', str, "stable")
-
-        if cost_increase > 15.0 and cost_trend == "increasing":
-             return f"MonthlyCostIncrease ({cost_increase}%) > 15% AND CostTrend is 'increasing'"
-
-        return None # No HALT conditions met
-
-    def _check_fast_path_conditions(self, data: Dict[str, Any], app_id: str) -> (bool, str):
-        """Checks if ALL Fast Path conditions are met."""
-        reasons_failed = []
-
-        # Security Fast Path
-        vuln_count = self._get_value(data, 'VulnerabilityCount', int, 100) # Default high to fail fast path
-        patch_comp = self._get_value(data, 'PatchCompliance', float, 0.0) # Default low
-        if not (vuln_count <= 3): reasons_failed.append(f"VulnerabilityCount ({vuln_count}) > 3")
-        if not (patch_comp >= 98.0): reasons_failed.append(f"PatchCompliance ({patch_comp}%) < 98%")
-
-        # Code Quality Fast Path
-        lint_score = self._get_value(data, 'LintScore', int, 0) # Default low
-        test_cov = self._get_value(data, 'TestCoverage', float, 0.0) # Default low
-        comp_score = self._get_value(data, 'ComplexityScore', int, 100) # Default high
-        if not (lint_score >= 75): reasons_failed.append(f"LintScore ({lint_score}) < 75")
-        if not (test_cov >= 60.0): reasons_failed.append(f"TestCoverage ({test_cov}%) < 60%")
-        if not (comp_score <= 12): reasons_failed.append(f"ComplexityScore ({comp_score}) > 12")
-
-        # Operational Fast Path
-        uptime = self._get_value(data, 'UptimePercentage', float, 0.0) # Default low
-        fail_rate = self._get_value(data, 'ChangeFailureRate', float, 100.0) # Default high
-        if not (uptime >= 98.0): reasons_failed.append(f"UptimePercentage ({uptime}%) < 98%")
-        if not (fail_rate <= 2.0): reasons_failed.append(f"ChangeFailureRate ({fail_rate}%) > 2%")
-
-        # Documentation Fast Path
-        doc_cov = self._get_value(data, 'DocCoverage', float, 0.0) # Default low
-        last_updated_str = self._get_value(data, 'LastUpdated', str, None)
-        last_updated_date = None
-        if last_updated_str:
+    def _extract_metrics(self, data: Dict[str, Any]) -> AppMetrics:
+        """Reads and casts every metric the checks use, in one pass over the app's data."""
+        get = data.get
+        values = []
+        for key, cast in _METRIC_TYPES.items():
+            value = get(key)
+            # Values that already have the expected type need no cast
+            if value is None or type(value) is cast:
+                values.append(value)
+                continue
             try:
-                last_updated_date = datetime.fromisoformat(last_updated_str.split(' ')[0])
-            except ValueError:
-                 logger.warning(f"[{self.rule_id}] Could not parse LastUpdated date '{last_updated_str}' for app '{app_id}'")
-
-        if not (doc_cov >= 90.0): reasons_failed.append(f"DocCoverage ({doc_cov}%) < 90%")
-        if last_updated_date:
-            if not (last_updated_date >= datetime.now() - timedelta(days=365)): # Approx 12 months
-                reasons_failed.append(f"LastUpdated ({last_updated_date.date()}) > 12 months ago")
-        else:
-             reasons_failed.append("LastUpdated date missing or invalid")
+                values.append(cast(value))
+            except (ValueError, TypeError, OverflowError) as e:
+                logger.warning(f"[{self.rule_id}] Could not convert key '{key}' (value: {value}) to {cast.__name__}. Using default. Error: {e}")
+                values.append(None)
+        return AppMetrics._make(values)
 
+    def _check_halt_conditions(self, metrics: AppMetrics, app_id: str) -> Optional[str]:
+        """
+        Checks if any HALT condition is met, returning the HALT decision for the first
+        one or None. Missing metrics are expected to hold _HALT_DEFAULTS.
+        """
+        return _halt_check(metrics)
 
-        # Cost Fast Path
-        cost_trend = self._get_value(data, 'CostTrend', str, "increasing") # Default bad
-        unused_res = self._get_value(data, 'UnusedResources', int, 100) # Default high
-        if not (cost_trend in ["stable", "decreasing"]): reasons_failed.append(f"CostTrend is '{cost_trend}'")
-        if not (unused_res <= 2): reasons_failed.append(f"UnusedResources ({unused_res}) > 2")
-
-        if not reasons_failed:
-            return True, "All criteria met"
-        else:
-            return False, "; ".join(reasons_failed)
+    def _check_fast_path_conditions(self, metrics: AppMetrics, app_id: str, cutoff: datetime) -> (bool, str):
+        """
+        Checks if ALL Fast Path conditions are met. Missing metrics are expected to hold
+        _FAST_DEFAULTS; documentation last updated before cutoff is stale.
+        """
+        return _fast_path_check(metrics, app_id, self.rule_id, cutoff)
 
 # Example Usage (if run directly, though usually loaded by rules_engine)
 if __name__ == '__main__':
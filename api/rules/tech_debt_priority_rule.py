@@ -1,13 +1,47 @@
 \
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Any, Optional, Tuple
+
+import numpy as np
 
 # Use absolute import for BaseRule
-from rules.base_rule import BaseRule
+from rules.base_rule import BaseRule, Consolidation
 
 logger = logging.getLogger(__name__)
 
+# Types _get_value returns unchanged when a value already has exactly that type
+_PLAIN_TYPES = frozenset({int, float, str})
+
+# (key, expected type, default) of every value the priority checks read
+_FIELDS = (
+    ('MaintainabilityIndex', int, 100), # Default high (good)
+    ('ComplexityScore', int, 0), # Default low (good)
+    ('MonthlyCost', float, 0.0),
+    ('ChangeFailureRate', float, 0.0),
+    ('UptimePercentage', float, 100.0), # Default high (good)
+    ('TestCoverage', float, 100.0), # Default high (good)
+    ('LastUpdated', str, None),
+    ('DocCoverage', float, 0.0), # Default low
+    ('DeploymentFrequency', str, "unknown"),
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(text: str) -> datetime:
+    """
+    Parses the date part of text, i.e. up to the first space ('YYYY-MM-DD HH:MM:SS').
+    Memoized: many apps share the same dates.
+    """
+    # Same as text.split(' ')[0] without building the list
+    end = text.find(' ')
+    return datetime.fromisoformat(text if end < 0 else text[:end])
+
+def _midnight(value: datetime) -> datetime:
+    """The date of an already-parsed datetime (e.g. a pandas Timestamp), as _parse_date(str(value)) gives it."""
+    return datetime(value.year, value.month, value.day)
+
 # Define an order for deployment frequencies for comparison
 DEPLOYMENT_FREQUENCY_ORDER = {
     "daily": 5,
@@ -20,12 +54,53 @@ DEPLOYMENT_FREQUENCY_ORDER = {
     "ad-hoc": -1, # Lower than any regular frequency
     "unknown": -2
 }
+# Codes apply_compact gives each priority tier
+PRIORITY_CODES = {"Low Priority": 0, "Medium Priority": 1, "High Priority": 2}
+
+# Other names the frequencies go by
+_FREQUENCY_ALIASES = {"bi-weekly": ("biweekly",)}
+
+def _frequency_ranks() -> Dict[str, int]:
+    """
+    Ranks by spelling: the normalized form (lower case, '-' as '_') of every name, plus the
+    common spellings as they are, which get_deployment_frequency_rank then finds without normalizing.
+    """
+    ranks = {}
+    for name, rank in DEPLOYMENT_FREQUENCY_ORDER.items():
+        for alias in (name,) + _FREQUENCY_ALIASES.get(name, ()):
+            for spelling in (alias, alias.replace('-', '_')):
+                ranks[spelling] = ranks[spelling.capitalize()] = rank
+    return ranks
+
+_FREQUENCY_RANKS = _frequency_ranks()
+_UNKNOWN_RANK = DEPLOYMENT_FREQUENCY_ORDER["unknown"]
+_WEEKLY_RANK = DEPLOYMENT_FREQUENCY_ORDER["weekly"]
 
 def get_deployment_frequency_rank(freq_str: Optional[str]) -> int:
     """Converts a deployment frequency string to a comparable rank."""
     if not freq_str:
-        return DEPLOYMENT_FREQUENCY_ORDER["unknown"]
-    return DEPLOYMENT_FREQUENCY_ORDER.get(freq_str.lower().replace('-', '_'), DEPLOYMENT_FREQUENCY_ORDER["unknown"])
+        return _UNKNOWN_RANK
+    rank = _FREQUENCY_RANKS.get(freq_str)
+    if rank is None:
+        rank = _FREQUENCY_RANKS.get(freq_str.lower().replace('-', '_'), _UNKNOWN_RANK)
+    return rank
+
+
+def _financial_impact_reason(monthly_cost: float, fail_rate: float, uptime: float) -> str:
+    """Reason for the Financial Impact High Priority check."""
+    reason = f"Financial Impact (MonthlyCost=${monthly_cost:,.2f}"
+    if fail_rate > 1.0: reason += f", ChangeFailureRate={fail_rate}%"
+    if uptime < 99.0: reason += f", UptimePercentage={uptime}%"
+    return reason + ")"
+
+
+def _technical_indicators_reason(maint_index: int, comp_score: int, maint_check: bool, comp_check: bool) -> str:
+    """Reason for the Technical Indicators Medium Priority check."""
+    tech_reason = "Technical Indicators ("
+    if maint_check: tech_reason += f"MaintainabilityIndex={maint_index}"
+    if maint_check and comp_check: tech_reason += ", "
+    if comp_check: tech_reason += f"ComplexityScore={comp_score}"
+    return tech_reason + ")"
 
 
 class TechDebtPriorityRule(BaseRule):
@@ -35,7 +110,13 @@ class TechDebtPriorityRule(BaseRule):
     """
     rule_id = "tech_debt_priority" # Identifier for the results
 
-    def apply(self, current_data: Dict[str, Any]) -> Dict[str, Any]:
+    def __init__(self):
+        super().__init__()
+        # The conversion for each value the checks read, built once: {key: coerce(value)}
+        self._coercers = {key: self._make_coercer(key, expected_type, default) for key, expected_type, default in _FIELDS}
+        self._coerce_last_updated_date = self._make_coercer('LastUpdated', datetime, None)
+
+    def apply(self, current_data: Dict[str, Any], consolidation: Optional[Consolidation] = None) -> Dict[str, Any]:
         """
         Applies the technical debt priority logic to the raw data.
 
@@ -43,6 +124,8 @@ class TechDebtPriorityRule(BaseRule):
             current_data: The dictionary containing raw data, expected structure:
                           {'raw_data': {provider_id: {app_id: data_dict}}}
                           or potentially just {provider_id: {app_id: data_dict}}.
+            consolidation: The consolidation of the same raw data shared by the
+                           rules of one run_rules call; built here when None.
 
         Returns:
             A dictionary containing the tech debt priority for each app_id:
@@ -53,6 +136,9 @@ class TechDebtPriorityRule(BaseRule):
              logger.error(f"[{self.rule_id}] Input data is not a dictionary: {type(raw_data)}")
              return {"error": "Invalid input data format"}
 
+        # Documentation older than this is outdated; fixed for the whole run
+        nine_months_ago = datetime.now() - timedelta(days=9*30) # Approximate 9 months
+
         results = {}
         app_ids = self._get_all_app_ids(raw_data)
         if not app_ids:            
@@ -61,37 +147,55 @@ class TechDebtPriorityRule(BaseRule):
             
         logger.info(f"[{self.rule_id}] Evaluating tech debt priority for {len(app_ids)} apps")
 
+        debug = logger.isEnabledFor(logging.DEBUG)
+        consolidated = self._consolidate(raw_data, consolidation)
+        # App by app rather than column-wise like GovernancePathRule: only copying the
+        # nine values into columns already costs about as much as this whole loop
         for app_id in app_ids:
-            app_data = self._get_data_for_app(raw_data, app_id)
-
-            # Evaluate High Priority conditions first
-            is_high, high_reason = self._check_high_priority(app_data, app_id)
-            if is_high:
-                results[app_id] = f"High Priority ({high_reason})"
-                logger.debug(f"[{self.rule_id}] App '{app_id}' -> High Priority ({high_reason})")
-                continue
-
-            # Evaluate Medium Priority conditions if not High
-            is_medium, medium_reason = self._check_medium_priority(app_data, app_id)
-            if is_medium:
-                results[app_id] = f"Medium Priority ({medium_reason})"
-                logger.debug(f"[{self.rule_id}] App '{app_id}' -> Medium Priority ({medium_reason})")
-                continue
-
-            # Default to Low Priority
-            results[app_id] = "Low Priority"
-            logger.debug(f"[{self.rule_id}] App '{app_id}' -> Low Priority")
+            results[app_id] = decision = self._evaluate_single_app(consolidated[app_id], app_id, nine_months_ago)
+            if debug:
+                logger.debug("[%s] App '%s' -> %s", self.rule_id, app_id, decision)
 
         logger.info(f"[{self.rule_id}] Tech debt priority evaluation complete.")
         return results
 
-    def _get_all_app_ids(self, raw_data: Dict[str, Dict[str, Any]]) -> set:
-        """Extracts all unique app_ids present in the raw data."""
-        all_ids = set()
-        for provider_data in raw_data.values():
-            if isinstance(provider_data, dict):
-                all_ids.update(provider_data.keys())
-        return all_ids
+    def apply_compact(self, current_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        apply's results in a compact form, for consumers that mostly need the tier:
+        {'app_ids': [app_id, ...], 'codes': int8 array of PRIORITY_CODES in app_ids
+        order, 'reasons': {app_id: reason}} with a reason only for Medium and High
+        Priority apps ("High Priority (<reason>)" in apply's results).
+        Invalid input gives apply's error dict.
+        """
+        results = self.apply(current_data)
+        if not isinstance(current_data.get('raw_data', current_data), dict):
+            return results
+        codes = []
+        reasons = {}
+        for app_id, decision in results.items():
+            tier, _, reason = decision.partition(' (')
+            codes.append(PRIORITY_CODES[tier])
+            if reason:
+                reasons[app_id] = reason[:-1]
+        return {'app_ids': list(results), 'codes': np.array(codes, dtype=np.int8), 'reasons': reasons}
+
+    def _evaluate_single_app(self, app_data: Dict[str, Any], app_id: str, nine_months_ago: datetime) -> str:
+        """Decides the tech debt priority for one app from its consolidated data. Callers log the decision."""
+        # Values the High Priority checks convert, reused by the Medium Priority checks
+        coerced = {}
+
+        # Evaluate High Priority conditions first
+        is_high, high_reason = self._check_high_priority(app_data, app_id, coerced)
+        if is_high:
+            return f"High Priority ({high_reason})"
+
+        # Evaluate Medium Priority conditions if not High
+        is_medium, medium_reason = self._check_medium_priority(app_data, app_id, nine_months_ago, coerced)
+        if is_medium:
+            return f"Medium Priority ({medium_reason})"
+
+        # Default to Low Priority
+        return "Low Priority"
 
     def _get_data_for_app(self, raw_data: Dict[str, Dict[str, Any]], app_id: str) -> Dict[str, Any]:
         """Consolidates data from all providers for a specific app_id."""
@@ -104,88 +208,135 @@ class TechDebtPriorityRule(BaseRule):
 
     def _get_value(self, data: Dict[str, Any], key: str, expected_type: type, default: Any = None) -> Any:
         """Safely retrieves and converts a value from the data dictionary."""
-        value = data.get(key)
-        if value is None:
-            # logger.warning(f"[{self.rule_id}] Missing key '{key}' for app. Using default: {default}")
-            return default
-        try:
-            if expected_type is bool:
-                 if isinstance(value, str):
-                     if value.lower() == 'true': return True
-                     if value.lower() == 'false': return False
-                 return bool(value)
-            if expected_type is datetime:
-                 # Handle potential timezone info or different formats if necessary
-                 date_str = str(value).split(' ')[0] # Get YYYY-MM-DD part
-                 return datetime.fromisoformat(date_str)            
-            if expected_type is float:
-                 # Remove potential currency symbols or commas for cost
-                 if isinstance(value, str):
-                     # Check if the string contains only digits, separators and decimal points
-                     cleaned_value = value.replace('$', '').replace(',', '')
-                     if not any(c.isalpha() for c in cleaned_value):
-                         try:
-                             return float(cleaned_value)
-                         except ValueError:
-                             logger.warning(f"[{self.rule_id}] Non-numeric string '{value}' cannot be converted to float. Using default: {default}")
-                             return default
-                     else:
-                         logger.warning(f"[{self.rule_id}] String '{value}' contains letters, cannot convert to float. Using default: {default}")
-                         return default
-                 elif isinstance(value, (int, float)):
-                     return float(value)
-                 else:
-                     logger.warning(f"[{self.rule_id}] Unsupported type {type(value)} for float conversion. Using default: {default}")
-                     return default
-            if expected_type is int:
-                 if isinstance(value, str):
-                     # Check if the string contains only digits and separators
-                     cleaned_value = value.replace(',', '')
-                     if not any(c.isalpha() for c in cleaned_value):
-                         try:
-                             return int(float(cleaned_value))
-                         except ValueError:
-                             logger.warning(f"[{self.rule_id}] Non-numeric string '{value}' cannot be converted to int. Using default: {default}")
-                             return default
-                     else:
-                         logger.warning(f"[{self.rule_id}] String '{value}' contains letters, cannot convert to int. Using default: {default}")
-                         return default
-                 elif isinstance(value, (int, float)):
-                     return int(value)
-                 else:
-                     logger.warning(f"[{self.rule_id}] Unsupported type {type(value)} for int conversion. Using default: {default}")
-                     return default
-            # For other types, try direct conversion but with better error handling
-            try:
-                return expected_type(value)
-            except (ValueError, TypeError):
-                logger.warning(f"[{self.rule_id}] Cannot convert value '{value}' to {expected_type.__name__}. Using default: {default}")
-                return default
-        except (ValueError, TypeError) as e:
-            logger.warning(f"[{self.rule_id}] Could not convert key '{key}' (value: {value}, type: {type(value)}) to {expected_type.__name__}. Using default: {default}. Error: {e}")
+        return self._make_coercer(key, expected_type, default)(data.get(key))
+
+    def _make_coercer(self, key: str, expected_type: type, default: Any = None) -> Callable[[Any], Any]:
+        """
+        Builds the conversion _get_value applies to the value of key, specialized
+        to expected_type and default: a missing value gives the default, and one
+        that cannot be converted logs a warning and gives the default.
+        """
+        rule_id = self.rule_id
+
+        def failed(value, e):
+            logger.warning(f"[{rule_id}] Could not convert key '{key}' (value: {value}, type: {type(value)}) to {expected_type.__name__}. Using default: {default}. Error: {e}")
             return default
 
-    def _check_high_priority(self, data: Dict[str, Any], app_id: str) -> Tuple[bool, str]:
-        """Checks if any High Priority condition is met."""
+        if expected_type is float:
+            def coerce(value):
+                if type(value) is float:
+                    return value # Already converted (e.g. numbers parsed by the CSV loader)
+                if value is None:
+                    return default
+                try:
+                    # Remove potential currency symbols or commas for cost
+                    if isinstance(value, str):
+                        # Check if the string contains only digits, separators and decimal points
+                        cleaned_value = value.replace('$', '').replace(',', '')
+                        if cleaned_value.lstrip('-').replace('.', '', 1).isdigit():
+                            # Plain digits: no letters to look for (other digit characters still go the long way)
+                            try:
+                                return float(cleaned_value)
+                            except ValueError:
+                                pass
+                        if any(map(str.isalpha, cleaned_value)):
+                            logger.warning(f"[{rule_id}] String '{value}' contains letters, cannot convert to float. Using default: {default}")
+                            return default
+                        try:
+                            return float(cleaned_value)
+                        except ValueError:
+                            logger.warning(f"[{rule_id}] Non-numeric string '{value}' cannot be converted to float. Using default: {default}")
+                            return default
+                    if isinstance(value, (int, float)):
+                        return float(value)
+                    logger.warning(f"[{rule_id}] Unsupported type {type(value)} for float conversion. Using default: {default}")
+                    return default
+                except (ValueError, TypeError) as e:
+                    return failed(value, e)
+        elif expected_type is int:
+            def coerce(value):
+                if type(value) is int:
+                    return value
+                if value is None:
+                    return default
+                try:
+                    if isinstance(value, str):
+                        # Check if the string contains only digits and separators
+                        cleaned_value = value.replace(',', '')
+                        if cleaned_value.lstrip('-').replace('.', '', 1).isdigit():
+                            # Plain digits: no letters to look for (other digit characters still go the long way)
+                            try:
+                                return int(float(cleaned_value))
+                            except ValueError:
+                                pass
+                        if any(map(str.isalpha, cleaned_value)):
+                            logger.warning(f"[{rule_id}] String '{value}' contains letters, cannot convert to int. Using default: {default}")
+                            return default
+                        try:
+                            return int(float(cleaned_value))
+                        except ValueError:
+                            logger.warning(f"[{rule_id}] Non-numeric string '{value}' cannot be converted to int. Using default: {default}")
+                            return default
+                    if isinstance(value, (int, float)):
+                        return int(value)
+                    logger.warning(f"[{rule_id}] Unsupported type {type(value)} for int conversion. Using default: {default}")
+                    return default
+                except (ValueError, TypeError) as e:
+                    return failed(value, e)
+        elif expected_type is datetime:
+            def coerce(value):
+                if value is None:
+                    return default
+                if isinstance(value, datetime) and value == value: # Already parsed; NaT is not equal to itself
+                    return _midnight(value)
+                try:
+                    # Handle potential timezone info or different formats if necessary
+                    return _parse_date(value if type(value) is str else str(value))
+                except (ValueError, TypeError) as e:
+                    return failed(value, e)
+        elif expected_type is bool:
+            def coerce(value):
+                if value is None:
+                    return default
+                try:
+                    if isinstance(value, str):
+                        if value.lower() == 'true': return True
+                        if value.lower() == 'false': return False
+                    return bool(value)
+                except (ValueError, TypeError) as e:
+                    return failed(value, e)
+        else:
+            plain = expected_type in _PLAIN_TYPES
+            def coerce(value):
+                if value is None:
+                    return default
+                if plain and type(value) is expected_type:
+                    return value
+                # For other types, try direct conversion but with better error handling
+                try:
+                    return expected_type(value)
+                except (ValueError, TypeError):
+                    logger.warning(f"[{rule_id}] Cannot convert value '{value}' to {expected_type.__name__}. Using default: {default}")
+                    return default
+        return coerce
+
+    def _check_high_priority(self, data: Dict[str, Any], app_id: str, coerced: Dict[str, Any]) -> Tuple[bool, str]:
+        """Checks if any High Priority condition is met. Stores the converted values the Medium Priority checks reuse in coerced."""
         # Condition 1: Code Quality
-        maint_index = self._get_value(data, 'MaintainabilityIndex', int, 100) # Default high (good)
-        comp_score = self._get_value(data, 'ComplexityScore', int, 0) # Default low (good)
+        coerced['MaintainabilityIndex'] = maint_index = self._coercers['MaintainabilityIndex'](data.get('MaintainabilityIndex'))
+        coerced['ComplexityScore'] = comp_score = self._coercers['ComplexityScore'](data.get('ComplexityScore'))
         if maint_index < 75 and comp_score > 8:
             return True, f"Code Quality (MaintainabilityIndex={maint_index}, ComplexityScore={comp_score})"
 
         # Condition 2: Financial Impact
-        monthly_cost = self._get_value(data, 'MonthlyCost', float, 0.0)
-        fail_rate = self._get_value(data, 'ChangeFailureRate', float, 0.0)
-        uptime = self._get_value(data, 'UptimePercentage', float, 100.0) # Default high (good)
+        monthly_cost = self._coercers['MonthlyCost'](data.get('MonthlyCost'))
+        coerced['ChangeFailureRate'] = fail_rate = self._coercers['ChangeFailureRate'](data.get('ChangeFailureRate'))
+        uptime = self._coercers['UptimePercentage'](data.get('UptimePercentage'))
         if monthly_cost > 40000 and (fail_rate > 1.0 or uptime < 99.0):
-             reason = f"Financial Impact (MonthlyCost=${monthly_cost:,.2f}"
-             if fail_rate > 1.0: reason += f", ChangeFailureRate={fail_rate}%"
-             if uptime < 99.0: reason += f", UptimePercentage={uptime}%"
-             reason += ")"
-             return True, reason
+             return True, _financial_impact_reason(monthly_cost, fail_rate, uptime)
 
         # Condition 3: Sustainability Factor
-        test_cov = self._get_value(data, 'TestCoverage', float, 100.0) # Default high (good)
+        test_cov = self._coercers['TestCoverage'](data.get('TestCoverage'))
         # comp_score already fetched
         sustainability_factor = (100 - test_cov) * comp_score
         if sustainability_factor > 300:
@@ -193,22 +344,26 @@ class TechDebtPriorityRule(BaseRule):
 
         return False, "" # No High Priority conditions met
 
-    def _check_medium_priority(self, data: Dict[str, Any], app_id: str) -> Tuple[bool, str]:
-        """Checks if any Medium Priority condition is met."""
+    def _check_medium_priority(self, data: Dict[str, Any], app_id: str, nine_months_ago: datetime,
+                               coerced: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Checks if any Medium Priority condition is met. Documentation updated before nine_months_ago
+        is outdated; coerced holds the values _check_high_priority already converted.
+        """
         reasons = []
 
         # Condition 1: Documentation
-        last_updated_str = self._get_value(data, 'LastUpdated', str, None)
-        doc_cov = self._get_value(data, 'DocCoverage', float, 0.0) # Default low
+        last_updated = data.get('LastUpdated')
+        last_updated_str = last_updated if type(last_updated) is str else self._coercers['LastUpdated'](last_updated)
+        doc_cov = self._coercers['DocCoverage'](data.get('DocCoverage'))
         last_updated_date = None
         if last_updated_str:
             try:
-                last_updated_date = self._get_value(data, 'LastUpdated', datetime, None)
+                last_updated_date = self._coerce_last_updated_date(last_updated)
             except Exception as e: # Catch potential parsing errors logged in _get_value
                  logger.warning(f"[{self.rule_id}] Error parsing LastUpdated '{last_updated_str}' for medium priority check: {e}")
 
         if last_updated_date:
-            nine_months_ago = datetime.now() - timedelta(days=9*30) # Approximate 9 months
             if last_updated_date < nine_months_ago and doc_cov > 90.0:
                 reasons.append(f"Documentation (Outdated: {last_updated_date.date()}, Coverage: {doc_cov}%)")
         elif doc_cov > 90.0: # If date missing but coverage high, maybe still medium? User story unclear here.
@@ -216,27 +371,21 @@ class TechDebtPriorityRule(BaseRule):
 
 
         # Condition 2: Technical Indicators
-        maint_index = self._get_value(data, 'MaintainabilityIndex', int, 100)
-        comp_score = self._get_value(data, 'ComplexityScore', int, 0)
+        maint_index = coerced['MaintainabilityIndex']
+        comp_score = coerced['ComplexityScore']
         maint_check = (maint_index >= 65 and maint_index < 75) # Note: < 75, not <= 75 as per High Prio check
         comp_check = (comp_score >= 8 and comp_score <= 15)
         if maint_check or comp_check:
-             tech_reason = "Technical Indicators ("
-             if maint_check: tech_reason += f"MaintainabilityIndex={maint_index}"
-             if maint_check and comp_check: tech_reason += ", "
-             if comp_check: tech_reason += f"ComplexityScore={comp_score}"
-             tech_reason += ")"
-             reasons.append(tech_reason)
+             reasons.append(_technical_indicators_reason(maint_index, comp_score, maint_check, comp_check))
 
 
         # Condition 3: Operational Impact
-        dep_freq_str = self._get_value(data, 'DeploymentFrequency', str, "unknown")
-        fail_rate = self._get_value(data, 'ChangeFailureRate', float, 0.0)
+        dep_freq_str = self._coercers['DeploymentFrequency'](data.get('DeploymentFrequency'))
+        fail_rate = coerced['ChangeFailureRate']
         dep_freq_rank = get_deployment_frequency_rank(dep_freq_str)
-        weekly_rank = DEPLOYMENT_FREQUENCY_ORDER["weekly"]
 
         # Check if frequency is less frequent than weekly (lower rank)
-        if dep_freq_rank < weekly_rank and fail_rate > 0.5:
+        if dep_freq_rank < _WEEKLY_RANK and fail_rate > 0.5:
             reasons.append(f"Operational Impact (DeploymentFrequency='{dep_freq_str}', ChangeFailureRate={fail_rate}%)")
 
         if reasons:
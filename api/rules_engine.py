@@ -4,26 +4,41 @@ import os
 import importlib
 import inspect
 import logging
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
 # Use absolute import for BaseRule
-from rules.base_rule import BaseRule
+from rules.base_rule import BaseRule, Consolidation
 
 logger = logging.getLogger(__name__)
 
 # Point to the 'rules' subdirectory relative to this file
 RULES_DIR = os.path.join(os.path.dirname(__file__), 'rules')
 
+# Threads run_rules applies the rules on. Off (0) by default: the shipped rules are
+# pure Python and hold the GIL, so running them side by side only pays off for rules
+# that spend their time in code releasing it (NumPy, pandas, I/O).
+RULE_WORKERS = 0
+
 def load_rules() -> List[BaseRule]:
     """
     Dynamically loads rule classes from the 'rules' directory that inherit from BaseRule.
+
+    The rule instances are reused until a file is added to or removed from
+    the directory (which changes its mtime); they hold no per-run state.
     """
-    rules = []
-    logger.info(f"Loading rules from directory: {RULES_DIR}")
     # Ensure the RULES_DIR actually exists before trying to list it
     if not os.path.isdir(RULES_DIR):
         logger.error(f"Rules directory not found: {RULES_DIR}")
-        return rules
+        return []
+    return list(_load_rules_cached(os.path.getmtime(RULES_DIR)))
+
+@lru_cache(maxsize=1)
+def _load_rules_cached(rules_dir_mtime: float) -> Tuple[BaseRule, ...]:
+    """Imports the rule modules and instantiates their rules. Cached on the directory's mtime."""
+    rules = []
+    logger.info(f"Loading rules from directory: {RULES_DIR}")
 
     for filename in os.listdir(RULES_DIR):
         if filename.endswith(".py") and not filename.startswith("__") and filename != "base_rule.py":            
@@ -31,9 +46,10 @@ def load_rules() -> List[BaseRule]:
             try:
                 # Import the module using its absolute path
                 module = importlib.import_module(module_name)
-                for name, obj in inspect.getmembers(module):
+                # The module's own namespace, in name order (keeps the rules' order stable)
+                for name, obj in sorted(vars(module).items()):
                     # Check if it's a class, defined in this module, and is a subclass of BaseRule (but not BaseRule itself)
-                    if inspect.isclass(obj) and obj.__module__ == module_name and issubclass(obj, BaseRule) and obj is not BaseRule:
+                    if isinstance(obj, type) and obj.__module__ == module_name and issubclass(obj, BaseRule) and obj is not BaseRule:
                         try:
                             rules.append(obj()) # Instantiate the rule
                             logger.info(f"Successfully loaded and instantiated rule: {name}")
@@ -49,7 +65,7 @@ def load_rules() -> List[BaseRule]:
         logger.warning("No rules were loaded.")
     else:
         logger.info(f"Finished loading rules. Total rules loaded: {len(rules)}")
-    return rules
+    return tuple(rules)
 
 def run_rules(aggregated_data: Dict[str, Any], rules: List[BaseRule]) -> Dict[str, Any]:
     """
@@ -74,21 +90,48 @@ def run_rules(aggregated_data: Dict[str, Any], rules: List[BaseRule]) -> Dict[st
     # Some rules might expect the full structure, others just raw_data.
     # The rule's apply method should handle the structure it expects.
     rules_input = aggregated_data # Pass the whole cache content
+    # The per-app data of this run's raw data, consolidated once for the rules that take it.
+    # Input of another shape is left to the rules, which report it as their error.
+    raw_data = rules_input.get('raw_data', rules_input) if isinstance(rules_input, dict) else None
+    consolidation = Consolidation(raw_data) if isinstance(raw_data, dict) else None
 
-    for rule in rules:
-        # Use rule_id if available, otherwise fallback to class name
-        rule_identifier = getattr(rule, 'rule_id', rule.__class__.__name__)
-        try:
-            logger.debug(f"Applying rule: {rule_identifier}")
-            # Pass the potentially nested aggregated_data; the rule decides what to use
-            rule_result = rule.apply(rules_input)
+    if RULE_WORKERS > 1 and len(rules) > 1:
+        with ThreadPoolExecutor(max_workers=min(RULE_WORKERS, len(rules)), thread_name_prefix='rules') as executor:
+            futures = [executor.submit(_apply_rule, rule, rules_input, consolidation) for rule in rules]
+            # Collected in rule order, so the results are keyed as in a serial run
+            for future in futures:
+                rule_identifier, rule_result = future.result()
+                all_rule_results[rule_identifier] = rule_result
+    else:
+        for rule in rules:
+            rule_identifier, rule_result = _apply_rule(rule, rules_input, consolidation)
             all_rule_results[rule_identifier] = rule_result
-            logger.debug(f"Rule {rule_identifier} applied successfully.")
-        except Exception as e:
-            logger.error(f"Error applying rule {rule_identifier}: {e}", exc_info=True)
-            # Store error information for this specific rule
-            all_rule_results[rule_identifier] = {"error": f"Rule execution failed: {e}"}
 
     logger.info("Rules engine run finished.")
     return all_rule_results # Return the dictionary of all rule results
 
+@lru_cache(maxsize=None)
+def _takes_consolidation(rule_class: type) -> bool:
+    """Whether rule_class.apply accepts a consolidation argument (rules written before it was added do not)."""
+    return 'consolidation' in inspect.signature(rule_class.apply).parameters
+
+def _apply_rule(rule: BaseRule, rules_input: Dict[str, Any], consolidation: Optional[Consolidation]) -> Tuple[str, Any]:
+    """
+    Applies one rule, returning (rule identifier, its result or the error it failed with).
+    Rules whose apply takes a consolidation argument get the run's consolidation.
+    """
+    # Use rule_id if available, otherwise fallback to class name
+    rule_identifier = getattr(rule, 'rule_id', rule.__class__.__name__)
+    try:
+        logger.debug("Applying rule: %s", rule_identifier)
+        # Pass the potentially nested aggregated_data; the rule decides what to use
+        if _takes_consolidation(type(rule)):
+            rule_result = rule.apply(rules_input, consolidation=consolidation)
+        else:
+            rule_result = rule.apply(rules_input)
+        logger.debug("Rule %s applied successfully.", rule_identifier)
+        return rule_identifier, rule_result
+    except Exception as e:
+        logger.error(f"Error applying rule {rule_identifier}: {e}", exc_info=True)
+        # Store error information for this specific rule
+        return rule_identifier, {"error": f"Rule execution failed: {e}"}
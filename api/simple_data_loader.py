@@ -5,10 +5,25 @@ No schema detection, no migration, just load what's in the file.
 import pandas as pd
 import os
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+
+def _rows_by_app_id(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """
+    {app_id: {column: value}} for a frame indexed by app_id, with the values as
+    Python scalars: what df.to_dict(orient='index') returns, built from one
+    tolist() per column instead of boxing the frame row by row.
+    """
+    if not df.index.is_unique:
+        raise ValueError("DataFrame index must be unique for orient='index'.")
+    columns = list(df.columns)
+    rows = zip(*[df[column].tolist() for column in columns])
+    return dict(zip(df.index.tolist(), [dict(zip(columns, row)) for row in rows]))
+
+
 def load_csv_data(provider_id: str, config: Dict[str, str], api_dir: str) -> Optional[Dict[str, Dict[str, Any]]]:
     """
     Load CSV data with simple assumption: first column is always app_id.
@@ -34,30 +49,45 @@ def load_csv_data(provider_id: str, config: Dict[str, str], api_dir: str) -> Opt
         return None
     
     try:
-        # Read CSV file
-        df = pd.read_csv(file_path)
+        stat = os.stat(file_path)
+        result = _load_rows(file_path, stat.st_mtime_ns, stat.st_size)
         
-        if df.empty:
+        if result is None:
             logger.warning(f"Empty CSV file for provider {provider_id}")
             return None
         
-        # First column is app_id
-        app_id_col = df.columns[0]
-        
-        # Convert app_id column to string to ensure consistency
-        df[app_id_col] = df[app_id_col].astype(str)
-        
-        # Rename first column to 'app_id' for consistency in the output
-        df = df.rename(columns={app_id_col: 'app_id'})
-        
-        # Convert to dictionary with app_id as key
-        result = df.set_index('app_id').to_dict(orient='index')
-        
         logger.info(f"Loaded {len(result)} records for provider {provider_id}")
-        logger.debug(f"Columns in {provider_id}: {list(df.columns)}")
+        logger.debug("Columns in %s: %s", provider_id, ['app_id', *next(iter(result.values()))])
         
         return result
         
     except Exception as e:
         logger.error(f"Error loading CSV for provider {provider_id}: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+@lru_cache(maxsize=32)
+def _load_rows(file_path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Parses the CSV at file_path into {app_id: row}, or None when it has no rows.
+
+    Cached on the file's mtime and size: while the file is unchanged every
+    refresh gets the same dict back. Callers must not modify it.
+    """
+    # Read CSV file
+    df = pd.read_csv(file_path)
+    
+    if df.empty:
+        return None
+    
+    # First column is app_id
+    app_id_col = df.columns[0]
+    
+    # Convert app_id column to string to ensure consistency
+    df[app_id_col] = df[app_id_col].astype(str)
+    
+    # Rename first column to 'app_id' for consistency in the output
+    df = df.rename(columns={app_id_col: 'app_id'})
+    
+    # Convert to dictionary with app_id as key
+    return _rows_by_app_id(df.set_index('app_id'))
\ No newline at end of file
@@ -2,20 +2,17 @@
 Pytest configuration and fixtures for the Fitness Functions test suite.
 """
 
-import os
-import sys
+import copy
 import pytest
 import tempfile
 import shutil
 import pandas as pd
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import patch
-from typing import Dict, Any, Generator
+from typing import Dict, Any, Generator, Mapping
 import json
 
-# Add the parent directory to the Python path so we can import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for test files."""
@@ -23,10 +20,10 @@ def temp_dir() -> Generator[Path, None, None]:
     yield temp_path
     shutil.rmtree(temp_path)
 
-@pytest.fixture
-def sample_csv_data() -> Dict[str, pd.DataFrame]:
-    """Sample CSV data for testing."""
-    return {
+@pytest.fixture(scope="session")
+def sample_csv_data() -> Mapping[str, pd.DataFrame]:
+    """Sample CSV data for testing, shared by the session; .copy() a frame before changing it."""
+    return MappingProxyType({
         'code_quality_v1': pd.DataFrame({
             'app_id': ['App A', 'App B', 'App C'],
             'lint_score': [85, 92, 78],
@@ -43,14 +40,16 @@ def sample_csv_data() -> Dict[str, pd.DataFrame]:
             'value': [100, 200, 300],
             'status': ['Active', 'Inactive', 'Active']
         })
-    }
+    })
 
-@pytest.fixture
-def sample_csv_files(temp_dir: Path, sample_csv_data: Dict[str, pd.DataFrame]) -> Dict[str, Path]:
-    """Create sample CSV files in temp directory."""
+@pytest.fixture(scope="session")
+def sample_csv_files(tmp_path_factory: pytest.TempPathFactory,
+                     sample_csv_data: Mapping[str, pd.DataFrame]) -> Dict[str, Path]:
+    """Create sample CSV files once per session in a temp directory."""
+    csv_dir = tmp_path_factory.mktemp("sample_csv")
     csv_files = {}
     for name, df in sample_csv_data.items():
-        file_path = temp_dir / f"{name}.csv"
+        file_path = csv_dir / f"{name}.csv"
         df.to_csv(file_path, index=False)
         csv_files[name] = file_path
     return csv_files
@@ -76,10 +75,10 @@ observability = data_mock/observability_v1.csv
     
     return api_dir
 
-@pytest.fixture
-def provider_configs() -> Dict[str, Dict[str, str]]:
-    """Sample provider configurations."""
-    return {
+@pytest.fixture(scope="session")
+def provider_configs() -> Mapping[str, Dict[str, str]]:
+    """Sample provider configurations, shared by the session."""
+    return MappingProxyType({
         'code_quality_v1': {
             'connector_type': 'csv',
             'file_path': 'data_mock/code_quality_v1.csv'
@@ -92,7 +91,7 @@ def provider_configs() -> Dict[str, Dict[str, str]]:
             'connector_type': 'csv',
             'file_path': 'data_mock/simple_data.csv'
         }
-    }
+    })
 
 @pytest.fixture
 def sample_migration_plan() -> Dict[str, Any]:
@@ -151,10 +150,10 @@ def sample_schema_data() -> Dict[str, Any]:
         'identifier_columns': ['app_id']
     }
 
-@pytest.fixture
-def mock_cache_data() -> Dict[str, Any]:
-    """Sample cache data for testing."""
-    return {
+@pytest.fixture(scope="session")
+def mock_cache_data() -> Mapping[str, Any]:
+    """Sample cache data for testing, shared by the session; use mock_cache_data_rw to change it."""
+    return MappingProxyType({
         'raw_data': {
             'code_quality_v1': {
                 'App A': {
@@ -179,7 +178,12 @@ def mock_cache_data() -> Dict[str, Any]:
                 }
             }
         }
-    }
+    })
+
+@pytest.fixture
+def mock_cache_data_rw(mock_cache_data: Mapping[str, Any]) -> Dict[str, Any]:
+    """A private, mutable copy of mock_cache_data."""
+    return copy.deepcopy(dict(mock_cache_data))
 
 # Mock environment fixtures
 @pytest.fixture
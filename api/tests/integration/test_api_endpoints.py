@@ -14,10 +14,6 @@ from httpx import AsyncClient
 from fastapi.testclient import TestClient
 
 # Import the FastAPI app
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from app import app
 
 
@@ -0,0 +1,81 @@
+"""
+Tests for the fitness function editor API endpoints.
+
+Calls the app in-process through FastAPI's TestClient, so no API server
+has to be running.
+"""
+
+from fastapi.testclient import TestClient
+
+from app import app
+
+client = TestClient(app)
+
+def test_list_fitness_functions():
+    """The REST endpoint lists the fitness functions with their module and class."""
+    response = client.get("/api/fitness-functions")
+    assert response.status_code == 200, response.text
+    
+    functions = response.json()['fitness_functions']
+    assert functions
+    for func in functions:
+        assert func['id']
+        assert func['name']
+        assert func['module_name']
+        assert func['class_name']
+
+def test_get_source_code():
+    """The REST endpoint returns the source of a listed fitness function."""
+    response = client.get("/api/fitness-functions")
+    assert response.status_code == 200, response.text
+    functions = response.json()['fitness_functions']
+    assert functions
+    
+    test_module = functions[0]['module_name']
+    response = client.get(f"/api/fitness-functions/{test_module}/source")
+    assert response.status_code == 200, response.text
+    
+    data = response.json()
+    assert data['module_name'] == test_module
+    assert data['file_path'].endswith(f"{test_module}.py")
+    assert data['source_code']
+
+def test_graphql_endpoints():
+    """GraphQL lists the fitness functions and returns their source."""
+    query = """
+    query {
+        fitnessFunctionList {
+            id
+            name
+            description
+            moduleName
+            className
+        }
+    }
+    """
+    
+    response = client.post("/graphql", json={"query": query})
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert 'errors' not in data, data
+    functions = data['data']['fitnessFunctionList']
+    assert functions
+    
+    module_name = functions[0]['moduleName']
+    source_query = f"""
+    query {{
+        fitnessFunctionSource(moduleName: "{module_name}") {{
+            moduleName
+            filePath
+            sourceCode
+        }}
+    }}
+    """
+    
+    response = client.post("/graphql", json={"query": source_query})
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert 'errors' not in data, data
+    source = data['data']['fitnessFunctionSource']
+    assert source['moduleName'] == module_name
+    assert source['sourceCode']
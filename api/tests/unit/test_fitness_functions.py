@@ -0,0 +1,112 @@
+"""
+Tests for the CacheAccessor-based fitness functions
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import fitness_logic.application_health_score
+import fitness_logic.cost_optimization_fitness
+from fitness_logic.cache_accessor import CacheAccessor
+from fitness_logic.application_health_score import ApplicationHealthScoreFitnessFunction
+from fitness_logic.cost_optimization_fitness import CostOptimizationFitnessFunction
+
+# Mock cache data for testing
+mock_cache_data = {
+    'raw_data': {
+        'code_quality_v1': {
+            'TestApp1': {'MaintainabilityIndex': 85, 'TestCoverage': 90, 'ComplexityScore': 5},
+            'TestApp2': {'MaintainabilityIndex': 65, 'TestCoverage': 70, 'ComplexityScore': 15},
+            'TestApp3': {'MaintainabilityIndex': 45, 'TestCoverage': 50, 'ComplexityScore': 25},
+        },
+        'operational_excellence_v1': {
+            'TestApp1': {'UptimePercent': 99.9, 'AvgResponseTimeMS': 150},
+            'TestApp2': {'UptimePercent': 98.5, 'AvgResponseTimeMS': 500},
+            'TestApp3': {'UptimePercent': 95.0, 'AvgResponseTimeMS': 1500},
+        },
+        'cost_optimization_v1': {
+            'TestApp1': {'MonthlyCost': 5000, 'AvgResponseTime': 150},
+            'TestApp2': {'MonthlyCost': 25000, 'AvgResponseTime': 500},
+            'TestApp3': {'MonthlyCost': 75000, 'AvgResponseTime': 1500},
+        },
+        'security_v1': {
+            'TestApp1': {'VulnerabilityCount': 0},
+            'TestApp2': {'VulnerabilityCount': 3},
+            'TestApp3': {'VulnerabilityCount': 10},
+        }
+    },
+    'rule_results': {
+        'governance_path_decision': {},
+        'tech_debt_priority': {}
+    }
+}
+
+@pytest.fixture(scope="module")
+def accessor():
+    """A CacheAccessor over the mock cache data."""
+    return CacheAccessor(mock_cache_data)
+
+def test_get_all_app_ids(accessor):
+    assert accessor.get_all_app_ids() == {'TestApp1', 'TestApp2', 'TestApp3'}
+
+def test_get_field_value(accessor):
+    assert accessor.get_field_value('TestApp1', 'code_quality_v1.MaintainabilityIndex', 0) == 85
+    assert accessor.get_field_value('TestApp1', 'code_quality_v1.Missing', 0) == 0
+
+def test_iterate_apps_with_data(accessor):
+    apps_data = accessor.iterate_apps_with_data(['code_quality_v1', 'cost_optimization_v1'])
+    assert set(apps_data) == {'TestApp1', 'TestApp2', 'TestApp3'}
+    assert apps_data['TestApp2']['cost_optimization_v1']['MonthlyCost'] == 25000
+
+@pytest.mark.parametrize("operation, expected", [
+    ('sum', 105000.0),
+    ('avg', 35000.0),
+    ('min', 5000.0),
+    ('max', 75000.0),
+    ('count', 3.0),
+])
+def test_aggregate_field(accessor, operation, expected):
+    assert accessor.aggregate_field('cost_optimization_v1', 'MonthlyCost', operation) == expected
+
+def test_count_by_condition(accessor):
+    cost_ranges = accessor.count_by_condition(
+        'cost_optimization_v1',
+        'MonthlyCost',
+        lambda cost: 'low' if cost < 10000 else 'medium' if cost < 50000 else 'high'
+    )
+    assert cost_ranges == {'low': 1, 'medium': 1, 'high': 1}
+
+@pytest.mark.parametrize("bins, labels, expected", [
+    ([10000, 50000], ['low', 'medium', 'high'], {'low': 1, 'medium': 1, 'high': 1}),
+    ([5000, 75000], ['low', 'medium', 'high'], {'medium': 2, 'high': 1}),
+    ([100000], ['normal', 'very_high'], {'normal': 3}),
+])
+def test_count_by_bins(accessor, bins, labels, expected):
+    assert accessor.count_by_bins('cost_optimization_v1', 'MonthlyCost', bins, labels) == expected
+
+def test_health_score_function():
+    with patch.object(fitness_logic.application_health_score, 'get_aggregated_data', return_value=mock_cache_data):
+        result = ApplicationHealthScoreFitnessFunction.calculate({})
+    
+    assert result is not None
+    assert result['name'] == 'Application Health Score'
+    assert result['total_count'] == 3
+    
+    breakdown = result['application_breakdown']
+    assert set(breakdown['categories']) == {'excellent', 'good', 'needs_attention', 'critical'}
+    assert sum(len(app_ids) for app_ids in breakdown['categories'].values()) == 3
+    assert breakdown['statistics'] == {'average_test_coverage': 70.0, 'total_monthly_cost': 105000.0}
+
+def test_cost_optimization_function():
+    with patch.object(fitness_logic.cost_optimization_fitness, 'get_aggregated_data', return_value=mock_cache_data):
+        result = CostOptimizationFitnessFunction.calculate({})
+    
+    assert result is not None
+    assert result['name'] == 'Cost Optimization Opportunities'
+    assert result['total_count'] == 3
+    assert (result['passing_count'], result['warning_count'], result['failing_count']) == (0, 1, 2)
+    
+    statistics = result['application_breakdown']['statistics']
+    assert statistics['total_monthly_cost'] == 105000.0
+    assert statistics['potential_savings'] == 30000.0
@@ -0,0 +1,419 @@
+"""
+Unit tests for the CSV-backed fitness providers.
+
+Covers the parsed-CSV cache shared by providers, the rule tables they
+evaluate and the status logic computed from each row.
+"""
+
+import os
+import sqlite3
+import numpy as np
+import pytest
+from pathlib import Path
+
+from connectors.csv_connector import CsvConnector, _read_csv_grouped
+from providers.base_provider import _evaluate_cells, load_csv_indexed
+from providers.code_quality_provider import CodeQualityProvider
+from providers.documentation_provider import DocumentationProvider
+from providers.operational_excellence_provider import OperationalExcellenceProvider
+from providers.resilience_provider import ResilienceProvider
+from providers.security_provider import SecurityProvider
+from providers.tech_debt_provider import TechDebtProvider
+
+
+def write_csv(path: Path, lines) -> None:
+    """Write CSV lines and bump the mtime so cache invalidation is observable."""
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def code_quality_csv(temp_dir: Path) -> Path:
+    """Code quality mock CSV with one healthy, one warning and one critical app."""
+    path = temp_dir / "code_quality_v1.csv"
+    write_csv(path, [
+        "app_id,LintScore,TestCoverage,ComplexityScore,MaintainabilityIndex",
+        "App A,90,80,10,80",
+        "App B,80,80,10,80",
+        "App C,70,60,20,80",
+    ])
+    return path
+
+
+@pytest.fixture
+def code_quality_provider(code_quality_csv: Path) -> CodeQualityProvider:
+    """CodeQualityProvider pointed at the temporary CSV."""
+    provider = CodeQualityProvider({})
+    provider.mock_file_path = str(code_quality_csv)
+    return provider
+
+
+class TestCsvIndexCache:
+    """Test the cached CSV index used for per-app lookups."""
+
+    def test_status_per_app(self, code_quality_provider):
+        """Each app is looked up from the parsed index with the expected status."""
+        statuses = {
+            app_id: code_quality_provider.get_fitness_data({"app_id": app_id})["status"]
+            for app_id in ("App A", "App B", "App C")
+        }
+        assert statuses == {"App A": "healthy", "App B": "warning", "App C": "critical"}
+
+    def test_unknown_app_is_not_found(self, code_quality_provider):
+        """Apps missing from the CSV report not_found."""
+        assert code_quality_provider.get_fitness_data({"app_id": "Missing"})["status"] == "not_found"
+
+    def test_index_shared_between_instances(self, code_quality_provider, code_quality_csv):
+        """Providers reading the same unchanged file share one parsed index."""
+        other = CodeQualityProvider({})
+        other.mock_file_path = str(code_quality_csv)
+        assert other._load_index() is code_quality_provider._load_index()
+
+    def test_file_change_is_picked_up(self, code_quality_provider, code_quality_csv):
+        """Rewriting the CSV invalidates the cached index."""
+        assert code_quality_provider.get_fitness_data({"app_id": "App A"})["status"] == "healthy"
+        write_csv(code_quality_csv, [
+            "app_id,LintScore,TestCoverage,ComplexityScore,MaintainabilityIndex",
+            "App A,50,50,30,50",
+        ])
+        assert code_quality_provider.get_fitness_data({"app_id": "App A"})["status"] == "critical"
+
+    def test_first_duplicate_row_wins(self, temp_dir):
+        """Duplicate app rows resolve to the first occurrence, as the old linear scan did."""
+        path = temp_dir / "documentation_v1.csv"
+        write_csv(path, [
+            "ApplicationName,CoveragePercent,LastUpdatedDaysAgo",
+            "App A,95,5",
+            "App A,10,200",
+        ])
+        provider = DocumentationProvider({})
+        provider.mock_file_path = str(path)
+        assert provider.get_fitness_data({"app_id": "App A"})["status"] == "healthy"
+
+    def test_bulk_matches_single_lookups(self, code_quality_provider, code_quality_csv):
+        """Bulk evaluation agrees with per-app calls, including fallback rows."""
+        write_csv(code_quality_csv, [
+            "app_id,LintScore,TestCoverage,ComplexityScore,MaintainabilityIndex",
+            "App A,90,80,10,80",
+            "App B,80,80,10,80",
+            "App C,70,60,20,80",
+            "App D,85.5,80,10,80",
+            "App E,,80,10,80",
+        ])
+        app_ids = ["App A", "App B", "App C", "App D", "App E", "Missing"]
+        bulk = code_quality_provider.get_fitness_data_bulk([{"app_id": app_id} for app_id in app_ids])
+        assert list(bulk) == app_ids
+        for app_id in app_ids:
+            assert bulk[app_id] == code_quality_provider.get_fitness_data({"app_id": app_id})
+
+    def test_scanning_providers_use_index(self, temp_dir):
+        """Providers keyed on ApplicationName read the same cached index."""
+        path = temp_dir / "security_v1.csv"
+        write_csv(path, [
+            "ApplicationName,CriticalVulnerabilities,HighSCAIssues",
+            "App A,0,1",
+            "App B,3,0",
+            "App B,0,0",
+        ])
+        provider = SecurityProvider({})
+        provider.mock_file_path = str(path)
+        assert provider.get_fitness_data({"app_id": "App A"})["status"] == "healthy"
+        assert provider.get_fitness_data({"app_id": "App B"})["status"] == "critical"
+        assert provider._load_index() is load_csv_indexed(str(path))
+
+    def test_float_bulk_matches_single_lookups(self, temp_dir):
+        """Vectorized float conversion agrees with float(), including values it leaves to the per-app path."""
+        path = temp_dir / "operational_excellence_v1.csv"
+        write_csv(path, [
+            "ApplicationName,UptimePercent,AvgResponseTimeMS,IncidentsLast30d",
+            "App A,99.95,120,0",
+            "App B,99.2,700,2",
+            "App C,98.123456789012345678,1200,5",
+            "App D, 99.7 ,1_000,1",
+            "App F,abc,300,0",
+        ])
+        provider = OperationalExcellenceProvider({})
+        provider.mock_file_path = str(path)
+        app_ids = ["App A", "App B", "App C", "App D", "App F", "Missing"]
+        bulk = provider.get_fitness_data_bulk([{"app_id": app_id} for app_id in app_ids])
+        assert [bulk[app_id]["status"] for app_id in app_ids[:3]] == ["healthy", "warning", "critical"]
+        for app_id in app_ids:
+            assert bulk[app_id] == provider.get_fitness_data({"app_id": app_id})
+
+    def test_missing_file_reports_unknown(self, temp_dir):
+        """A missing CSV is reported as unknown rather than raised."""
+        provider = CodeQualityProvider({})
+        provider.mock_file_path = str(temp_dir / "missing.csv")
+        result = provider.get_fitness_data({"app_id": "App A"})
+        assert result["status"] == "unknown"
+        assert "not found" in result["details"]["error"]
+
+    def test_crlf_and_quoted_newlines(self, temp_dir):
+        """CRLF rows parse, quoted newlines are kept verbatim as pandas keeps them, and empty files are empty."""
+        path = temp_dir / "crlf.csv"
+        path.write_bytes(b'app_id,Note\r\nApp A,"two\r\nlines"\r\n')
+        assert load_csv_indexed(str(path), "app_id") == {"App A": {"app_id": "App A", "Note": "two\r\nlines"}}
+        empty = temp_dir / "empty.csv"
+        empty.write_bytes(b"")
+        assert load_csv_indexed(str(empty), "app_id") == {}
+
+
+class TestRuleTables:
+    """Test the shared rule-table evaluation used by the threshold providers."""
+
+    RULES = (
+        ('score', '<', 50, 'critical', "Score is critical: {v}"),
+        ('score', 'between', (50, 70), 'warning', "Score needs improvement: {v}"),
+        ('age', '>', 30, 'info', "Stale: {v} days"),
+    )
+
+    def test_highest_severity_wins(self):
+        """Status is the most severe matching rule; info rules only add messages."""
+        evaluate = CodeQualityProvider.evaluate_rules
+        assert evaluate({'score': 40, 'age': 45}, self.RULES) == ('critical', ["Score is critical: 40", "Stale: 45 days"])
+        assert evaluate({'score': 70, 'age': 10}, self.RULES) == ('healthy', [])
+        assert evaluate({'score': 69, 'age': 10}, self.RULES) == ('warning', ["Score needs improvement: 69"])
+        assert evaluate({'score': 90, 'age': 45}, self.RULES) == ('healthy', ["Stale: 45 days"])
+
+    def test_critical_after_warning_count(self):
+        """critical_after escalates apps with too many warnings."""
+        rules = CodeQualityProvider.RULES
+        values = {'lint_score': 10, 'test_coverage_percent': 10, 'complexity_score': 10, 'maintainability_index': 90}
+        assert CodeQualityProvider.evaluate_rules(values, rules, critical_after=2)[0] == 'warning'
+        values['complexity_score'] = 20
+        assert CodeQualityProvider.evaluate_rules(values, rules, critical_after=2)[0] == 'critical'
+
+    def test_bulk_matches_scalar(self):
+        """Vectorized evaluation agrees with evaluating each row on its own."""
+        scores = [10.0, 49.5, 50.0, 69.0, 70.0, 100.0, float('nan'), 0.0, -0.0, 10.0]
+        ages = [0, 31, 30, 100, 5, 31, 31, 31, 31, 100]
+        statuses, warnings = CodeQualityProvider.evaluate_rules_bulk(
+            {'score': np.array(scores), 'age': np.array(ages)}, self.RULES)
+        for row, (score, age) in enumerate(zip(scores, ages)):
+            assert (statuses[row], warnings[row]) == CodeQualityProvider.evaluate_rules(
+                {'score': score, 'age': age}, self.RULES)
+
+    def test_extract_metrics(self):
+        """METRIC_FIELDS are read into a namedtuple; text fields pass through and defaults fill gaps."""
+        provider = TechDebtProvider({})
+        metrics = provider._extract_metrics({'TechDebtRatio': '12.5', 'OutdatedDependencies': '3', 'RefactoringNeeded': 'High'})
+        assert metrics.tech_debt_ratio == 12.5
+        assert metrics.legacy_code_percentage == 0.0
+        assert metrics.refactoring_needed == 'High'
+        assert metrics._asdict() == {
+            'tech_debt_ratio': 12.5,
+            'legacy_code_percentage': 0.0,
+            'refactoring_needed': 'High',
+            'outdated_dependencies': 3,
+        }
+        with pytest.raises(ValueError):
+            provider._extract_metrics({'OutdatedDependencies': '3.5'})
+
+    def test_positional_extraction_matches_named(self, temp_dir):
+        """Rows from the CSV index read by column position give the same metrics as by name."""
+        path = temp_dir / "security_v1.csv"
+        write_csv(path, [
+            "ApplicationName,HighSCAIssues,CriticalVulnerabilities",
+            "App A,7,1",
+            "App B,3",
+        ])
+        provider = SecurityProvider({})
+        provider.mock_file_path = str(path)
+        index = provider._load_index()
+        assert provider._extract_metrics(index["App A"]) == provider._extract_metrics(dict(index["App A"])) == (1, 7)
+        with pytest.raises(TypeError):
+            provider._extract_metrics(index["App B"])  # short row: CriticalVulnerabilities is None
+
+    def test_identical_rows_share_evaluation(self, code_quality_provider, code_quality_csv):
+        """Apps with the same metric cells reuse one evaluation but get independent details."""
+        write_csv(code_quality_csv, [
+            "app_id,LintScore,TestCoverage,ComplexityScore,MaintainabilityIndex",
+            "App A,70,60,20,80",
+            "App B,70,60,20,80",
+            "App C,70.0,60,20,80",
+        ])
+        _evaluate_cells.cache_clear()
+        first = code_quality_provider.get_fitness_data({"app_id": "App A"})
+        second = code_quality_provider.get_fitness_data({"app_id": "App B"})
+        assert _evaluate_cells.cache_info().hits == 1
+        assert first == second and first["status"] == "critical"
+        first["details"]["warnings"].append("mutated")
+        assert "mutated" not in second["details"]["warnings"]
+        assert code_quality_provider.get_fitness_data({"app_id": "App C"})["status"] == "unknown"
+
+
+class TestSqliteIndex:
+    """Test the opt-in SQLite point-lookup backend."""
+
+    @pytest.fixture
+    def sqlite_provider(self, code_quality_csv: Path) -> CodeQualityProvider:
+        """CodeQualityProvider using the SQLite index backend."""
+        provider = CodeQualityProvider({"index_backend": "sqlite"})
+        provider.mock_file_path = str(code_quality_csv)
+        return provider
+
+    def test_matches_in_memory_index(self, sqlite_provider, code_quality_provider):
+        """SQLite lookups return the same results as the in-memory index."""
+        for app_id in ("App A", "App B", "App C", "Missing"):
+            app_config = {"app_id": app_id}
+            assert sqlite_provider.get_fitness_data(app_config) == code_quality_provider.get_fitness_data(app_config)
+
+    def test_index_file_rebuilt_on_change(self, sqlite_provider, code_quality_csv):
+        """The index is written next to the CSV and rebuilt when the CSV changes."""
+        assert sqlite_provider.get_fitness_data({"app_id": "App A"})["status"] == "healthy"
+        assert Path(f"{code_quality_csv}.sqlite").exists()
+        write_csv(code_quality_csv, [
+            "app_id,LintScore,TestCoverage,ComplexityScore,MaintainabilityIndex",
+            "App A,50,50,30,50",
+            "App A,90,80,10,80",
+        ])
+        assert sqlite_provider.get_fitness_data({"app_id": "App A"})["status"] == "critical"
+
+    def test_read_only_stale_index_falls_back_to_memory(self, sqlite_provider, code_quality_csv, monkeypatch):
+        """A stale index file that cannot be rewritten is replaced by an in-memory index."""
+        assert sqlite_provider.get_fitness_data({"app_id": "App A"})["status"] == "healthy"
+        connect = sqlite3.connect
+        monkeypatch.setattr(sqlite3, "connect", lambda database, **kwargs: connect(
+            f"file:{database}?mode=ro", uri=True, **kwargs) if database.endswith(".sqlite") else connect(database, **kwargs))
+        write_csv(code_quality_csv, [
+            "app_id,LintScore,TestCoverage,ComplexityScore,MaintainabilityIndex",
+            "App A,50,50,30,50",
+        ])
+        assert sqlite_provider.get_fitness_data({"app_id": "App A"})["status"] == "critical"
+
+    def test_bulk_matches_single_lookups(self, sqlite_provider):
+        """Batched IN queries agree with per-app lookups."""
+        app_ids = ["App C", "Missing", "App A"]
+        bulk = sqlite_provider.get_fitness_data_bulk([{"app_id": app_id} for app_id in app_ids])
+        assert list(bulk) == app_ids
+        for app_id in app_ids:
+            assert bulk[app_id] == sqlite_provider.get_fitness_data({"app_id": app_id})
+
+
+class TestResultCache:
+    """Test memoization of get_fitness_data results per app."""
+
+    def test_repeated_lookup_is_cached(self, code_quality_provider):
+        """A second lookup for the same app returns the cached result."""
+        first = code_quality_provider.get_fitness_data({"app_id": "App A"})
+        assert code_quality_provider.get_fitness_data({"app_id": "App A"}) is first
+        assert code_quality_provider.cache_stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+    def test_invalidate(self, code_quality_provider):
+        """invalidate() forces the next lookup to be recomputed."""
+        first = code_quality_provider.get_fitness_data({"app_id": "App A"})
+        code_quality_provider.invalidate("App A")
+        assert code_quality_provider.get_fitness_data({"app_id": "App A"}) is not first
+        code_quality_provider.invalidate()
+        assert code_quality_provider.cache_stats()["misses"] == 2
+
+    def test_unknown_results_are_not_cached(self, temp_dir):
+        """Errors such as a missing file are retried rather than memoized."""
+        provider = CodeQualityProvider({})
+        provider.mock_file_path = str(temp_dir / "missing.csv")
+        provider.get_fitness_data({"app_id": "App A"})
+        provider.get_fitness_data({"app_id": "App A"})
+        assert provider.cache_stats()["hits"] == 0
+
+
+class TestLatestRowIndex:
+    """Test the latest-row DataFrame used by providers with timestamped CSVs."""
+
+    @pytest.fixture
+    def resilience_provider(self, temp_dir: Path) -> ResilienceProvider:
+        """ResilienceProvider reading a CSV with several rows per app."""
+        path = temp_dir / "resilience_v1.csv"
+        write_csv(path, [
+            "app_id,FailoverSuccessRate,RecoveryTimeMinutes,ResiliencyScore,IncidentCount,timestamp",
+            "App A,99,10,90,0,2025-01-01",
+            "App A,99,10,70,0,2025-03-01",
+            "App A,99,10,80,0,2025-02-01",
+            "App B,99,10,60,0,",
+            "App B,99,10,65,0,",
+        ])
+        provider = ResilienceProvider({})
+        provider.mock_file_path = str(path)
+        return provider
+
+    def test_latest_timestamp_wins(self, resilience_provider):
+        """The row with the greatest timestamp is used."""
+        details = resilience_provider.get_fitness_data({"app_id": "App A"})["details"]
+        assert details["resiliency_score"] == 70.0
+
+    def test_last_row_without_timestamps(self, resilience_provider):
+        """Apps without parseable timestamps fall back to their last row."""
+        details = resilience_provider.get_fitness_data({"app_id": "App B"})["details"]
+        assert details["resiliency_score"] == 65.0
+
+    def test_missing_app(self, resilience_provider):
+        """Missing apps report that no data was found."""
+        result = resilience_provider.get_fitness_data({"app_id": "Missing"})
+        assert result == {"status": "unknown", "details": {"error": "No data found for app Missing"}}
+
+    def test_bulk_matches_single_lookups(self, temp_dir):
+        """Vectorized bulk statuses match the per-app threshold logic, including fallbacks."""
+        path = temp_dir / "tech_debt_v1.csv"
+        write_csv(path, [
+            "app_id,TechDebtRatio,LegacyCodePercentage,RefactoringNeeded,OutdatedDependencies,timestamp",
+            "App A,10.5,5,Low,2,2025-01-01",
+            "App A,30,5,HIGH,12,2025-02-01",
+            "App B,16,10,high,0,2025-01-01",
+            "App C,5,45,low,11,2025-01-01",
+            "App D,5,5,,3,2025-01-01",
+        ])
+        provider = TechDebtProvider({})
+        provider.mock_file_path = str(path)
+        app_ids = ["App A", "App B", "App C", "App D", "Missing"]
+        bulk = provider.get_fitness_data_bulk([{"app_id": app_id} for app_id in app_ids])
+        provider.invalidate()
+        assert bulk == {app_id: provider.get_fitness_data({"app_id": app_id}) for app_id in app_ids}
+        assert bulk["App A"]["status"] == "critical"
+        assert bulk["App B"]["details"]["warnings"] == [
+            "Technical debt needs attention: 16.0%",
+            "High refactoring needs identified",
+        ]
+        assert bulk["App D"]["status"] == "unknown"
+
+class TestCsvConnectorCache:
+    """Test the parsed-file cache in CsvConnector."""
+
+    def test_latest_entry_per_app(self, temp_dir):
+        """Each app resolves to its latest row, and the file is parsed once."""
+        path = temp_dir / "metrics.csv"
+        write_csv(path, [
+            "app_id,Score,timestamp",
+            "App A,1,2025-01-01",
+            "App B,5,2025-01-01",
+            "App A,3,2025-03-01",
+            "App A,2,2025-02-01",
+        ])
+        connector = CsvConnector({"file_path": str(path)})
+        assert connector.fetch_data({"app_id": "App A"})["Score"] == 3
+        assert connector.fetch_data({"app_id": "App B"})["Score"] == 5
+        assert connector.fetch_data({"app_id": "Missing"}) is None
+
+    def test_file_change_is_picked_up(self, temp_dir):
+        """Rewriting the CSV invalidates the cached DataFrame."""
+        path = temp_dir / "metrics.csv"
+        write_csv(path, ["app_id,Score", "App A,1"])
+        connector = CsvConnector({"file_path": str(path)})
+        assert connector.fetch_data({"app_id": "App A"})["Score"] == 1
+        write_csv(path, ["app_id,Score", "App A,7"])
+        assert connector.fetch_data({"app_id": "App A"})["Score"] == 7
+
+    def test_path_spellings_share_one_parse(self, temp_dir):
+        """A file reached through a symlink shares the cached DataFrame of its target."""
+        path = temp_dir / "metrics.csv"
+        write_csv(path, ["app_id,Score", "App A,1"])
+        link = temp_dir / "linked.csv"
+        try:
+            link.symlink_to(path)
+        except OSError:
+            pytest.skip("symlinks are not available")
+        direct = CsvConnector({"file_path": str(path)})
+        indirect = CsvConnector({"file_path": str(link)})
+        direct.fetch_data({"app_id": "App A"})
+        misses = _read_csv_grouped.cache_info().misses
+        assert indirect.fetch_data({"app_id": "App A"})["Score"] == 1
+        assert _read_csv_grouped.cache_info().misses == misses
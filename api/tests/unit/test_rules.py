@@ -0,0 +1,238 @@
+"""
+Unit tests for the rules run over the aggregated provider data.
+
+Covers the governance path decision, evaluated one app at a time for small
+batches and column-wise for large ones.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+import rules.governance_path_rule as governance_path_rule
+import rules_engine
+from rules.base_rule import AppTable, Consolidation
+from rules.governance_path_rule import GovernancePathRule
+from rules.tech_debt_priority_rule import PRIORITY_CODES, TechDebtPriorityRule
+
+
+RECENT = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+STALE = (datetime.now() - timedelta(days=400)).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def governance_raw_data(count: int):
+    """Provider data for count apps (plus one healthy app) cycling through HALT, Fast Path and Slow Path cases."""
+    security, code_quality, operational, documentation, cost = {}, {}, {}, {}, {}
+    for i in range(count):
+        app_id = f"App {i}"
+        security[app_id] = {'VulnerabilityCount': i % 13, 'PatchCompliance': 94.0 + i % 7,
+                            'AccessReviewStatus': 'pending' if i % 17 == 0 else 'completed'}
+        code_quality[app_id] = {'LintScore': 55 + i % 46, 'TestCoverage': 35 + i % 66, 'ComplexityScore': i % 30}
+        if i % 11:
+            operational[app_id] = {'UptimePercentage': 95.0 + (i % 50) / 10, 'ChangeFailureRate': (i % 7) * 1.0}
+        documentation[app_id] = {'DocCoverage': 80.0 + i % 21, 'LastUpdated': [RECENT, STALE, 'not a date', None][i % 4]}
+        cost[app_id] = {'CostTrend': ['stable', 'decreasing', 'increasing'][i % 3], 'UnusedResources': i % 4,
+                        'MonthlyCostIncreasePercent': float(i % 20)}
+    security['Healthy'] = {'VulnerabilityCount': 0, 'PatchCompliance': 99.5, 'AccessReviewStatus': 'completed'}
+    code_quality['Healthy'] = {'LintScore': 90, 'TestCoverage': 80, 'ComplexityScore': 5}
+    operational['Healthy'] = {'UptimePercentage': 99.9, 'ChangeFailureRate': 0.5}
+    documentation['Healthy'] = {'DocCoverage': 95, 'LastUpdated': RECENT}
+    cost['Healthy'] = {'CostTrend': 'decreasing', 'UnusedResources': 0, 'MonthlyCostIncreasePercent': -3.0}
+    # Cells the column casts leave to the per-app path
+    security['App 1']['VulnerabilityCount'] = '2'
+    code_quality['App 2']['LintScore'] = float('nan')
+    cost['App 3']['MonthlyCostIncreasePercent'] = -0.0
+    return {'security_v1': security, 'code_quality_v1': code_quality, 'operational_excellence_v1': operational,
+            'documentation_v1': documentation, 'cost_optimization_v1': cost, 'broken_v1': None}
+
+
+class TestConsolidation:
+    """Test the per-app consolidation shared by the rules."""
+
+    def test_shared_through_one_consolidation(self):
+        """Rules given the same Consolidation share its data; otherwise each builds its own, read-only."""
+        raw_data = governance_raw_data(5)
+        raw_data['late_v1'] = {'Healthy': {'CostTrend': 'stable'}}
+        consolidation = Consolidation(raw_data)
+        consolidated = GovernancePathRule()._consolidate(raw_data, consolidation)
+        assert consolidated['Healthy']['CostTrend'] == 'stable'
+        assert TechDebtPriorityRule()._consolidate(raw_data, consolidation) is consolidated
+        assert TechDebtPriorityRule()._consolidate(dict(raw_data), consolidation) is not consolidated
+        assert TechDebtPriorityRule()._consolidate(raw_data) is not consolidated
+        with pytest.raises(TypeError):
+            consolidated['Healthy']['CostTrend'] = 'increasing'
+
+
+class TestAppTable:
+    """Test the column-wise view of the provider data."""
+
+    def test_columns_follow_consolidation(self):
+        """Each column holds, per app, the value the consolidated data has (None when absent)."""
+        raw_data = governance_raw_data(20)
+        raw_data['late_v1'] = {'App 3': {'CostTrend': 'stable'}, 'Healthy': {'CostTrend': None, 'Extra': 1}}
+        app_ids = sorted(GovernancePathRule()._get_all_app_ids(raw_data))
+        table = AppTable.from_raw_data(raw_data, app_ids, ['CostTrend', 'UptimePercentage', 'Unknown'])
+        consolidated = GovernancePathRule()._consolidate(raw_data)
+        for column, cells in table.columns.items():
+            assert cells.tolist() == [consolidated[app_id].get(column) for app_id in app_ids]
+
+
+class TestTechDebtPriorityRule:
+    """Test the tech debt priority decision."""
+
+    def test_typed_and_converted_values_agree(self, caplog):
+        """Already-typed values give the same decisions as the same values converted by _get_value."""
+        typed = {
+            'app_quality': {'MaintainabilityIndex': 70, 'ComplexityScore': 10},
+            'app_cost': {'MonthlyCost': 46889, 'ChangeFailureRate': 1.2, 'UptimePercentage': 99.5},
+            'app_docs': {'MaintainabilityIndex': 72, 'ComplexityScore': 7, 'LastUpdated': STALE, 'DocCoverage': 91.0},
+            'app_ops': {'DeploymentFrequency': 'Monthly', 'ChangeFailureRate': 0.6, 'LastUpdated': RECENT},
+            'app_low': {'MaintainabilityIndex': 90, 'TestCoverage': 95.0, 'DeploymentFrequency': None},
+        }
+        converted = {app_id: {key: f"{value:,}" if isinstance(value, int) else value for key, value in data.items()}
+                     for app_id, data in typed.items()}
+        expected = TechDebtPriorityRule().apply({'raw_data': {'metrics_v1': converted}})
+        assert TechDebtPriorityRule().apply({'raw_data': {'metrics_v1': typed}}) == expected
+        assert expected['app_cost'] == "High Priority (Financial Impact (MonthlyCost=$46,889.00, ChangeFailureRate=1.2%))"
+        assert expected['app_low'] == "Low Priority"
+        caplog.clear()
+        typed['app_low']['LastUpdated'] = 'not a date'
+        assert TechDebtPriorityRule().apply({'metrics_v1': typed})['app_low'] == "Low Priority"
+        assert any("(value: not a date," in message for message in caplog.messages)
+
+    def test_apply_compact_matches_apply(self):
+        """Codes and reasons rebuild apply's decisions; Low Priority apps have no reason."""
+        raw_data = {'metrics_v1': {
+            'app_high': {'MaintainabilityIndex': 70, 'ComplexityScore': 10},
+            'app_medium': {'MaintainabilityIndex': 70, 'ComplexityScore': 5},
+            'app_low': {'MaintainabilityIndex': 90},
+        }}
+        rule = TechDebtPriorityRule()
+        expected = rule.apply(raw_data)
+        compact = rule.apply_compact(raw_data)
+        assert compact['codes'].dtype == 'int8'
+        tiers = {code: tier for tier, code in PRIORITY_CODES.items()}
+        rebuilt = {app_id: tiers[code] + (f" ({compact['reasons'][app_id]})" if app_id in compact['reasons'] else "")
+                   for app_id, code in zip(compact['app_ids'], compact['codes'].tolist())}
+        assert list(rebuilt.items()) == list(expected.items())
+        assert set(compact['reasons']) == {'app_high', 'app_medium'}
+
+    def test_parsed_dates_agree_with_strings(self):
+        """LastUpdated values already parsed (datetime or pandas Timestamp) decide like their date strings."""
+        stale = datetime.now() - timedelta(days=400)
+        as_text = {'metrics_v1': {'app_docs': {'LastUpdated': stale.strftime('%Y-%m-%d'), 'DocCoverage': 95.0},
+                                  'app_docs_text': {'LastUpdated': stale.strftime('%Y-%m-%d'), 'DocCoverage': '95'}}}
+        expected = TechDebtPriorityRule().apply(as_text)
+        assert expected['app_docs'].startswith("Medium Priority (Documentation (Outdated: ")
+        for parsed in (stale, pd.Timestamp(stale, tz='UTC')):
+            raw_data = {'metrics_v1': {app_id: dict(data, LastUpdated=parsed) for app_id, data in as_text['metrics_v1'].items()}}
+            assert TechDebtPriorityRule().apply(raw_data) == expected
+
+
+class TestGovernancePathRule:
+    """Test the governance path decision."""
+
+    def test_decisions(self):
+        """HALT reasons win over Fast Path; missing criteria make the Slow Path."""
+        raw_data = {
+            'security_v1': {
+                'app_a': {'VulnerabilityCount': 2, 'PatchCompliance': 99.0, 'AccessReviewStatus': 'completed'},
+                'app_b': {'VulnerabilityCount': 12, 'PatchCompliance': 94.0, 'AccessReviewStatus': 'pending'},
+            },
+            'code_quality_v1': {
+                'app_a': {'LintScore': 80, 'TestCoverage': 70.0, 'ComplexityScore': 10},
+                'app_b': {'LintScore': 55, 'TestCoverage': 35.0, 'ComplexityScore': 30},
+            },
+            'operational_excellence_v1': {
+                'app_a': {'UptimePercentage': 99.5, 'ChangeFailureRate': 1.0},
+            },
+            'documentation_v1': {
+                'app_a': {'DocCoverage': 95.0, 'LastUpdated': RECENT},
+            },
+            'cost_optimization_v1': {
+                'app_a': {'CostTrend': 'stable', 'UnusedResources': 1, 'MonthlyCostIncreasePercent': 2.0},
+            },
+        }
+        results = GovernancePathRule().apply({'raw_data': raw_data})
+        assert results == {
+            'app_a': "Fast Path",
+            'app_b': "HALT (VulnerabilityCount (12) >= 10)",
+        }
+        del raw_data['operational_excellence_v1']
+        assert GovernancePathRule().apply(raw_data)['app_a'] == (
+            "Slow Path (Reason: UptimePercentage (0.0%) < 98%; ChangeFailureRate (100.0%) > 2%)")
+
+    @pytest.mark.parametrize("count", [50, 600])
+    def test_vectorized_matches_per_app(self, count, monkeypatch, caplog):
+        """Column-wise evaluation gives the same decisions and debug log, in the same order, as the per-app path."""
+        caplog.set_level(logging.DEBUG, logger=governance_path_rule.__name__)
+        raw_data = governance_raw_data(count)
+        rule = GovernancePathRule()
+        monkeypatch.setattr(governance_path_rule, 'VECTORIZE_MIN_APPS', 10 ** 9)
+        per_app = rule.apply({'raw_data': raw_data})
+        per_app_log = [record.getMessage() for record in caplog.records if record.levelno == logging.DEBUG]
+        caplog.clear()
+        monkeypatch.setattr(governance_path_rule, 'VECTORIZE_MIN_APPS', 1)
+        vectorized = rule.apply({'raw_data': raw_data})
+        assert list(vectorized.items()) == list(per_app.items())
+        assert [record.getMessage() for record in caplog.records if record.levelno == logging.DEBUG] == per_app_log
+        assert {decision.split(' ')[0] for decision in vectorized.values()} == {'HALT', 'Fast', 'Slow'}
+
+    def test_vectorized_oversized_numbers(self, monkeypatch):
+        """Numbers too large for the column casts are left to the per-app path."""
+        raw_data = {'cost_optimization_v1': {'app_a': {'MonthlyCostIncreasePercent': 10 ** 400, 'UnusedResources': 2 ** 70}}}
+        rule = GovernancePathRule()
+        expected = rule.apply(raw_data)
+        monkeypatch.setattr(governance_path_rule, 'VECTORIZE_MIN_APPS', 1)
+        assert rule.apply(raw_data) == expected
+
+    def test_apply_iter_streams_apply(self, monkeypatch):
+        """apply_iter yields apply's decisions in order, also when large batches are split into chunks."""
+        raw_data = governance_raw_data(600)
+        rule = GovernancePathRule()
+        expected = rule.apply({'raw_data': raw_data})
+        assert list(rule.apply_iter({'raw_data': raw_data})) == list(expected.items())
+        monkeypatch.setattr(governance_path_rule, 'VECTORIZE_MIN_APPS', 1)
+        monkeypatch.setattr(governance_path_rule, 'STREAM_CHUNK_APPS', 64)
+        assert list(rule.apply_iter({'raw_data': raw_data})) == list(expected.items())
+
+    def test_parallel_matches_in_process(self, monkeypatch, caplog):
+        """Worker processes give the same decisions in the same order, and their warnings reach the parent's log."""
+        raw_data = governance_raw_data(300)
+        rule = GovernancePathRule()
+        expected = rule.apply({'raw_data': raw_data})
+        monkeypatch.setattr(governance_path_rule, 'PARALLEL_WORKERS', 2)
+        monkeypatch.setattr(governance_path_rule, 'PARALLEL_MIN_APPS', 1)
+        caplog.clear()
+        results = rule.apply({'raw_data': raw_data})
+        assert list(results.items()) == list(expected.items())
+        assert any("Could not parse LastUpdated date 'not a date'" in message for message in caplog.messages)
+
+
+class TestRunRules:
+    """Test applying the loaded rules together."""
+
+    def test_threads_match_serial_run(self, monkeypatch):
+        """Rules applied on worker threads give the same results, keyed in the same order, as one after another."""
+        class FailingRule(GovernancePathRule):
+            rule_id = "failing"
+
+            def apply(self, data):
+                raise RuntimeError("boom")
+
+        rules = [GovernancePathRule(), FailingRule(), TechDebtPriorityRule()]
+        aggregated_data = {'raw_data': governance_raw_data(100)}
+        expected = rules_engine.run_rules(aggregated_data, rules)
+        assert expected['failing'] == {"error": "Rule execution failed: boom"}
+        monkeypatch.setattr(rules_engine, 'RULE_WORKERS', 3)
+        assert list(rules_engine.run_rules(aggregated_data, rules).items()) == list(expected.items())
+
+    def test_bad_input_is_reported_per_rule(self):
+        """Input that is not a dict becomes each rule's error instead of failing the run."""
+        rules = [GovernancePathRule(), TechDebtPriorityRule()]
+        for aggregated_data in ({'raw_data': None}, ['not', 'a', 'dict']):
+            results = rules_engine.run_rules(aggregated_data, rules)
+            assert set(results) == {'governance_path_decision', 'tech_debt_priority'}
+            assert all('error' in result for result in results.values())